@@ -0,0 +1,75 @@
+import json
+
+import pytest
+import requests
+
+from src.hypixelez.fakeserver import (
+    first_member,
+    make_profile_response,
+    make_profiles_response,
+)
+from src.hypixelez.hypixel_api import HypixelClient, SkyblockProfileData
+from src.hypixelez.ratelimit import RateLimiter
+
+
+class StubSession:
+    """Session returning canned responses, so only client overhead is measured"""
+
+    def __init__(self, bodies: dict):
+        self._responses = {url: _response(body) for url, body in bodies.items()}
+
+    def get(self, url, **kwargs):
+        return self._responses[url]
+
+    post = get
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+@pytest.fixture(scope="session")
+def profile_response():
+    """One profile with five members, about 0.8 MB of JSON"""
+    return make_profile_response()
+
+
+@pytest.fixture(scope="session")
+def profile_body(profile_response):
+    return json.dumps(profile_response).encode()
+
+
+@pytest.fixture(scope="session")
+def profiles_body():
+    """Three profiles with five members each, about 2.4 MB of JSON"""
+    return json.dumps(make_profiles_response()).encode()
+
+
+@pytest.fixture(scope="session")
+def member_uuid(profile_response):
+    return first_member(profile_response)
+
+
+@pytest.fixture
+def profile(profile_response, member_uuid):
+    return SkyblockProfileData(profile_response, member_uuid)
+
+
+@pytest.fixture
+def make_client():
+    """Build a client whose session is a :class:`StubSession`"""
+
+    def make(bodies: dict, **kwargs) -> HypixelClient:
+        client = HypixelClient(
+            api_key="bench_key",
+            debug=None,
+            rate_limiter=RateLimiter(limit=10**12),
+            **kwargs,
+        )
+        client.session = StubSession(bodies)
+        return client
+
+    return make
@@ -0,0 +1,56 @@
+"""
+Benchmarks of client call overhead against a stub transport
+"""
+
+import pytest
+
+from src.hypixelez.cache import ResponseCache
+from src.hypixelez.hypixel_api import _MOJANG_PROFILE_URL_, _PROFILE_URL_
+from src.hypixelez.metrics import MetricsCollector
+from tests.mocks import MOCK_PROFILE_DATA, MOCK_UUID_RESPONSE, json_body
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+PROFILE_ID = "f5791b0c-caf1-4701-aea3-d727ea53a901"
+
+
+@pytest.mark.parametrize("hooks", [None, MetricsCollector], ids=["plain", "hooks"])
+def test_fetch_profile_info(benchmark, make_client, hooks):
+    """Full request path with a small body: rate limiter, retries, decode"""
+    client = make_client(
+        {_PROFILE_URL_: json_body(MOCK_PROFILE_DATA)},
+        hooks=hooks() if hooks else None,
+    )
+    benchmark(client.fetch_profile_info, UUID, PROFILE_ID)
+
+
+def test_fetch_large_profile(benchmark, make_client, profile_body, member_uuid):
+    client = make_client({_PROFILE_URL_: profile_body}, json_decoder="auto")
+    benchmark(client.fetch_profile_info, member_uuid, PROFILE_ID)
+
+
+def test_response_cache_hit(benchmark, make_client):
+    client = make_client(
+        {_PROFILE_URL_: json_body(MOCK_PROFILE_DATA)},
+        response_cache=ResponseCache(ttls={"profile": 3600}),
+    )
+    client.fetch_profile_info(UUID, PROFILE_ID)
+    benchmark(client.fetch_profile_info, UUID, PROFILE_ID)
+
+
+def test_uuid_lookup(benchmark, make_client):
+    """Uncached UUID lookup through the Mojang endpoint"""
+    url = _MOJANG_PROFILE_URL_.format(name="Neono4ka")
+    client = make_client({url: json_body(MOCK_UUID_RESPONSE)})
+
+    def run():
+        client._uuid_cache.clear()
+        return client.get_uuid_by_name("Neono4ka")
+
+    benchmark(run)
+
+
+def test_uuid_cache_hit(benchmark, make_client):
+    url = _MOJANG_PROFILE_URL_.format(name="Neono4ka")
+    client = make_client({url: json_body(MOCK_UUID_RESPONSE)})
+    client.get_uuid_by_name("Neono4ka")
+    benchmark(client.get_uuid_by_name, "Neono4ka")
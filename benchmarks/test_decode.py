@@ -0,0 +1,33 @@
+"""
+Benchmarks of response body decoding
+"""
+
+import io
+
+import pytest
+
+from src.hypixelez.decoders import get_decoder
+from src.hypixelez.streaming import parse_member
+
+BACKENDS = ["json", "orjson", "msgspec"]
+
+
+def _decoder(backend: str):
+    pytest.importorskip(backend)
+    return get_decoder(backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_decode_profile(benchmark, profile_body, backend):
+    benchmark(_decoder(backend), profile_body)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_decode_profiles(benchmark, profiles_body, backend):
+    benchmark(_decoder(backend), profiles_body)
+
+
+def test_stream_member(benchmark, profile_body, member_uuid):
+    pytest.importorskip("ijson")
+    fields = {"player_data", "slayer"}
+    benchmark(lambda: parse_member(io.BytesIO(profile_body), member_uuid, fields))
@@ -0,0 +1,31 @@
+"""
+Benchmarks of startup cost: importing the package and creating a client
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+SCRIPTS = {
+    # interpreter startup alone, to tell package regressions from Python ones
+    "python": "pass",
+    "import": "import hypixelez",
+    "client": "import hypixelez; hypixelez.HypixelClient('key', debug=None)",
+    "async_client": "import hypixelez; hypixelez.AsyncHypixelClient('key', debug=None)",
+}
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_startup(benchmark, tmp_path, script):
+    """Each round runs a fresh interpreter, so nothing is cached in ``sys.modules``"""
+    command = [sys.executable, "-c", SCRIPTS[script]]
+    env = {**os.environ, "PYTHONPATH": SRC}
+
+    def run():
+        subprocess.run(command, cwd=tmp_path, env=env, check=True)
+
+    benchmark.pedantic(run, rounds=20, warmup_rounds=2)
@@ -0,0 +1,52 @@
+"""
+Benchmarks of the level tables
+"""
+
+import random
+
+import pytest
+
+from src.hypixelez.hypixel_api import (
+    _CATA_CUMULATIVE_XP_,
+    _SKILL_CUMULATIVE_LEVELS_,
+    _calculate_current_xp,
+    _calculate_level,
+    calculate_levels,
+)
+
+TABLES = {"skill": _SKILL_CUMULATIVE_LEVELS_, "catacombs": _CATA_CUMULATIVE_XP_}
+
+
+def _xps(table: list, count: int = 1000) -> list:
+    rng = random.Random(0)
+    return [rng.randrange(0, int(table[-1] * 1.1)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_calculate_level(benchmark, table):
+    cumulative = TABLES[table]
+    xps = _xps(cumulative)
+
+    def run():
+        for xp in xps:
+            _calculate_level(xp, cumulative)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_calculate_current_xp(benchmark, table):
+    cumulative = TABLES[table]
+    xps = _xps(cumulative)
+
+    def run():
+        for xp in xps:
+            _calculate_current_xp(xp, cumulative)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_calculate_levels_batch(benchmark, table):
+    xps = _xps(TABLES[table], 100_000)
+    benchmark(calculate_levels, xps, table)
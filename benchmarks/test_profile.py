@@ -0,0 +1,45 @@
+"""
+Benchmarks of the SkyblockProfileData getters
+"""
+
+import pytest
+
+from src.hypixelez.hypixel_api import SkyblockProfileData
+
+GETTERS = {
+    "get_collection": lambda p: p.get_collection("LOG"),
+    "get_skill_level": lambda p: p.get_skill_level("SKILL_MINING"),
+    "get_skill_current_level_xp": lambda p: p.get_skill_current_level_xp(
+        "SKILL_MINING"
+    ),
+    "get_cata_xp": lambda p: p.get_cata_xp(),
+    "get_cata_level": lambda p: p.get_cata_level(),
+    "get_cata_class_xp": lambda p: p.get_cata_class_xp("mage"),
+    "get_cata_class_level": lambda p: p.get_cata_class_level("mage"),
+    "get_slayer_xp": lambda p: p.get_slayer_xp("zombie"),
+    "get_slayer_level": lambda p: p.get_slayer_level("zombie"),
+    "get_slayer_stats": lambda p: p.get_slayer_stats("zombie"),
+    "get_slayer_stats_by_tier": lambda p: p.get_slayer_stats_by_tier("zombie", 2),
+    "get_global_level": lambda p: p.get_global_level(),
+    "get_global_xp": lambda p: p.get_global_xp(),
+    "get_all_skills": lambda p: p.get_all_skills(),
+    "get_all_collections": lambda p: p.get_all_collections(),
+    "get_all_slayers": lambda p: p.get_all_slayers(),
+    "get_all_dungeon_classes": lambda p: p.get_all_dungeon_classes(),
+    "summary": lambda p: p.summary(),
+}
+
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_getter(benchmark, profile, getter):
+    """Getter on a profile whose sections are already resolved"""
+    call = GETTERS[getter]
+    call(profile)
+    benchmark(call, profile)
+
+
+@pytest.mark.parametrize("getter", ["get_skill_level", "summary"])
+def test_getter_cold(benchmark, profile_response, member_uuid, getter):
+    """First getter call on a freshly wrapped response"""
+    call = GETTERS[getter]
+    benchmark(lambda: call(SkyblockProfileData(profile_response, member_uuid)))
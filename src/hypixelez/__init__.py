@@ -1,4 +1,49 @@
-from .hypixel_api import HypixelClient, SkyblockProfileData
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_api import AsyncHypixelClient
+    from .hypixel_api import HypixelClient, SkyblockProfileData, calculate_levels
+
+__all__ = [
+    "HypixelClient",
+    "AsyncHypixelClient",
+    "SkyblockProfileData",
+    "calculate_levels",
+]
+
+# Public names are imported on first access, so ``import hypixelez`` stays cheap
+# and ``aiohttp`` is only loaded by programs that use the async client.
+_LAZY_ = {
+    "HypixelClient": ".hypixel_api",
+    "SkyblockProfileData": ".hypixel_api",
+    "calculate_levels": ".hypixel_api",
+    "AsyncHypixelClient": ".async_api",
+}
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    module = _LAZY_.get(name)
+    if module is None:
+        # ``from hypixelez import <submodule>`` falls back to this hook when the
+        # submodule is not loaded yet; import it relative to the real package
+        # name, since ``__name__`` is overridden below
+        if not name.startswith("__"):
+            try:
+                return import_module(f".{name}", __package__)
+            except ModuleNotFoundError as e:
+                if e.name != f"{__package__}.{name}":
+                    raise
+        raise AttributeError(f"module 'hypixelez' has no attribute {name!r}")
+
+    value = getattr(import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
-__all__ = ["HypixelClient", "SkyblockProfileData"]
 __name__ = "hypixelez"
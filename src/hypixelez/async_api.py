@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+from .cache import _MISSING, FRESH, STALE, MemoryUUIDCache, ResponseCache, UUIDCache
+from .decoders import JSONDecoder, get_decoder
+from .hypixel_api import (
+    _DEBUG_,
+    _LOGGER_NAME_,
+    _MOJANG_BULK_URL_,
+    _MOJANG_PROFILE_URL_,
+    _PROFILE_URL_,
+    _PROFILES_URL_,
+    SkyblockProfileData,
+    _check_api_response,
+    _chunk_uncached_names,
+    _parse_profile_names,
+    _parse_profiles,
+    _parse_selected_profile,
+    _report_bulk_lookups,
+    _store_bulk_result,
+)
+from .logger import setup_logging, get_logger
+from .metrics import HIT, MISS, Hooks
+from .ratelimit import RateLimiter, retry_after
+from .singleflight import AsyncSingleFlight
+from .transport import CircuitBreaker, CircuitOpenError, TransportConfig
+
+
+class AsyncHypixelClient:
+    """Asyncio client for the Hypixel SkyBlock API.
+
+    Mirrors :class:`~hypixelez.hypixel_api.HypixelClient`, but every network
+    method is a coroutine and all requests share one ``aiohttp`` connection pool.
+    Requires the optional ``aiohttp`` dependency (``pip install hypixelez[async]``).
+
+    The client should be closed when no longer needed, either explicitly with
+    :meth:`close` or by using it as an async context manager::
+
+        async with AsyncHypixelClient(api_key) as client:
+            uuid = await client.get_uuid_by_name("Neono4ka")
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        debug=_DEBUG_,
+        base_url=_PROFILE_URL_,
+        session=None,
+        max_connections: int = 100,
+        rate_limiter: RateLimiter | None = None,
+        uuid_cache: UUIDCache | None = None,
+        response_cache: ResponseCache | None = None,
+        transport: TransportConfig | None = None,
+        json_decoder: str | JSONDecoder = "json",
+        hooks: Hooks | None = None,
+        profiles_url: str = _PROFILES_URL_,
+        mojang_url: str = _MOJANG_PROFILE_URL_,
+        mojang_bulk_url: str = _MOJANG_BULK_URL_,
+    ):
+        """Create an asyncio Hypixel API client.
+
+        Args:
+            api_key: Hypixel API key (get one at https://developer.hypixel.net/).
+            debug: If True, enables debug logging; otherwise uses info-level logging.
+                If None, logging is not configured at all (see
+                :func:`hypixelez.logger.setup_queue_logging`).
+            base_url: Hypixel endpoint used by :meth:`fetch_profile_info`.
+            session: Optional ``aiohttp.ClientSession`` to use. If omitted, one is
+                created lazily on the first request and owned by the client.
+            max_connections: Total size of the connection pool of the owned
+                session; ``transport.pool_maxsize`` caps connections per host.
+            rate_limiter: Limiter pacing Hypixel requests. It may be shared with
+                other sync or async clients using the same API key.
+            uuid_cache: Cache used by :meth:`get_uuid_by_name`. Defaults to a
+                :class:`~hypixelez.cache.MemoryUUIDCache`.
+            response_cache: Optional :class:`~hypixelez.cache.ResponseCache` for
+                Hypixel profile responses. Disabled by default.
+            transport: Connection pool, timeout, retry and circuit breaker
+                settings applied to every endpoint (Hypixel and Mojang).
+            json_decoder: Backend decoding response bodies. See
+                :func:`hypixelez.decoders.get_decoder`.
+            hooks: Optional :class:`~hypixelez.metrics.Hooks` notified of
+                requests, retries, decoding and cache lookups.
+            profiles_url: Hypixel endpoint listing the profiles of a player.
+            mojang_url: Mojang username lookup URL, with a ``{name}`` field.
+            mojang_bulk_url: Mojang bulk username lookup URL.
+
+        Raises:
+            ImportError: If ``aiohttp`` or the requested JSON decoder is not
+                installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncHypixelClient requires aiohttp: pip install hypixelez[async]"
+            )
+
+        self._debug = debug
+        self._logging_configured = False
+        self.logger = get_logger(_LOGGER_NAME_)
+        self._uuid_cache = uuid_cache if uuid_cache is not None else MemoryUUIDCache()
+
+        self.api_key = api_key
+        self.base_url = base_url
+        self.profiles_url = profiles_url
+        self.mojang_url = mojang_url
+        self.mojang_bulk_url = mojang_bulk_url
+        self._session = session
+        self._owns_session = session is None
+        self._max_connections = max_connections
+        self.transport = transport or TransportConfig()
+        self._breakers: dict[str, CircuitBreaker | None] = {}
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.response_cache = response_cache
+        self._decode = get_decoder(json_decoder)
+        self.hooks = hooks
+        self._refresh_tasks: set[asyncio.Future] = set()
+        self._flights = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def session(self):
+        """The underlying ``aiohttp.ClientSession`` (created on first access).
+
+        Logging is also configured on first access rather than in the constructor.
+        """
+        if not self._logging_configured:
+            setup_logging(self._debug)
+            self._logging_configured = True
+        if self._session is None:
+            transport = self.transport
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=transport.pool_maxsize,
+                    force_close=not transport.keep_alive,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=transport.connect_timeout,
+                    sock_read=transport.read_timeout,
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the owned HTTP session. Sessions passed by the caller stay open."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self, endpoint: str, method: str, url: str, rate_limited=False, **kwargs
+    ) -> tuple:
+        """Send a request through the session, applying the transport policy.
+
+        Asyncio counterpart of :meth:`HypixelClient._request
+        <hypixelez.hypixel_api.HypixelClient._request>`.
+
+        Returns:
+            A tuple ``(response, body)``; the body is read before the connection
+            is released.
+        """
+        transport = self.transport
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = transport.make_breaker()
+        breaker = self._breakers[endpoint]
+        hooks = self.hooks
+
+        for attempt in range(transport.max_retries + 1):
+            last_attempt = attempt == transport.max_retries
+            if breaker is not None:
+                breaker.before_request(endpoint)
+            try:
+                if rate_limited:
+                    await self._acquire(endpoint)
+                if hooks is not None:
+                    started = time.perf_counter()
+                async with getattr(self.session, method)(url, **kwargs) as response:
+                    body = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if hooks is not None:
+                    hooks.on_request(endpoint, None, time.perf_counter() - started, 0)
+                if breaker is not None:
+                    breaker.record_failure()
+                if last_attempt:
+                    raise
+                delay = transport.backoff(attempt)
+                self.logger.warning(
+                    "%s request failed (%r), retry in %.2fs", endpoint, e, delay
+                )
+                if hooks is not None:
+                    hooks.on_retry(endpoint, type(e).__name__, delay)
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                # e.g. ClientPayloadError: the endpoint failed, but not in a
+                # way worth retrying
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled: no outcome, but the trial request must be freed
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            status = response.status
+            if hooks is not None:
+                hooks.on_request(
+                    endpoint, status, time.perf_counter() - started, len(body)
+                )
+            if rate_limited:
+                self.rate_limiter.update(response.headers)
+            if breaker is not None:
+                if transport.is_server_error(status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if last_attempt or not transport.is_retryable(status):
+                return response, body
+
+            if status == 429:
+                delay = transport.backoff(attempt, retry_after(response.headers))
+                self.logger.warning(
+                    "%s rate limit hit, retry in %.2fs", endpoint, delay
+                )
+                if hooks is not None:
+                    hooks.on_throttle(endpoint, delay)
+                    hooks.on_retry(endpoint, str(status), delay)
+                if rate_limited:
+                    self.rate_limiter.throttle(delay)
+                    continue
+            else:
+                delay = transport.backoff(attempt)
+                self.logger.warning(
+                    "%s returned %s, retry in %.2fs", endpoint, status, delay
+                )
+                if hooks is not None:
+                    hooks.on_retry(endpoint, str(status), delay)
+            await asyncio.sleep(delay)
+
+        raise AssertionError("TransportConfig rejects a negative max_retries")
+
+    async def _acquire(self, endpoint: str) -> None:
+        """Wait for the rate limiter, reporting the wait to the hooks."""
+        if self.hooks is None:
+            await self.rate_limiter.acquire_async()
+            return
+        started = time.perf_counter()
+        await self.rate_limiter.acquire_async()
+        self.hooks.on_rate_limit_wait(endpoint, time.perf_counter() - started)
+
+    def _decode_body(self, endpoint: str, body: bytes):
+        """Decode a response body, reporting the decode time to the hooks."""
+        if self.hooks is None:
+            return self._decode(body)
+        started = time.perf_counter()
+        data = self._decode(body)
+        self.hooks.on_decode(endpoint, time.perf_counter() - started, len(body))
+        return data
+
+    async def _get_json(self, endpoint: str, url: str) -> dict:
+        response, body = await self._request(endpoint, "get", url)
+        if response.status in (204, 404):
+            return {}
+        response.raise_for_status()
+        return self._decode_body(endpoint, body)
+
+    async def _hypixel_get_json(self, endpoint: str, url: str, params: dict) -> tuple:
+        """GET a Hypixel endpoint and decode its JSON body, using the response cache.
+
+        Concurrent calls for the same endpoint, UUID and profile share a single
+        request. Stale cache entries are served while a background task
+        refreshes them.
+
+        Returns:
+            A tuple ``(data, fetched_at)``: the decoded body and the Unix time it
+            was received, or stored for a response cache hit.
+        """
+        key = (endpoint, params["uuid"], params.get("profile"))
+        return await self._flights.do(
+            key, self._load_hypixel_json, endpoint, url, params
+        )
+
+    async def _load_hypixel_json(self, endpoint: str, url: str, params: dict) -> tuple:
+        cache = self.response_cache
+        if cache is None:
+            body = await self._hypixel_get_body(endpoint, url, params)
+            fetched_at = time.time()
+            return self._decode_body(endpoint, body), fetched_at
+
+        key = cache.make_key(endpoint, params["uuid"], params.get("profile"))
+        body, state, stored_at = cache.lookup(endpoint, key)
+        if self.hooks is not None:
+            self.hooks.on_cache("response", HIT if state == FRESH else state)
+        if state == STALE and cache.begin_refresh(key):
+            task = asyncio.ensure_future(
+                self._refresh_cached(cache, endpoint, url, params, key)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        if body is not None:
+            self.logger.debug("Response cache %s HIT for: %s", state, key)
+            return self._decode_body(endpoint, body), stored_at
+
+        return await self._fetch_and_cache(cache, endpoint, url, params, key)
+
+    async def _fetch_and_cache(
+        self, cache: ResponseCache, endpoint: str, url: str, params: dict, key: str
+    ) -> tuple:
+        body = await self._hypixel_get_body(endpoint, url, params)
+        fetched_at = time.time()
+        data = self._decode_body(endpoint, body)
+        if data.get("success"):
+            cache.put(endpoint, key, body)
+        return data, fetched_at
+
+    async def _refresh_cached(
+        self, cache: ResponseCache, endpoint: str, url: str, params: dict, key: str
+    ) -> None:
+        try:
+            await self._fetch_and_cache(cache, endpoint, url, params, key)
+        except Exception as e:
+            self.logger.warning("Failed to refresh cached response %s: %s", key, e)
+        finally:
+            cache.end_refresh(key)
+
+    async def _hypixel_get_body(self, endpoint: str, url: str, params: dict) -> bytes:
+        """Rate-limited GET of a Hypixel endpoint, returning the raw body."""
+        response, body = await self._request(
+            endpoint,
+            "get",
+            url,
+            rate_limited=True,
+            headers={"API-Key": self.api_key},
+            params=params,
+        )
+        response.raise_for_status()
+        return body
+
+    async def get_uuid_by_name(self, name: str) -> str | None:
+        """Resolve a Minecraft username to a UUID using Mojang API.
+
+        Results, including "player not found" answers, are stored in the
+        client's UUID cache. Concurrent lookups of the same name share a
+        single request.
+
+        Args:
+            name: Minecraft username.
+
+        Returns:
+            The UUID string if found; otherwise None.
+            Returns None also in case of network errors.
+        """
+        cached = self._uuid_cache.get(name, _MISSING)
+        if self.hooks is not None:
+            self.hooks.on_cache("uuid", MISS if cached is _MISSING else HIT)
+        if cached is not _MISSING:
+            self.logger.debug("UUID cache HIT for: %s", name)
+            return cached
+
+        return await self._flights.do(("uuid", name.lower()), self._fetch_uuid, name)
+
+    async def _fetch_uuid(self, name: str) -> str | None:
+        try:
+            data = await self._get_json("mojang", self.mojang_url.format(name=name))
+
+            if "id" not in data:
+                self.logger.warning("UUID not found for player: %s", name)
+                self._uuid_cache.set(name, None)
+                return None
+            self._uuid_cache.set(name, data["id"])
+            self.logger.debug("Cached UUID for: %s", name)
+            return data["id"]
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError) as e:
+            self.logger.error("Failed to fetch UUID for %s: %s", name, e)
+            return None
+
+    async def get_uuids_by_names(self, names) -> dict:
+        """Resolve many Minecraft usernames to UUIDs using Mojang bulk lookup.
+
+        Names already in the UUID cache are not requested again; the rest are
+        sent concurrently in chunks of up to 10 names per request.
+
+        Args:
+            names: Minecraft usernames. Case-insensitive duplicates are ignored.
+
+        Returns:
+            A mapping ``{name: uuid}`` for every requested name. The UUID is None
+            for names that do not exist or whose chunk failed with a network error.
+        """
+        result, chunks = _chunk_uncached_names(names, self._uuid_cache)
+        if self.hooks is not None:
+            _report_bulk_lookups(self.hooks, result, chunks)
+        responses = await asyncio.gather(
+            *(self._post_bulk_names(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        for chunk, data in zip(chunks, responses):
+            if isinstance(
+                data, (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError)
+            ):
+                self.logger.error("Failed to fetch UUIDs for %s: %s", chunk, data)
+            elif isinstance(data, BaseException):
+                raise data
+            else:
+                _store_bulk_result(chunk, data, self._uuid_cache, result)
+
+        return result
+
+    async def _post_bulk_names(self, chunk: list) -> list:
+        response, body = await self._request(
+            "mojang_bulk", "post", self.mojang_bulk_url, json=chunk
+        )
+        response.raise_for_status()
+        return self._decode_body("mojang_bulk", body)
+
+    async def get_profile_names_ids_by_id(self, uuid: str) -> dict:
+        """Get available SkyBlock profiles for a player UUID.
+
+        Args:
+            uuid: Minecraft UUID.
+
+        Returns:
+            A mapping ``{profile_name: profile_id}``.
+
+        Raises:
+            aiohttp.ClientError: If the underlying HTTP request fails.
+        """
+        data, _ = await self._hypixel_get_json(
+            "profiles", self.profiles_url, {"uuid": uuid}
+        )
+
+        return _parse_profile_names(data)
+
+    async def fetch_profile_info(self, uuid: str, profile: str) -> SkyblockProfileData:
+        """Fetch full SkyBlock profile data and wrap it in :class:`SkyblockProfileData`.
+
+        Args:
+            uuid: Minecraft UUID.
+            profile: SkyBlock profile id.
+
+        Returns:
+            A :class:`SkyblockProfileData` instance with the raw API response and UUID.
+
+        Raises:
+            aiohttp.ClientError: For network issues or non-2xx HTTP status.
+            Exception: If Hypixel returns ``success=false`` (API-level error).
+        """
+        data, fetched_at = await self._hypixel_get_json(
+            "profile", self.base_url, {"uuid": uuid, "profile": profile}
+        )
+        _check_api_response(data)
+
+        return SkyblockProfileData(data, uuid, fetched_at)
+
+    async def fetch_all_profiles(self, uuid: str) -> dict:
+        """Fetch every SkyBlock profile of a player with a single request.
+
+        Args:
+            uuid: Minecraft UUID (without dashes).
+
+        Returns:
+            A mapping ``{profile_name: SkyblockProfileData}``.
+
+        Raises:
+            aiohttp.ClientError: For network issues or non-2xx HTTP status.
+            Exception: If Hypixel returns ``success=false`` (API-level error).
+        """
+        data, fetched_at = await self._hypixel_get_json(
+            "profiles", self.profiles_url, {"uuid": uuid}
+        )
+        return _parse_profiles(data, uuid, fetched_at)
+
+    async def fetch_selected_profile(self, uuid: str) -> SkyblockProfileData | None:
+        """Fetch the profile the player currently has selected, with a single request.
+
+        Args:
+            uuid: Minecraft UUID (without dashes).
+
+        Returns:
+            A :class:`SkyblockProfileData` instance, or None if the player has no
+            selected SkyBlock profile.
+
+        Raises:
+            aiohttp.ClientError: For network issues or non-2xx HTTP status.
+            Exception: If Hypixel returns ``success=false`` (API-level error).
+        """
+        data, fetched_at = await self._hypixel_get_json(
+            "profiles", self.profiles_url, {"uuid": uuid}
+        )
+        return _parse_selected_profile(data, uuid, fetched_at)
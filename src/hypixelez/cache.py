@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+_MISSING = object()
+
+_DEFAULT_TTL_ = 24 * 60 * 60
+_DEFAULT_NEGATIVE_TTL_ = 60 * 60
+_DEFAULT_MAXSIZE_ = 10_000
+
+
+class UUIDCache(ABC):
+    """Interface of the username -> UUID caches used by the clients.
+
+    Usernames are case-insensitive. A cached value of None is a negative entry:
+    the name is known not to exist, so the lookup can be skipped as well.
+    """
+
+    @abstractmethod
+    def get(self, name: str, default=None):
+        """Get the cached UUID for ``name``.
+
+        Args:
+            name: Minecraft username.
+            default: Value returned if ``name`` is not cached or expired.
+
+        Returns:
+            The cached UUID, None for a negative entry, otherwise ``default``.
+        """
+
+    def get_entry(self, name: str) -> tuple | None:
+        """Get the cached UUID for ``name`` with its remaining lifetime.
+
+        Used by :class:`MemoryUUIDCache` to read through to its backend. The
+        default implementation is built on :meth:`get` and reports an unknown
+        lifetime.
+
+        Returns:
+            ``(uuid, seconds_left)`` for a live entry, where ``uuid`` is None for
+            a negative entry and ``seconds_left`` may be None if unknown;
+            otherwise None.
+        """
+        uuid = self.get(name, _MISSING)
+        return None if uuid is _MISSING else (uuid, None)
+
+    @abstractmethod
+    def set(self, name: str, uuid: str | None) -> None:
+        """Cache the UUID of ``name``; pass None to cache a missing player."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, _MISSING) is not _MISSING
+
+
+class MemoryUUIDCache(UUIDCache):
+    """Thread-safe in-memory LRU cache with TTL.
+
+    Optionally backed by a second-tier cache (e.g. :class:`SQLiteUUIDCache`):
+    misses fall through to the backend, and writes go to both tiers.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAXSIZE_,
+        ttl: float = _DEFAULT_TTL_,
+        negative_ttl: float = _DEFAULT_NEGATIVE_TTL_,
+        backend: UUIDCache | None = None,
+    ):
+        """Create an in-memory UUID cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used ones are evicted.
+            ttl: Lifetime of found UUIDs, in seconds.
+            negative_ttl: Lifetime of "player not found" entries, in seconds.
+            backend: Optional second-tier cache.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.backend = backend
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_entry(self, name: str) -> tuple | None:
+        key = name.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                uuid, expires_at = entry
+                seconds_left = expires_at - time.monotonic()
+                if seconds_left > 0:
+                    self._entries.move_to_end(key)
+                    return uuid, seconds_left
+                del self._entries[key]
+
+        if self.backend is None:
+            return None
+        entry = self.backend.get_entry(key)
+        if entry is None:
+            return None
+        uuid, seconds_left = entry
+        if seconds_left is None:
+            seconds_left = self.ttl if uuid is not None else self.negative_ttl
+        self._store(key, uuid, seconds_left)
+        return uuid, seconds_left
+
+    def get(self, name: str, default=None):
+        entry = self.get_entry(name)
+        return default if entry is None else entry[0]
+
+    def set(self, name: str, uuid: str | None) -> None:
+        key = name.lower()
+        self._store(key, uuid, self.ttl if uuid is not None else self.negative_ttl)
+        if self.backend is not None:
+            self.backend.set(key, uuid)
+
+    def _store(self, key: str, uuid: str | None, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (uuid, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteUUIDCache(UUIDCache):
+    """UUID cache stored in a local SQLite file.
+
+    The file survives process restarts and can be shared by several processes.
+    Usually used as the ``backend`` of a :class:`MemoryUUIDCache`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = _DEFAULT_TTL_,
+        negative_ttl: float = _DEFAULT_NEGATIVE_TTL_,
+    ):
+        """Open (or create) a SQLite UUID cache.
+
+        Args:
+            path: Database file path.
+            ttl: Lifetime of found UUIDs, in seconds.
+            negative_ttl: Lifetime of "player not found" entries, in seconds.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS uuid_cache ("
+                "name TEXT PRIMARY KEY, uuid TEXT, expires_at REAL NOT NULL)"
+            )
+
+    def get_entry(self, name: str) -> tuple | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uuid, expires_at FROM uuid_cache WHERE name = ?",
+                (name.lower(),),
+            ).fetchone()
+        if row is None:
+            return None
+        seconds_left = row[1] - time.time()
+        if seconds_left <= 0:
+            return None
+        return row[0], seconds_left
+
+    def get(self, name: str, default=None):
+        entry = self.get_entry(name)
+        return default if entry is None else entry[0]
+
+    def set(self, name: str, uuid: str | None) -> None:
+        ttl = self.ttl if uuid is not None else self.negative_ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uuid_cache VALUES (?, ?, ?)",
+                (name.lower(), uuid, time.time() + ttl),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM uuid_cache")
+
+    def purge_expired(self) -> None:
+        """Delete expired rows from the database file."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM uuid_cache WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+_DEFAULT_RESPONSE_TTLS_ = {"profile": 60, "profiles": 60}
+_DEFAULT_STALE_TTL_ = 5 * 60
+_DEFAULT_MAX_BYTES_ = 64 * 1024 * 1024
+
+
+class _MemoryResponseStore:
+    """LRU storage of ``key -> (body, stored_at)`` in a dict."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self.size = 0
+
+    def get(self, key: str) -> tuple | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, body: bytes, stored_at: float) -> None:
+        self.delete(key)
+        self._entries[key] = (body, stored_at)
+        self.size += len(body)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def pop_oldest(self) -> None:
+        _, (body, _) = self._entries.popitem(last=False)
+        self.size -= len(body)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class _SQLiteResponseStore:
+    """LRU storage of ``key -> (body, stored_at)`` in a SQLite file."""
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL, "
+                "used_at REAL NOT NULL)"
+            )
+        self.size = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(body)), 0) FROM response_cache"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> tuple | None:
+        row = self._conn.execute(
+            "SELECT body, stored_at FROM response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE response_cache SET used_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return row
+
+    def put(self, key: str, body: bytes, stored_at: float) -> None:
+        self.delete(key)
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO response_cache VALUES (?, ?, ?, ?)",
+                (key, body, stored_at, time.time()),
+            )
+        self.size += len(body)
+
+    def delete(self, key: str) -> None:
+        row = self._conn.execute(
+            "SELECT LENGTH(body) FROM response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+            self.size -= row[0]
+
+    def pop_oldest(self) -> None:
+        row = self._conn.execute(
+            "SELECT key FROM response_cache ORDER BY used_at LIMIT 1"
+        ).fetchone()
+        self.delete(row[0])
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM response_cache")
+        self.size = 0
+
+
+class ResponseCache:
+    """Opt-in cache of raw Hypixel response bodies.
+
+    Entries are keyed on ``(endpoint, uuid, profile)`` and go through three
+    states: *fresh* for ``ttls[endpoint]`` seconds, then *stale* for another
+    ``stale_ttl`` seconds, then expired. Stale entries are still served, while
+    the client refreshes them in the background (stale-while-revalidate).
+
+    The cache keeps at most ``max_bytes`` of response bodies, evicting the least
+    recently used entries. It lives in memory, or in a SQLite file if ``path`` is
+    given. Hit/miss counters are available through :attr:`stats`.
+    """
+
+    def __init__(
+        self,
+        ttls: dict | None = None,
+        stale_ttl: float = _DEFAULT_STALE_TTL_,
+        max_bytes: int = _DEFAULT_MAX_BYTES_,
+        path: str | None = None,
+    ):
+        """Create a response cache.
+
+        Args:
+            ttls: Freshness lifetime in seconds per endpoint (``"profile"``,
+                ``"profiles"``). Endpoints missing from the mapping are not cached.
+            stale_ttl: How long, in seconds, an entry may be served stale after
+                it stops being fresh.
+            max_bytes: Maximum total size of the cached bodies.
+            path: SQLite file to store entries in; kept in memory if omitted.
+        """
+        self.ttls = dict(_DEFAULT_RESPONSE_TTLS_ if ttls is None else ttls)
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self._store = (
+            _MemoryResponseStore() if path is None else _SQLiteResponseStore(path)
+        )
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(endpoint: str, uuid: str, profile: str | None = None) -> str:
+        """Build the cache key of a request."""
+        return f"{endpoint}|{uuid}|{profile or ''}"
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached bodies, in bytes."""
+        return self._store.size
+
+    @property
+    def stats(self) -> dict:
+        """Counters: ``hits``, ``stale_hits``, ``misses`` and ``evictions``."""
+        with self._lock:
+            return dict(self._stats)
+
+    def lookup(self, endpoint: str, key: str) -> tuple:
+        """Look up a cached response body.
+
+        Args:
+            endpoint: Endpoint name, used to select the TTL.
+            key: Key built with :meth:`make_key`.
+
+        Returns:
+            A tuple ``(body, state, stored_at)`` where state is :data:`FRESH`,
+            :data:`STALE` or :data:`MISS` (with ``body`` and ``stored_at`` None),
+            and ``stored_at`` is the Unix time the body was stored.
+        """
+        ttl = self.ttls.get(endpoint)
+        with self._lock:
+            entry = None if ttl is None else self._store.get(key)
+            if ttl is None or entry is None:
+                self._stats["misses"] += 1
+                return None, MISS, None
+
+            body, stored_at = entry
+            age = time.time() - stored_at
+            if age < ttl:
+                self._stats["hits"] += 1
+                return body, FRESH, stored_at
+            if age < ttl + self.stale_ttl:
+                self._stats["stale_hits"] += 1
+                return body, STALE, stored_at
+
+            self._store.delete(key)
+            self._stats["misses"] += 1
+            return None, MISS, None
+
+    def put(self, endpoint: str, key: str, body: bytes) -> None:
+        """Store a response body, evicting old entries to stay under ``max_bytes``.
+
+        Bodies of endpoints without a TTL, or larger than ``max_bytes``, are
+        not stored.
+        """
+        if self.ttls.get(endpoint) is None or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._store.put(key, body, time.time())
+            while self._store.size > self.max_bytes:
+                self._store.pop_oldest()
+                self._stats["evictions"] += 1
+
+    def begin_refresh(self, key: str) -> bool:
+        """Mark a stale entry as being refreshed.
+
+        Returns:
+            False if a refresh of ``key`` is already running, otherwise True.
+            Every successful call must be followed by :meth:`end_refresh`.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        """Mark the refresh of ``key`` as finished."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._store.clear()
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import IO, Callable, Iterable, Iterator, NamedTuple
+
+from .hypixel_api import HypixelClient, NotFoundError, SkyblockProfileData
+from .ratelimit import RateLimiter
+from .transport import TransportConfig
+
+_API_KEY_ENV_ = "HYPIXEL_API_KEY"
+_CHECKPOINT_EVERY_ = 100
+
+
+class CrawlStats(NamedTuple):
+    """Outcome of :func:`crawl`.
+
+    Attributes:
+        written: Profiles written to the output.
+        skipped: Inputs skipped because the checkpoint lists them as done.
+        not_found: Players without a UUID or without SkyBlock profiles.
+        failed: Lookups that failed for another reason (network, HTTP, API
+            errors). They are not checkpointed, so a resumed crawl retries them.
+    """
+
+    written: int
+    skipped: int
+    not_found: int
+    failed: int
+
+
+def _json_encoder() -> Callable[[object], str]:
+    """Compact JSON encoder, using ``orjson`` if it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    return lambda obj: orjson.dumps(obj).decode()
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the usernames/UUIDs of ``lines``, skipping blanks and ``#`` comments."""
+    for line in lines:
+        query = line.strip()
+        if query and not query.startswith("#"):
+            yield query
+
+
+def load_checkpoint(path: str) -> set:
+    """Read the queries already done by a previous crawl (empty if no file)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def profile_record(query: str, profile: SkyblockProfileData, summary: bool) -> dict:
+    """Build the output line of one fetched profile.
+
+    Args:
+        query: Username or UUID the profile was fetched for.
+        profile: The fetched profile.
+        summary: If true, include :meth:`SkyblockProfileData.summary` instead of
+            the raw profile JSON.
+    """
+    raw = profile._data.get("profile") or {}
+    record = {
+        "query": query,
+        "uuid": profile._uuid,
+        "profile_id": raw.get("profile_id"),
+        "cute_name": raw.get("cute_name"),
+        "fetched_at": profile.fetched_at,
+    }
+    if summary:
+        record["summary"] = profile.summary()
+    else:
+        record["profile"] = raw
+    return record
+
+
+def crawl(
+    client: HypixelClient,
+    queries: Iterable[str],
+    out: IO[str],
+    summary: bool = False,
+    profile: str | None = None,
+    workers: int = 8,
+    checkpoint: str | None = None,
+    checkpoint_every: int = _CHECKPOINT_EVERY_,
+    errors: IO[str] | None = None,
+) -> CrawlStats:
+    """Fetch many players concurrently and write one JSON line per profile.
+
+    Lookups run through :meth:`HypixelClient.fetch_many`, so they share the
+    client's rate limiter and connection pool, and ``queries`` is consumed
+    lazily. Lines are written in completion order.
+
+    Queries whose outcome is final (fetched, or player/profile not found) are
+    appended to ``checkpoint`` after their output line has been flushed, and
+    skipped when the crawl is run again with the same checkpoint. A crash
+    between the two writes repeats at most ``checkpoint_every`` lines.
+
+    Args:
+        client: Client used for every lookup.
+        queries: Usernames and/or UUIDs.
+        out: Text stream receiving the NDJSON lines.
+        summary: Write :meth:`SkyblockProfileData.summary` instead of the raw
+            profile (see :func:`profile_record`).
+        profile: Profile id or cute name to fetch for every player. If None,
+            each player's selected profile is fetched.
+        workers: Maximum number of lookups running concurrently.
+        checkpoint: Path of the checkpoint file, or None to disable resuming.
+        checkpoint_every: Number of finished queries between two flushes of
+            ``out`` and the checkpoint.
+        errors: Text stream receiving one line per failed lookup, or None.
+
+    Returns:
+        A :class:`CrawlStats`.
+    """
+    dumps = _json_encoder()
+    done = load_checkpoint(checkpoint) if checkpoint else set()
+    skipped = [0]
+    written = not_found = failed = 0
+    finished: list[str] = []
+
+    def pending() -> Iterator[str]:
+        for query in queries:
+            if query in done:
+                skipped[0] += 1
+            else:
+                yield query
+
+    log = open(checkpoint, "a", encoding="utf-8") if checkpoint else None
+
+    def flush() -> None:
+        out.flush()
+        if log is not None and finished:
+            log.write("".join(f"{query}\n" for query in finished))
+            log.flush()
+        finished.clear()
+
+    results = client.fetch_many(pending(), max_workers=workers, profile=profile)
+    try:
+        for result in results:
+            if result.error is None:
+                assert result.data is not None
+                out.write(dumps(profile_record(result.query, result.data, summary)))
+                out.write("\n")
+                written += 1
+            elif isinstance(result.error, NotFoundError):
+                not_found += 1
+            else:
+                failed += 1
+                if errors is not None:
+                    errors.write(f"{result.query}: {result.error!r}\n")
+                continue
+            finished.append(result.query)
+            if len(finished) >= checkpoint_every:
+                flush()
+    finally:
+        results.close()
+        flush()
+        if log is not None:
+            log.close()
+
+    return CrawlStats(written, skipped[0], not_found, failed)
+
+
+def main(argv=None) -> int:
+    """Entry point of the ``hypixelez`` command."""
+    parser = argparse.ArgumentParser(
+        prog="hypixelez",
+        description=(
+            "Fetch SkyBlock profiles for usernames/UUIDs (one per line) and write "
+            "one JSON line per profile to stdout."
+        ),
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="file of usernames/UUIDs; - for stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="NDJSON file to append to; - for stdout"
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get(_API_KEY_ENV_),
+        help=f"defaults to ${_API_KEY_ENV_}",
+    )
+    parser.add_argument(
+        "--summary", action="store_true", help="write summary() instead of raw profiles"
+    )
+    parser.add_argument("--profile", help="profile id or cute name; default: selected")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--checkpoint", help="file of done queries, to resume a crawl")
+    parser.add_argument("--checkpoint-every", type=int, default=_CHECKPOINT_EVERY_)
+    parser.add_argument(
+        "--rate-limit", type=int, help="requests per --window before the first response"
+    )
+    parser.add_argument("--window", type=float, default=300.0)
+    parser.add_argument("--json-decoder", default="auto")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error(f"an API key is required: --api-key or ${_API_KEY_ENV_}")
+
+    client = HypixelClient(
+        api_key=args.api_key,
+        debug=None,
+        rate_limiter=(
+            RateLimiter(limit=args.rate_limit, window=args.window)
+            if args.rate_limit
+            else None
+        ),
+        transport=TransportConfig(pool_maxsize=max(args.workers, 10)),
+        json_decoder=args.json_decoder,
+    )
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    try:
+        stats = crawl(
+            client,
+            read_queries(source),
+            out,
+            summary=args.summary,
+            profile=args.profile,
+            workers=args.workers,
+            checkpoint=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            errors=sys.stderr,
+        )
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        for stream in (source, out):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+
+    print(
+        f"{stats.written} written, {stats.skipped} skipped, "
+        f"{stats.not_found} not found, {stats.failed} failed",
+        file=sys.stderr,
+    )
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -95,6 +95,7 @@ class CollectionKey(str, Enum):
     def __str__(self) -> str:
         return self.value
 
+
 class SlayerKey(str, Enum):
     ZOMBIE = "zombie"
     SPIDER = "spider"
@@ -103,6 +104,7 @@ class SlayerKey(str, Enum):
     BLAZE = "blaze"
     VAMPIRE = "vampire"
 
+
 class SkillKey(str, Enum):
     SKILL_FISHING = "SKILL_FISHING"
     SKILL_ALCHEMY = "SKILL_ALCHEMY"
@@ -115,6 +117,19 @@ class SkillKey(str, Enum):
     SKILL_CARPENTRY = "SKILL_CARPENTRY"
     SKILL_COMBAT = "SKILL_COMBAT"
 
+
+class DungeonClassKey(str, Enum):
+    HEALER = "healer"
+    MAGE = "mage"
+    BERSERK = "berserk"
+    ARCHER = "archer"
+    TANK = "tank"
+
+
 # --8<-- collection-key-values:start
 COLLECTION_KEY_VALUES: tuple[str, ...] = tuple(k.value for k in CollectionKey)
-# --8<-- collection-key-values:end
\ No newline at end of file
+# --8<-- collection-key-values:end
+
+SKILL_KEY_VALUES: tuple[str, ...] = tuple(k.value for k in SkillKey)
+SLAYER_KEY_VALUES: tuple[str, ...] = tuple(k.value for k in SlayerKey)
+DUNGEON_CLASS_KEY_VALUES: tuple[str, ...] = tuple(k.value for k in DungeonClassKey)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Fastest first; "auto" picks the first one that is installed
+_BACKENDS_ = ("msgspec", "orjson", "json")
+
+
+def _load_backend(name: str) -> JSONDecoder:
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    raise ValueError(
+        f"Unknown JSON decoder '{name}', expected one of {_BACKENDS_ + ('auto',)}"
+    )
+
+
+def get_decoder(backend: str | JSONDecoder = "json") -> JSONDecoder:
+    """Resolve a JSON decoder backend.
+
+    Every backend takes the raw response body as ``bytes``, so no intermediate
+    text decoding is done.
+
+    Args:
+        backend: ``"json"`` (stdlib), ``"orjson"``, ``"msgspec"``, ``"auto"`` for
+            the fastest installed backend, or a callable taking ``bytes``.
+
+    Returns:
+        A callable decoding a JSON body.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    if callable(backend):
+        return backend
+    if backend != "auto":
+        return _load_backend(backend)
+
+    for name in _BACKENDS_[:-1]:
+        try:
+            return _load_backend(name)
+        except ImportError:
+            pass
+    return json.loads
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .hypixel_api import SkyblockProfileData
+from .snapshot import METRICS, SECTIONS, ProfileSnapshot
+
+
+class MetricChange(NamedTuple):
+    """Change of one metric between two snapshots.
+
+    Attributes:
+        before: Value in the old snapshot.
+        after: Value in the new snapshot.
+        delta: ``after - before``.
+        rate: ``delta`` per ``per`` seconds (per hour by default).
+    """
+
+    before: int
+    after: int
+    delta: int
+    rate: float
+
+
+class ProfileDiff(NamedTuple):
+    """Changed metrics of one member between two snapshots.
+
+    Attributes:
+        uuid: Member UUID.
+        elapsed: Seconds between the two snapshots.
+        changes: ``{metric: MetricChange}`` for the metrics that changed only.
+    """
+
+    uuid: str
+    elapsed: float
+    changes: dict
+
+    def section(self, name: str) -> dict:
+        """Get the changes of one section of :data:`~hypixelez.snapshot.SECTIONS`."""
+        metrics = set(METRICS[SECTIONS[name]])
+        return {m: c for m, c in self.changes.items() if m in metrics}
+
+
+def _as_snapshot(profile) -> ProfileSnapshot:
+    if isinstance(profile, ProfileSnapshot):
+        return profile
+    return ProfileSnapshot.from_profile(profile)
+
+
+def diff_profiles(
+    old: SkyblockProfileData | ProfileSnapshot,
+    new: SkyblockProfileData | ProfileSnapshot,
+    per: float = 3600.0,
+) -> ProfileDiff:
+    """Compare two snapshots of the same member.
+
+    Sections whose values are all equal (e.g. collections of a player who only
+    ran dungeons) are skipped with a single array comparison; only changed
+    metrics of the other sections are reported.
+
+    Args:
+        old: Earlier profile or snapshot.
+        new: Later profile or snapshot of the same member.
+        per: Time unit of the rates, in seconds. Per hour by default.
+
+    Returns:
+        A :class:`ProfileDiff` with the changed skill XP, collections, slayer XP
+        and kills per tier, Catacombs and class XP, and leveling experience.
+
+    Raises:
+        ValueError: If the snapshots belong to different members or ``new`` is
+            not newer than ``old``.
+    """
+    old, new = _as_snapshot(old), _as_snapshot(new)
+    if old.uuid != new.uuid:
+        raise ValueError(f"Cannot diff members '{old.uuid}' and '{new.uuid}'")
+    elapsed = new.fetched_at - old.fetched_at
+    if elapsed <= 0:
+        raise ValueError(f"New snapshot is not newer than the old one ({elapsed}s)")
+
+    before, after = old._values, new._values
+    scale = per / elapsed
+    changes = {}
+    for section in SECTIONS.values():
+        if before[section] == after[section]:
+            continue
+        for i in range(section.start, section.stop):
+            if before[i] != after[i]:
+                delta = after[i] - before[i]
+                changes[METRICS[i]] = MetricChange(
+                    before[i], after[i], delta, delta * scale
+                )
+    return ProfileDiff(new.uuid, elapsed, changes)
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import base64
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .constants import (
+    COLLECTION_KEY_VALUES,
+    DUNGEON_CLASS_KEY_VALUES,
+    SKILL_KEY_VALUES,
+    SLAYER_KEY_VALUES,
+)
+
+# Inventories of a member, stored by the API as base64 gzipped NBT
+INVENTORIES = (
+    "inv_contents",
+    "ender_chest_contents",
+    "wardrobe_contents",
+    "inv_armor",
+    "equipment_contents",
+    "personal_vault_contents",
+)
+_FLOORS_ = [str(floor) for floor in range(8)]
+_CUTE_NAMES_ = ("Apple", "Banana", "Kiwi", "Peach", "Zucchini", "Mango")
+_SERVER_ERRORS_ = (500, 502, 503, 504)
+_BODY_CACHE_SIZE_ = 256
+
+
+def make_uuid(rng: random.Random) -> str:
+    """Generate an undashed UUID."""
+    return "%032x" % rng.getrandbits(128)
+
+
+def _dashed(uuid: str) -> str:
+    return f"{uuid[:8]}-{uuid[8:12]}-{uuid[12:16]}-{uuid[16:20]}-{uuid[20:]}"
+
+
+def _blob(rng: random.Random, size: int) -> dict:
+    return {"type": 0, "data": base64.b64encode(rng.randbytes(size)).decode()}
+
+
+def make_member(rng: random.Random, inventory_bytes: int = 96 * 1024) -> dict:
+    """Generate one profile member with every section the API sends.
+
+    Besides the sections read by :class:`~hypixelez.hypixel_api.SkyblockProfileData`
+    (in the shape of ``tests/mocks.py``), the member carries inventories, stats
+    and per-floor dungeon records, as real members do.
+
+    Args:
+        rng: Source of randomness.
+        inventory_bytes: Raw size of the inventories, split evenly.
+    """
+    per_inventory = inventory_bytes // len(INVENTORIES)
+    return {
+        "player_id": make_uuid(rng),
+        "collection": {
+            key: rng.randrange(0, 5_000_000) for key in COLLECTION_KEY_VALUES
+        },
+        "player_data": {
+            "experience": {
+                key: rng.uniform(0, 120_000_000) for key in SKILL_KEY_VALUES
+            },
+            "unlocked_coll_tiers": [
+                f"{key}_{tier}" for key in COLLECTION_KEY_VALUES for tier in range(5)
+            ],
+        },
+        "slayer": {
+            "slayer_bosses": {
+                slayer: {
+                    "claimed_levels": {
+                        f"level_{level}": True for level in range(1, rng.randrange(10))
+                    },
+                    **{
+                        f"boss_kills_tier_{tier}": rng.randrange(500)
+                        for tier in range(5)
+                    },
+                    "xp": rng.randrange(0, 3_000_000),
+                }
+                for slayer in SLAYER_KEY_VALUES
+            }
+        },
+        "dungeons": {
+            "dungeon_types": {
+                "catacombs": {
+                    "experience": rng.uniform(0, 600_000_000),
+                    "times_played": {f: rng.randrange(1000) for f in _FLOORS_},
+                    "best_score": {f: rng.randrange(317) for f in _FLOORS_},
+                    "fastest_time": {f: rng.randrange(10**6) for f in _FLOORS_},
+                }
+            },
+            "player_classes": {
+                name: {"experience": rng.uniform(0, 300_000_000)}
+                for name in DUNGEON_CLASS_KEY_VALUES
+            },
+        },
+        "leveling": {
+            "experience": rng.randrange(0, 50_000),
+            "completed_tasks": [f"TASK_{i}" for i in range(rng.randrange(300))],
+        },
+        "player_stats": {f"stat_{i}": rng.random() * 10**6 for i in range(600)},
+        "inventory": {name: _blob(rng, per_inventory) for name in INVENTORIES},
+    }
+
+
+def make_profile(
+    rng: random.Random,
+    members: int = 5,
+    inventory_bytes: int = 96 * 1024,
+    owner: str | None = None,
+    profile_id: str | None = None,
+) -> dict:
+    """Generate one profile with ``members`` co-op members.
+
+    Args:
+        rng: Source of randomness.
+        members: Number of members.
+        inventory_bytes: Raw inventory size of each member.
+        owner: UUID of the first member. Random if None.
+        profile_id: Dashed profile id. Random if None.
+    """
+    profile_members = {}
+    for i in range(members):
+        member = make_member(rng, inventory_bytes)
+        if i == 0 and owner is not None:
+            member["player_id"] = owner
+        profile_members[member["player_id"]] = member
+    return {
+        "profile_id": profile_id or _dashed(make_uuid(rng)),
+        "cute_name": rng.choice(_CUTE_NAMES_),
+        "selected": False,
+        "members": profile_members,
+        "banking": {"balance": rng.uniform(0, 10**9), "transactions": []},
+    }
+
+
+def make_profile_response(seed: int = 0, members: int = 5, **kwargs) -> dict:
+    """Generate a ``/v2/skyblock/profile`` response body."""
+    rng = random.Random(seed)
+    return {"success": True, "profile": make_profile(rng, members, **kwargs)}
+
+
+def make_profiles_response(
+    seed: int = 0, profiles: int = 3, members: int = 5, **kwargs
+) -> dict:
+    """Generate a ``/v2/skyblock/profiles`` response body.
+
+    The first member of every profile is the same player, and the first
+    profile is the selected one.
+    """
+    rng = random.Random(seed)
+    player = make_uuid(rng)
+    result = [
+        make_profile(rng, members, owner=player, **kwargs) for _ in range(profiles)
+    ]
+    result[0]["selected"] = True
+    return {"success": True, "profiles": result}
+
+
+def first_member(response: dict) -> str:
+    """Get the UUID of the first member of a generated response."""
+    profile = response["profile"] if "profile" in response else response["profiles"][0]
+    return next(iter(profile["members"]))
+
+
+class FakeHypixelServer:
+    """Local stand-in for the Hypixel SkyBlock and Mojang APIs.
+
+    Serves ``/v2/skyblock/profile``, ``/v2/skyblock/profiles``, the Mojang
+    username lookup and the Mojang bulk lookup from generated players, so that
+    integrations can be load-tested without spending API quota. Players are
+    named ``Player0``, ``Player1``, ...; their profiles are generated on first
+    request from the seed and kept in a small cache.
+
+    Latency, rate limiting and failures are configurable. Hypixel responses
+    carry ``RateLimit-*`` headers, and requests over the limit get HTTP 429 like
+    the real API.
+
+    Example:
+        >>> with FakeHypixelServer(players=1000, latency=0.05) as server:
+        ...     client = HypixelClient("key", **server.client_kwargs())
+        ...     client.fetch_selected_profile(client.get_uuid_by_name("Player7"))
+    """
+
+    def __init__(
+        self,
+        players: int = 100,
+        profiles: int = 2,
+        members: int = 4,
+        inventory_bytes: int = 32 * 1024,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: int | None = None,
+        window: float = 300.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Create a server; call :meth:`start` or use it as a context manager.
+
+        Args:
+            players: Number of players known to the server.
+            profiles: SkyBlock profiles per player; the first one is selected.
+            members: Co-op members per profile, the player included.
+            inventory_bytes: Raw inventory size of each member, which drives the
+                size of the responses.
+            latency: Seconds added to every response.
+            jitter: Maximum random seconds added on top of ``latency``.
+            rate_limit: Hypixel requests allowed per ``window`` and API key.
+                None disables rate limiting and the ``RateLimit-*`` headers.
+            window: Rate limit window in seconds.
+            throttle_rate: Probability of answering any request with a 429.
+            error_rate: Probability of answering any request with a 5xx.
+            retry_after: ``Retry-After`` seconds of injected 429 responses.
+            seed: Seed of the generated data and injected failures.
+            host: Interface to listen on.
+            port: TCP port; 0 picks a free one.
+        """
+        self.profiles = profiles
+        self.members = members
+        self.inventory_bytes = inventory_bytes
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.window = window
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+        rng = random.Random(seed)
+        self.names = [f"Player{i}" for i in range(players)]
+        self.uuids = {name: make_uuid(rng) for name in self.names}
+        self._names_by_lower = {name.lower(): name for name in self.names}
+        self._players = set(self.uuids.values())
+        self._profile_ids = {
+            uuid: [_dashed(make_uuid(rng)) for _ in range(profiles)]
+            for uuid in self.uuids.values()
+        }
+        self._profile_owners = {
+            profile_id: (uuid, i)
+            for uuid, ids in self._profile_ids.items()
+            for i, profile_id in enumerate(ids)
+        }
+
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._bodies: OrderedDict[tuple, bytes] = OrderedDict()
+        self._windows: dict[str, tuple[float, int]] = {}
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0}
+        self._host = host
+        self._server = self._make_server(host, port)
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. ``http://127.0.0.1:54321``."""
+        return f"http://{self._host}:{self._server.server_address[1]}"
+
+    def client_kwargs(self) -> dict:
+        """Keyword arguments pointing a client at this server."""
+        return {
+            "base_url": f"{self.url}/v2/skyblock/profile",
+            "profiles_url": f"{self.url}/v2/skyblock/profiles",
+            "mojang_url": f"{self.url}/users/profiles/minecraft/{{name}}",
+            "mojang_bulk_url": f"{self.url}/profiles/minecraft",
+        }
+
+    def start(self) -> FakeHypixelServer:
+        """Serve requests in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def profile_ids(self, uuid: str) -> list:
+        """Get the profile ids of a player, the selected one first."""
+        return list(self._profile_ids.get(uuid, []))
+
+    def _profile(self, uuid: str, index: int) -> dict:
+        rng = random.Random(f"{self.seed}:{uuid}:{index}")
+        profile = make_profile(
+            rng,
+            self.members,
+            self.inventory_bytes,
+            owner=uuid,
+            profile_id=self._profile_ids[uuid][index],
+        )
+        profile["selected"] = index == 0
+        return profile
+
+    def _body(self, key: tuple, build) -> bytes:
+        """Encode a response once and keep the most recent ones."""
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+        body = json.dumps(build()).encode()
+        with self._lock:
+            self._bodies[key] = body
+            if len(self._bodies) > _BODY_CACHE_SIZE_:
+                self._bodies.popitem(last=False)
+        return body
+
+    def _rate_limit_headers(self, api_key: str) -> tuple:
+        """Count a Hypixel request; return ``(allowed, headers)``."""
+        if self.rate_limit is None:
+            return True, {}
+        now = time.monotonic()
+        with self._lock:
+            started, used = self._windows.get(api_key, (now, 0))
+            if now - started >= self.window:
+                started, used = now, 0
+            allowed = used < self.rate_limit
+            used += allowed
+            self._windows[api_key] = (started, used)
+        reset = max(int(started + self.window - now), 1)
+        return allowed, {
+            "RateLimit-Limit": str(self.rate_limit),
+            "RateLimit-Remaining": str(self.rate_limit - used),
+            "RateLimit-Reset": str(reset),
+        }
+
+    def _inject(self) -> tuple:
+        """Draw the latency and the injected failure of one request."""
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            roll = self._rng.random()
+            if roll < self.throttle_rate:
+                self.stats["throttled"] += 1
+                return delay, 429
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats["errors"] += 1
+                return delay, self._rng.choice(_SERVER_ERRORS_)
+        return delay, None
+
+    def _handle(self, method: str, path: str, query: dict, headers, body: bytes):
+        """Answer one request; return ``(status, headers, body)``."""
+        delay, failure = self._inject()
+        if delay:
+            time.sleep(delay)
+        if failure == 429:
+            return 429, {"Retry-After": str(self.retry_after)}, _error("Key throttle")
+        if failure is not None:
+            return failure, {}, _error("Injected server error")
+
+        if path.startswith("/v2/skyblock/"):
+            return self._handle_hypixel(path, query, headers)
+        if method == "GET" and path.startswith("/users/profiles/minecraft/"):
+            name = self._names_by_lower.get(path.rsplit("/", 1)[1].lower())
+            if name is None:
+                return 404, {}, _error("Couldn't find any profile with that name")
+            return 200, {}, _json({"id": self.uuids[name], "name": name})
+        if method == "POST" and path == "/profiles/minecraft":
+            found = []
+            for requested in json.loads(body or b"[]"):
+                name = self._names_by_lower.get(str(requested).lower())
+                if name is not None:
+                    found.append({"id": self.uuids[name], "name": name})
+            return 200, {}, _json(found)
+        return 404, {}, _error("Not found")
+
+    def _handle_hypixel(self, path: str, query: dict, headers):
+        api_key = headers.get("API-Key")
+        if not api_key:
+            return 403, {}, _error("Invalid API key")
+        allowed, limit_headers = self._rate_limit_headers(api_key)
+        if not allowed:
+            return 429, limit_headers, _error("Key throttle")
+
+        if path == "/v2/skyblock/profiles":
+            uuid = query.get("uuid", [""])[0].replace("-", "")
+            if uuid not in self._players:
+                return 200, limit_headers, _json({"success": True, "profiles": None})
+            body = self._body(
+                ("profiles", uuid),
+                lambda: {
+                    "success": True,
+                    "profiles": [self._profile(uuid, i) for i in range(self.profiles)],
+                },
+            )
+            return 200, limit_headers, body
+
+        if path == "/v2/skyblock/profile":
+            owner = self._profile_owners.get(query.get("profile", [""])[0])
+            if owner is None:
+                return 200, limit_headers, _json({"success": True, "profile": None})
+            body = self._body(
+                ("profile",) + owner,
+                lambda: {"success": True, "profile": self._profile(*owner)},
+            )
+            return 200, limit_headers, body
+
+        return 404, limit_headers, _error("Not found")
+
+    def _make_server(self, host: str, port: int) -> ThreadingHTTPServer:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, method: str) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, payload = fake._handle(
+                    method, url.path, parse_qs(url.query), self.headers, body
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+def _json(data) -> bytes:
+    return json.dumps(data).encode()
+
+
+def _error(cause: str) -> bytes:
+    return _json({"success": False, "cause": cause})
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Sequence
+
+from .constants import DUNGEON_CLASS_KEY_VALUES, SKILL_KEY_VALUES
+from .hypixel_api import SkyblockProfileData, _import_numpy, calculate_levels
+from .snapshot import METRICS, ProfileSnapshot, _TYPECODE_
+
+_AGGREGATIONS_ = ("count", "sum", "mean", "min", "max", "median")
+
+
+def _percentile(values: list, q: float) -> float:
+    """Linear interpolation percentile, as ``numpy.percentile`` computes it."""
+    values = sorted(values)
+    if not values:
+        raise ValueError("Percentile of an empty frame")
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def _aggregate(values: list, agg: str):
+    if agg == "count":
+        return len(values)
+    if agg == "sum":
+        return sum(values)
+    if agg == "mean":
+        return sum(values) / len(values)
+    if agg == "min":
+        return min(values)
+    if agg == "max":
+        return max(values)
+    return _percentile(values, 50)
+
+
+class ProfileFrame:
+    """Columnar table of profile metrics, one row per profile member.
+
+    Every metric of :data:`~hypixelez.snapshot.METRICS` is stored as one
+    contiguous column: a NumPy ``int64`` array when NumPy is installed, an
+    ``array('q')`` otherwise. Filters, sorts, percentiles and group-bys work on
+    whole columns, so no profile getter is called after ingestion.
+
+    Example:
+        >>> frame = ProfileFrame.from_profiles(profiles)
+        >>> veterans = frame.filter(frame["catacombs"] > 1_000_000)
+        >>> veterans.percentile("SKILL_MINING", 90)
+    """
+
+    def __init__(self, uuids: Sequence[str], columns: dict):
+        """Create a frame from columns.
+
+        Args:
+            uuids: Member UUID of each row.
+            columns: ``{metric: values}`` for every metric of ``METRICS``, each
+                with one value per row.
+
+        Raises:
+            ValueError: If a column is missing or has the wrong length.
+        """
+        np = _import_numpy()
+        self.uuids = list(uuids)
+        self._np = np
+        self._columns = {}
+        for metric in METRICS:
+            column = columns[metric]
+            if len(column) != len(self.uuids):
+                raise ValueError(
+                    f"Column '{metric}' has {len(column)} rows, "
+                    f"expected {len(self.uuids)}"
+                )
+            if np is not None:
+                self._columns[metric] = np.asarray(column, dtype=np.int64)
+            else:
+                self._columns[metric] = array(_TYPECODE_, column)
+
+    @classmethod
+    def from_profiles(
+        cls, profiles: Iterable[SkyblockProfileData | ProfileSnapshot]
+    ) -> ProfileFrame:
+        """Ingest profiles or snapshots into a frame."""
+        snapshots = [
+            p if isinstance(p, ProfileSnapshot) else ProfileSnapshot.from_profile(p)
+            for p in profiles
+        ]
+        uuids = [s.uuid for s in snapshots]
+        width = len(METRICS)
+
+        rows = array(_TYPECODE_)
+        for snapshot in snapshots:
+            rows.extend(snapshot._values)
+
+        np = _import_numpy()
+        if np is not None:
+            matrix = np.frombuffer(rows, dtype=np.int64).reshape(-1, width)
+            # One contiguous block per column rather than strided views
+            matrix = np.ascontiguousarray(matrix.T)
+            return cls(uuids, dict(zip(METRICS, matrix)))
+
+        columns = {metric: rows[i::width] for i, metric in enumerate(METRICS)}
+        return cls(uuids, columns)
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __getitem__(self, metric: str):
+        """Get the column of ``metric``."""
+        return self._columns[metric]
+
+    @property
+    def metrics(self) -> tuple:
+        """Names of the columns."""
+        return METRICS
+
+    def _take(self, rows: Sequence[int]) -> ProfileFrame:
+        uuids = [self.uuids[i] for i in rows]
+        if self._np is not None:
+            rows = self._np.asarray(rows, dtype=self._np.intp)
+            columns = {m: c[rows] for m, c in self._columns.items()}
+        else:
+            columns = {m: [c[i] for i in rows] for m, c in self._columns.items()}
+        return ProfileFrame(uuids, columns)
+
+    def filter(self, mask: Sequence[bool]) -> ProfileFrame:
+        """Keep the rows where ``mask`` is true.
+
+        Args:
+            mask: One boolean per row, e.g. ``frame["LOG"] > 10_000`` with NumPy.
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"Mask has {len(mask)} rows, expected {len(self)}")
+        if self._np is not None:
+            return self._take(self._np.flatnonzero(mask))
+        return self._take([i for i, keep in enumerate(mask) if keep])
+
+    def sort(self, metric: str, descending: bool = True) -> ProfileFrame:
+        """Sort rows by ``metric``. Ties keep their current order."""
+        column = self._columns[metric]
+        if self._np is not None:
+            order = self._np.argsort(-column if descending else column, kind="stable")
+        else:
+            order = sorted(
+                range(len(column)), key=column.__getitem__, reverse=descending
+            )
+        return self._take(order)
+
+    def top(self, metric: str, n: int = 10) -> list:
+        """Get the ``n`` highest ``(uuid, value)`` pairs of ``metric``."""
+        best = self.sort(metric)
+        column = best[metric]
+        return [(best.uuids[i], int(column[i])) for i in range(min(n, len(best)))]
+
+    def percentile(self, metric: str, q: float) -> float:
+        """Get the ``q``-th percentile (0-100) of ``metric``, linearly interpolated.
+
+        Raises:
+            ValueError: If the frame is empty.
+        """
+        column = self._columns[metric]
+        if self._np is not None:
+            if not len(column):
+                raise ValueError("Percentile of an empty frame")
+            return float(self._np.percentile(column, q))
+        return float(_percentile(list(column), q))
+
+    def levels(self, metric: str):
+        """Compute the level column of a skill, ``"catacombs"`` or a dungeon class.
+
+        Raises:
+            ValueError: If ``metric`` has no level table.
+        """
+        if metric in SKILL_KEY_VALUES:
+            table = "skill"
+        elif metric == "catacombs" or metric in DUNGEON_CLASS_KEY_VALUES:
+            table = "catacombs"
+        else:
+            raise ValueError(f"Metric '{metric}' has no levels")
+        levels, _ = calculate_levels(self._columns[metric], table)
+        return levels
+
+    def group_by(self, by, metric: str, agg: str = "mean") -> dict:
+        """Aggregate ``metric`` per group.
+
+        Args:
+            by: Metric name, or one group label per row (e.g. :meth:`levels`).
+            metric: Metric to aggregate.
+            agg: One of ``"count"``, ``"sum"``, ``"mean"``, ``"min"``,
+                ``"max"`` and ``"median"``.
+
+        Returns:
+            ``{label: aggregate}`` ordered by label.
+
+        Raises:
+            ValueError: For an unknown aggregation or a label column of the
+                wrong length.
+        """
+        if agg not in _AGGREGATIONS_:
+            raise ValueError(
+                f"Unknown aggregation '{agg}', expected one of {_AGGREGATIONS_}"
+            )
+        labels = self._columns[by] if isinstance(by, str) else by
+        if len(labels) != len(self):
+            raise ValueError(
+                f"Group labels have {len(labels)} rows, expected {len(self)}"
+            )
+        column = self._columns[metric]
+
+        np = self._np
+        if np is None:
+            groups: dict[Any, list] = {}
+            for label, value in zip(labels, column):
+                groups.setdefault(label, []).append(value)
+            return {label: _aggregate(groups[label], agg) for label in sorted(groups)}
+
+        keys, inverse = np.unique(np.asarray(labels), return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(keys))
+        if agg in ("count", "sum", "mean"):
+            sums = np.bincount(inverse, weights=column, minlength=len(keys))
+            if agg == "count":
+                result = counts
+            elif agg == "sum":
+                result = sums.round().astype(np.int64)
+            else:
+                result = sums / counts
+        else:
+            # Sort values by group once, then reduce each contiguous slice
+            order = np.argsort(inverse, kind="stable")
+            slices = np.split(column[order], np.cumsum(counts)[:-1])
+            reduce = {"min": np.min, "max": np.max, "median": np.median}[agg]
+            result = [reduce(part) for part in slices]
+        return {k.item(): v.item() for k, v in zip(keys, np.asarray(result))}
+
+    def to_arrow(self):
+        """Convert the frame to a ``pyarrow.Table`` with a ``uuid`` column.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+        """
+        import pyarrow
+
+        return pyarrow.table({"uuid": self.uuids, **self._columns})
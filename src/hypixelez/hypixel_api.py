@@ -1,11 +1,44 @@
-import requests
-
-from .constants import CollectionKey
+from __future__ import annotations
+
+import re
+import threading
+import time
+from bisect import bisect_right
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Generator,
+    Iterable,
+    NamedTuple,
+    Sequence,
+)
+
+from .cache import _MISSING, FRESH, STALE, MemoryUUIDCache, ResponseCache, UUIDCache
+from .decoders import JSONDecoder, get_decoder
 from .logger import setup_logging, get_logger
+from .metrics import HIT, MISS, Hooks
+from .ratelimit import RateLimiter, _header_int, retry_after
+from .singleflight import SingleFlight
+from .transport import CircuitBreaker, CircuitOpenError, TransportConfig
+
+if TYPE_CHECKING:
+    # requests, the key enums and the optional streaming parser are imported on
+    # first use to keep ``import hypixelez`` fast
+    import requests
+
+    from .constants import CollectionKey
 
 _DEBUG_ = True
 _LOGGER_NAME_ = "hypixelez"
 
+_PROFILE_URL_ = "https://api.hypixel.net/v2/skyblock/profile"
+_PROFILES_URL_ = "https://api.hypixel.net/v2/skyblock/profiles"
+_MOJANG_PROFILE_URL_ = "https://api.mojang.com/users/profiles/minecraft/{name}"
+_MOJANG_BULK_URL_ = "https://api.mojang.com/profiles/minecraft"
+_MOJANG_BULK_SIZE_ = 10
+
+_UUID_RE_ = re.compile(r"[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}")
+
 _CATA_CUMULATIVE_XP_ = [
     50,
     125,
@@ -199,10 +232,7 @@ def _calculate_level(xp: int, cumulative_levels: list) -> int:
     Returns:
         The computed level as an integer index (0-based relative to the table).
     """
-    for i, required_xp in enumerate(cumulative_levels):
-        if required_xp > xp:
-            return i
-    return len(cumulative_levels)
+    return bisect_right(cumulative_levels, xp)
 
 
 def _calculate_current_xp(xp: int, cumulative_levels: list) -> int:
@@ -218,12 +248,278 @@ def _calculate_current_xp(xp: int, cumulative_levels: list) -> int:
     Returns:
         XP accumulated within the current level.
     """
-    level = _calculate_level(xp, cumulative_levels)
+    level = bisect_right(cumulative_levels, xp)
     if level == 0:
         return xp
     return xp - cumulative_levels[level - 1]
 
 
+# Named tables for :func:`calculate_levels`: (cumulative XP table, level offset)
+_LEVEL_TABLES_ = {
+    "skill": (_SKILL_CUMULATIVE_LEVELS_, 1),
+    "catacombs": (_CATA_CUMULATIVE_XP_, 0),
+}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def calculate_levels(xps: Iterable[int], table: str | Sequence[int] = "skill"):
+    """Compute levels and in-level XP progress for many XP values at once.
+
+    Uses NumPy ``searchsorted`` when NumPy is installed and a binary search per
+    value otherwise. Results match :meth:`SkyblockProfileData.get_skill_level` /
+    :meth:`SkyblockProfileData.get_skill_current_level_xp` and their Catacombs
+    counterparts.
+
+    Args:
+        xps: Total XP values.
+        table: ``"skill"``, ``"catacombs"`` (also used for dungeon classes) or a
+            custom ascending cumulative XP table, in which case the level is the
+            number of thresholds reached.
+
+    Returns:
+        A ``(levels, progress)`` pair: NumPy arrays if NumPy is installed,
+        otherwise lists.
+    """
+    if isinstance(table, str):
+        table, offset = _LEVEL_TABLES_[table]
+    else:
+        offset = 0
+
+    np = _import_numpy()
+    if np is None:
+        levels, progress = [], []
+        for xp in xps:
+            level = bisect_right(table, xp)
+            levels.append(level - offset)
+            progress.append(xp - table[level - 1] if level else xp)
+        return levels, progress
+
+    if not isinstance(xps, (Sequence, np.ndarray)):
+        xps = list(xps)
+    xps = np.asarray(xps)
+    thresholds = np.asarray(table)
+    index = np.searchsorted(thresholds, xps, side="right")
+    reached = np.concatenate(([0], thresholds))[index]
+    return index - offset, xps - reached
+
+
+class NotFoundError(LookupError):
+    """The player or the requested SkyBlock profile does not exist."""
+
+
+def _check_api_response(data: dict) -> None:
+    """Raise if a Hypixel response reports ``success=false``.
+
+    Args:
+        data: Decoded JSON body of a Hypixel API response.
+
+    Raises:
+        Exception: If Hypixel returns ``success=false`` (API-level error).
+    """
+    if not data["success"]:
+        raise Exception(f"API Error: {data.get('cause', 'Unknown error')}")
+
+
+def _is_uuid(value: str) -> bool:
+    """Return True if ``value`` looks like a UUID (with or without dashes)."""
+    return _UUID_RE_.fullmatch(value) is not None
+
+
+def _select_profile(profiles: list | None, profile: str | None) -> dict:
+    """Pick one profile entry from a ``/v2/skyblock/profiles`` ``profiles`` list.
+
+    Args:
+        profiles: The ``profiles`` list of the response; None (or missing) for a
+            player without SkyBlock profiles.
+        profile: Profile id or cute name (e.g. "Peach"). If None, the profile
+            flagged as ``selected`` is used.
+
+    Returns:
+        The matching profile entry.
+
+    Raises:
+        NotFoundError: If the player has no profiles or none matches.
+    """
+    if not profiles:
+        raise NotFoundError("No SkyBlock profiles found")
+    for entry in profiles:
+        if profile is None:
+            if entry.get("selected"):
+                return entry
+        elif profile in (entry.get("profile_id"), entry.get("cute_name")):
+            return entry
+    raise NotFoundError(f"Profile '{profile or 'selected'}' not found")
+
+
+def _chunk_uncached_names(names: Iterable[str], cache) -> tuple:
+    """Split names into cached results and Mojang bulk-lookup chunks.
+
+    Args:
+        names: Minecraft usernames; duplicates (case-insensitive) are dropped.
+        cache: UUID cache to consult.
+
+    Returns:
+        A tuple ``(result, chunks)`` where ``result`` maps every requested name
+        to its cached UUID (or None), and ``chunks`` are lists of at most
+        ``_MOJANG_BULK_SIZE_`` names that still need resolving.
+    """
+    result = {}
+    missing = {}
+    for name in names:
+        if name in result or name.lower() in missing:
+            continue
+        cached = cache.get(name, _MISSING)
+        result[name] = None if cached is _MISSING else cached
+        if cached is _MISSING:
+            missing[name.lower()] = name
+
+    pending = list(missing.values())
+    chunks = [
+        pending[i : i + _MOJANG_BULK_SIZE_]
+        for i in range(0, len(pending), _MOJANG_BULK_SIZE_)
+    ]
+    return result, chunks
+
+
+def _store_bulk_result(chunk: list, data: list, cache, result: dict) -> None:
+    """Cache a Mojang bulk-lookup response and merge it into ``result``.
+
+    Names of the chunk absent from the response do not exist and are cached
+    as negative entries.
+    """
+    found = {entry["name"].lower(): entry["id"] for entry in data if "id" in entry}
+    for name in chunk:
+        uuid = found.get(name.lower())
+        cache.set(name, uuid)
+        result[name] = uuid
+
+
+def _report_bulk_lookups(hooks: Hooks, result: dict, chunks: list) -> None:
+    """Report the UUID cache hits and misses of a bulk name lookup."""
+    misses = sum(len(chunk) for chunk in chunks)
+    if len(result) > misses:
+        hooks.on_cache("uuid", HIT, len(result) - misses)
+    if misses:
+        hooks.on_cache("uuid", MISS, misses)
+
+
+def _response_size(response, stream: bool) -> int:
+    """Size of a response body, from ``Content-Length`` if it is streamed."""
+    if stream:
+        return _header_int(response.headers, "Content-Length") or 0
+    return len(response.content)
+
+
+def _wrap_profile(entry: dict, uuid: str, fetched_at: float) -> SkyblockProfileData:
+    """Wrap one entry of a profiles response like a ``/v2/skyblock/profile`` body."""
+    return SkyblockProfileData({"success": True, "profile": entry}, uuid, fetched_at)
+
+
+def _parse_profiles(data: dict, uuid: str, fetched_at: float) -> dict:
+    """Build a ``{cute_name: SkyblockProfileData}`` mapping from a profiles response.
+
+    Args:
+        data: Decoded JSON body of the ``/v2/skyblock/profiles`` endpoint.
+        uuid: Minecraft UUID the profiles were requested for.
+        fetched_at: Unix time the response was received.
+
+    Returns:
+        A mapping ``{profile_name: SkyblockProfileData}``; empty if the player
+        has no SkyBlock profiles.
+
+    Raises:
+        Exception: If Hypixel returns ``success=false`` (API-level error).
+    """
+    _check_api_response(data)
+    return {
+        entry["cute_name"]: _wrap_profile(entry, uuid, fetched_at)
+        for entry in data.get("profiles") or []
+    }
+
+
+def _parse_selected_profile(
+    data: dict, uuid: str, fetched_at: float
+) -> SkyblockProfileData | None:
+    """Get the ``selected`` profile of a profiles response, or None if there is none.
+
+    Raises:
+        Exception: If Hypixel returns ``success=false`` (API-level error).
+    """
+    _check_api_response(data)
+    try:
+        selected = _select_profile(data.get("profiles"), None)
+        return _wrap_profile(selected, uuid, fetched_at)
+    except LookupError:
+        return None
+
+
+def _parse_profile_names(data: dict) -> dict:
+    """Build a ``{cute_name: profile_id}`` mapping from a profiles response.
+
+    Args:
+        data: Decoded JSON body of the ``/v2/skyblock/profiles`` endpoint.
+
+    Returns:
+        A mapping ``{profile_name: profile_id}``.
+    """
+    names = {}
+
+    for i in data["profiles"]:
+        names[i["cute_name"]] = i["profile_id"]
+
+    return names
+
+
+def _walk(data, *keys) -> dict:
+    """Follow ``keys`` into nested dicts, returning ``{}`` if any level is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return {}
+        data = data.get(key)
+    return data if isinstance(data, dict) else {}
+
+
+def _level_and_xp(xp, cumulative_levels: list, offset: int = 0) -> dict:
+    """Level and in-level XP progress, as returned by the bulk accessors."""
+    xp = int(xp)
+    level = bisect_right(cumulative_levels, xp)
+    current = xp - cumulative_levels[level - 1] if level else xp
+    return {"level": level - offset, "xp": current}
+
+
+def _claimed_slayer_level(boss: dict) -> int:
+    """Highest ``level_N`` key in a slayer boss's ``claimed_levels``."""
+    max_level = 0
+    for level_key in boss.get("claimed_levels", {}):
+        if level_key.startswith("level_"):
+            try:
+                max_level = max(max_level, int(level_key.split("_")[1]))
+            except (IndexError, ValueError):
+                continue
+    return max_level
+
+
+class FetchResult(NamedTuple):
+    """Outcome of a single lookup in :meth:`HypixelClient.fetch_many`.
+
+    Attributes:
+        query: The username or UUID that was requested.
+        data: Fetched profile, or None if the lookup failed.
+        error: The exception raised by the lookup, or None on success.
+    """
+
+    query: str
+    data: SkyblockProfileData | None
+    error: Exception | None
+
+
 class HypixelClient:
     """HTTP client for the Hypixel SkyBlock API.
 
@@ -234,31 +530,322 @@ class HypixelClient:
         self,
         api_key: str,
         debug=_DEBUG_,
-        base_url="https://api.hypixel.net/v2/skyblock/profile",
+        base_url=_PROFILE_URL_,
+        rate_limiter: RateLimiter | None = None,
+        uuid_cache: UUIDCache | None = None,
+        response_cache: ResponseCache | None = None,
+        transport: TransportConfig | None = None,
+        json_decoder: str | JSONDecoder = "json",
+        hooks: Hooks | None = None,
+        profiles_url: str = _PROFILES_URL_,
+        mojang_url: str = _MOJANG_PROFILE_URL_,
+        mojang_bulk_url: str = _MOJANG_BULK_URL_,
     ):
         """Create a Hypixel API client.
 
         Args:
             api_key: Hypixel API key (get one at https://developer.hypixel.net/).
             debug: If True, enables debug logging; otherwise uses info-level logging.
+                If None, logging is not configured at all (see
+                :func:`hypixelez.logger.setup_queue_logging`).
             base_url: Hypixel endpoint used by :meth:`fetch_profile_info`.
+            rate_limiter: Limiter pacing Hypixel requests. Pass the same instance to
+                every client using the same API key. A new one is created if omitted.
+            uuid_cache: Cache used by :meth:`get_uuid_by_name`. Defaults to a
+                :class:`~hypixelez.cache.MemoryUUIDCache`; wrap a
+                :class:`~hypixelez.cache.SQLiteUUIDCache` to persist it.
+            response_cache: Optional :class:`~hypixelez.cache.ResponseCache` for
+                Hypixel profile responses. Disabled by default.
+            transport: Connection pool, timeout, retry and circuit breaker
+                settings applied to every endpoint (Hypixel and Mojang).
+            json_decoder: Backend decoding response bodies: ``"json"`` (stdlib),
+                ``"orjson"``, ``"msgspec"``, ``"auto"`` or a callable taking
+                ``bytes``. See :func:`hypixelez.decoders.get_decoder`.
+            hooks: Optional :class:`~hypixelez.metrics.Hooks` notified of
+                requests, retries, decoding and cache lookups, e.g. a
+                :class:`~hypixelez.metrics.MetricsCollector`. Disabled by default.
+            profiles_url: Hypixel endpoint listing the profiles of a player.
+            mojang_url: Mojang username lookup URL, with a ``{name}`` field.
+            mojang_bulk_url: Mojang bulk username lookup URL. Together with
+                ``base_url`` and ``profiles_url``, these point the client at
+                another server, e.g. :class:`~hypixelez.fakeserver.FakeHypixelServer`.
 
         Notes:
-            - Initializes an internal `requests.Session`.
-            - Maintains an in-memory UUID cache for `get_uuid_by_name`.
+            - The `requests.Session` and the logging setup are deferred until the
+              first request (see :attr:`session`).
         """
-        setup_logging(debug)
+        self._debug = debug
+        self._logging_configured = False
         self.logger = get_logger(_LOGGER_NAME_)
-        self._uuid_cache = {}
+        self._uuid_cache = uuid_cache if uuid_cache is not None else MemoryUUIDCache()
 
         self.api_key = api_key
-        self.session = requests.Session()
+        self.transport = transport or TransportConfig()
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
         self.base_url = base_url
+        self.profiles_url = profiles_url
+        self.mojang_url = mojang_url
+        self.mojang_bulk_url = mojang_bulk_url
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.response_cache = response_cache
+        self._decode = get_decoder(json_decoder)
+        self.hooks = hooks
+        self._flights = SingleFlight()
+        self._breakers: dict[str, CircuitBreaker | None] = {}
+        self._breakers_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The ``requests.Session`` used for every request.
+
+        It is built from ``transport``, and logging is configured, on first
+        access rather than in the constructor, so that creating a client that
+        never sends a request imports neither ``requests`` nor touches logging.
+        """
+        if self._session is None or not self._logging_configured:
+            with self._session_lock:
+                if not self._logging_configured:
+                    setup_logging(self._debug)
+                    self._logging_configured = True
+                if self._session is None:
+                    self._session = self.transport.build_session()
+        return self._session
+
+    @session.setter
+    def session(self, session) -> None:
+        self._session = session
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker | None:
+        with self._breakers_lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = self.transport.make_breaker()
+            return self._breakers[endpoint]
+
+    def _request(
+        self, endpoint: str, method: str, url: str, rate_limited=False, **kwargs
+    ) -> requests.Response:
+        """Send a request through the session, applying the transport policy.
+
+        Connection errors, timeouts and responses with a retryable status are
+        retried with exponential backoff and jitter. Rate-limited (Hypixel)
+        requests also wait for the rate limiter and feed it the response headers.
+
+        Args:
+            endpoint: Endpoint name, used for the circuit breaker and logs.
+            method: Session method name (``"get"`` or ``"post"``).
+            url: Request URL.
+            rate_limited: Whether the request counts against the Hypixel key limit.
+            **kwargs: Passed to the session method.
+
+        Returns:
+            The HTTP response. A retryable status is returned only once the
+            retries are exhausted.
+
+        Raises:
+            requests.RequestException: If the last attempt fails with a network
+                error.
+            CircuitOpenError: If the endpoint's circuit is open.
+        """
+        import requests
+
+        transport = self.transport
+        breaker = self._breaker(endpoint)
+        send = getattr(self.session, method)
+        hooks = self.hooks
+
+        for attempt in range(transport.max_retries + 1):
+            last_attempt = attempt == transport.max_retries
+            if breaker is not None:
+                breaker.before_request(endpoint)
+            try:
+                if rate_limited:
+                    self._acquire(endpoint)
+                if hooks is not None:
+                    started = time.perf_counter()
+                response = send(url, timeout=transport.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if hooks is not None:
+                    hooks.on_request(endpoint, None, time.perf_counter() - started, 0)
+                if breaker is not None:
+                    breaker.record_failure()
+                if last_attempt:
+                    raise
+                delay = transport.backoff(attempt)
+                self.logger.warning(
+                    "%s request failed (%s), retry in %.2fs", endpoint, e, delay
+                )
+                if hooks is not None:
+                    hooks.on_retry(endpoint, type(e).__name__, delay)
+                time.sleep(delay)
+                continue
+            except Exception:
+                # e.g. ChunkedEncodingError: the endpoint failed, but not in a
+                # way worth retrying
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                # Interrupted: no outcome, but the trial request must be freed
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            status = response.status_code
+            if hooks is not None:
+                hooks.on_request(
+                    endpoint,
+                    status,
+                    time.perf_counter() - started,
+                    _response_size(response, kwargs.get("stream", False)),
+                )
+            if rate_limited:
+                self.rate_limiter.update(response.headers)
+            if breaker is not None:
+                if transport.is_server_error(status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if last_attempt or not transport.is_retryable(status):
+                return response
+            # Release the pooled connection of the discarded (possibly streamed)
+            # response before waiting
+            response.close()
+
+            if status == 429:
+                delay = transport.backoff(attempt, retry_after(response.headers))
+                self.logger.warning(
+                    "%s rate limit hit, retry in %.2fs", endpoint, delay
+                )
+                if hooks is not None:
+                    hooks.on_throttle(endpoint, delay)
+                    hooks.on_retry(endpoint, str(status), delay)
+                if rate_limited:
+                    # The limiter makes the next acquire() wait
+                    self.rate_limiter.throttle(delay)
+                    continue
+            else:
+                delay = transport.backoff(attempt)
+                self.logger.warning(
+                    "%s returned %s, retry in %.2fs", endpoint, status, delay
+                )
+                if hooks is not None:
+                    hooks.on_retry(endpoint, str(status), delay)
+            time.sleep(delay)
+
+        raise AssertionError("TransportConfig rejects a negative max_retries")
+
+    def _acquire(self, endpoint: str) -> None:
+        """Wait for the rate limiter, reporting the wait to the hooks."""
+        if self.hooks is None:
+            self.rate_limiter.acquire()
+            return
+        started = time.perf_counter()
+        self.rate_limiter.acquire()
+        self.hooks.on_rate_limit_wait(endpoint, time.perf_counter() - started)
+
+    def _decode_body(self, endpoint: str, body: bytes):
+        """Decode a response body, reporting the decode time to the hooks."""
+        if self.hooks is None:
+            return self._decode(body)
+        started = time.perf_counter()
+        data = self._decode(body)
+        self.hooks.on_decode(endpoint, time.perf_counter() - started, len(body))
+        return data
+
+    def _hypixel_get(
+        self, endpoint: str, url: str, params: dict, **kwargs
+    ) -> requests.Response:
+        """Send a rate-limited GET request to a Hypixel endpoint."""
+        headers = {
+            "API-Key": self.api_key,
+        }
+
+        return self._request(
+            endpoint,
+            "get",
+            url,
+            rate_limited=True,
+            headers=headers,
+            params=params,
+            **kwargs,
+        )
+
+    def _hypixel_get_json(self, endpoint: str, url: str, params: dict) -> tuple:
+        """GET a Hypixel endpoint and decode its JSON body.
+
+        Concurrent calls for the same endpoint, UUID and profile share a single
+        request. If a response cache is configured, fresh entries are served
+        without a request, and stale entries are served while a background
+        thread refreshes them.
+
+        Args:
+            endpoint: Endpoint name used by the response cache.
+            url: Hypixel endpoint URL.
+            params: Query parameters; must contain ``uuid``.
+
+        Returns:
+            A tuple ``(data, fetched_at)``: the decoded body and the Unix time it
+            was received, or stored for a response cache hit.
+
+        Raises:
+            requests.RequestException: For network issues or non-2xx HTTP status.
+        """
+        key = (endpoint, params["uuid"], params.get("profile"))
+        return self._flights.do(key, self._load_hypixel_json, endpoint, url, params)
+
+    def _load_hypixel_json(self, endpoint: str, url: str, params: dict) -> tuple:
+        cache = self.response_cache
+        if cache is None:
+            response = self._hypixel_get(endpoint, url, params)
+            fetched_at = time.time()
+            response.raise_for_status()
+            return self._decode_body(endpoint, response.content), fetched_at
+
+        key = cache.make_key(endpoint, params["uuid"], params.get("profile"))
+        body, state, stored_at = cache.lookup(endpoint, key)
+        if self.hooks is not None:
+            self.hooks.on_cache("response", HIT if state == FRESH else state)
+        if state == STALE and cache.begin_refresh(key):
+            threading.Thread(
+                target=self._refresh_cached,
+                args=(cache, endpoint, url, params, key),
+                daemon=True,
+            ).start()
+        if body is not None:
+            self.logger.debug("Response cache %s HIT for: %s", state, key)
+            return self._decode_body(endpoint, body), stored_at
+
+        return self._fetch_and_cache(cache, endpoint, url, params, key)
+
+    def _fetch_and_cache(
+        self, cache: ResponseCache, endpoint: str, url: str, params: dict, key: str
+    ) -> tuple:
+        response = self._hypixel_get(endpoint, url, params)
+        fetched_at = time.time()
+        response.raise_for_status()
+        body = response.content
+        data = self._decode_body(endpoint, body)
+        if data.get("success"):
+            cache.put(endpoint, key, body)
+        return data, fetched_at
+
+    def _refresh_cached(
+        self, cache: ResponseCache, endpoint: str, url: str, params: dict, key: str
+    ) -> None:
+        try:
+            self._fetch_and_cache(cache, endpoint, url, params, key)
+        except Exception as e:
+            self.logger.warning("Failed to refresh cached response %s: %s", key, e)
+        finally:
+            cache.end_refresh(key)
 
     def get_uuid_by_name(self, name: str) -> str | None:
         """Resolve a Minecraft username to a UUID using Mojang API.
 
-        The result is cached in-memory for the lifetime of the client.
+        Results, including "player not found" answers, are stored in the
+        client's UUID cache. Concurrent lookups of the same name share a
+        single request.
 
         Args:
             name: Minecraft username.
@@ -269,31 +856,85 @@ class HypixelClient:
 
         Notes:
             This method currently swallows `requests` exceptions and returns None
-            instead of raising.
+            instead of raising. Network errors are not cached.
         """
+        cached = self._uuid_cache.get(name, _MISSING)
+        if self.hooks is not None:
+            self.hooks.on_cache("uuid", MISS if cached is _MISSING else HIT)
+        if cached is not _MISSING:
+            self.logger.debug("UUID cache HIT for: %s", name)
+            return cached
 
-        if name in self._uuid_cache:
-            self.logger.debug(f"UUID cache HIT for: {name}")
-            return self._uuid_cache[name]
+        return self._flights.do(("uuid", name.lower()), self._fetch_uuid, name)
+
+    def _fetch_uuid(self, name: str) -> str | None:
+        import requests
 
         try:
-            response = requests.get(
-                f"https://api.mojang.com/users/profiles/minecraft/{name}", timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            response = self._request("mojang", "get", self.mojang_url.format(name=name))
+            if response.status_code in (204, 404):
+                data = {}
+            else:
+                response.raise_for_status()
+                data = self._decode_body("mojang", response.content)
 
             if "id" not in data:
-                self.logger.warning(f"UUID not found for player: {name}")
+                self.logger.warning("UUID not found for player: %s", name)
+                self._uuid_cache.set(name, None)
                 return None
-            self._uuid_cache[name] = data["id"]
-            self.logger.debug(f"Cached UUID for: {name}")
-            return self._uuid_cache[name]
+            self._uuid_cache.set(name, data["id"])
+            self.logger.debug("Cached UUID for: %s", name)
+            return data["id"]
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch UUID for {name}: {e}")
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
+            self.logger.error("Failed to fetch UUID for %s: %s", name, e)
             return None
 
+    def get_uuids_by_names(self, names: Iterable[str], max_workers: int = 4) -> dict:
+        """Resolve many Minecraft usernames to UUIDs using Mojang bulk lookup.
+
+        Names already in the UUID cache are not requested again; the rest are
+        sent in chunks of up to 10 names per request, with chunks running
+        concurrently.
+
+        Args:
+            names: Minecraft usernames. Case-insensitive duplicates are ignored.
+            max_workers: Maximum number of chunk requests running concurrently.
+
+        Returns:
+            A mapping ``{name: uuid}`` for every requested name. The UUID is None
+            for names that do not exist or whose chunk failed with a network error.
+        """
+        result, chunks = _chunk_uncached_names(names, self._uuid_cache)
+        if self.hooks is not None:
+            _report_bulk_lookups(self.hooks, result, chunks)
+        if not chunks:
+            return result
+
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._post_bulk_names, chunk): chunk for chunk in chunks
+            }
+            for future in futures:
+                chunk = futures[future]
+                try:
+                    _store_bulk_result(chunk, future.result(), self._uuid_cache, result)
+                except (requests.exceptions.RequestException, CircuitOpenError) as e:
+                    self.logger.error("Failed to fetch UUIDs for %s: %s", chunk, e)
+
+        return result
+
+    def _post_bulk_names(self, chunk: list) -> list:
+        """Send one Mojang bulk lookup request for up to 10 names."""
+        response = self._request(
+            "mojang_bulk", "post", self.mojang_bulk_url, json=chunk
+        )
+        response.raise_for_status()
+        return self._decode_body("mojang_bulk", response.content)
+
     def get_profile_names_ids_by_id(self, uuid: str) -> dict:
         """Get available SkyBlock profiles for a player UUID.
 
@@ -310,31 +951,37 @@ class HypixelClient:
         Notes:
             This method currently assumes the response contains a ``"profiles"`` key.
         """
-        headers = {
-            "API-Key": self.api_key,
-        }
-        params = {"uuid": uuid}
-
-        response = self.session.get(
-            "https://api.hypixel.net/v2/skyblock/profiles",
-            headers=headers,
-            params=params,
-        ).json()
-        x = response["profiles"]
+        data, _ = self._get_profiles(uuid)
+        return _parse_profile_names(data)
 
-        names = {}
+    def _get_profiles(self, uuid: str) -> tuple:
+        """Fetch the raw ``/v2/skyblock/profiles`` response for a player UUID.
 
-        for i in x:
-            names[i["cute_name"]] = i["profile_id"]
+        Returns:
+            A tuple ``(data, fetched_at)``, see :meth:`_hypixel_get_json`.
+        """
+        params = {"uuid": uuid}
 
-        return names
+        return self._hypixel_get_json("profiles", self.profiles_url, params)
 
-    def fetch_profile_info(self, uuid: str, profile: str):
+    def fetch_profile_info(
+        self,
+        uuid: str,
+        profile: str,
+        stream: bool = False,
+        fields: Iterable[str] | None = None,
+    ):
         """Fetch full SkyBlock profile data and wrap it in :class:`SkyblockProfileData`.
 
         Args:
             uuid: Minecraft UUID.
             profile: SkyBlock profile id.
+            stream: Parse the response body incrementally and keep only the
+                member ``uuid`` (see :func:`hypixelez.streaming.parse_member`).
+                Useful for large co-op profiles. Streamed responses bypass the
+                response cache.
+            fields: Member sections to keep, e.g. ``{"player_data", "slayer"}``.
+                Implies ``stream=True``. All sections are kept if None.
 
         Returns:
             A :class:`SkyblockProfileData` instance with the raw API response and UUID.
@@ -347,22 +994,155 @@ class HypixelClient:
             On API-level errors the code currently raises a generic `Exception`.
             Consider introducing a custom exception type for better UX and docs.
         """
-        headers = {
-            "API-Key": self.api_key,
-        }
         params = {"uuid": uuid, "profile": profile}
 
+        if stream or fields is not None:
+            fields = None if fields is None else frozenset(fields)
+            return self._flights.do(
+                ("profile_member", uuid, profile, fields),
+                self._fetch_member,
+                uuid,
+                params,
+                fields,
+            )
+
+        data, fetched_at = self._hypixel_get_json("profile", self.base_url, params)
+        _check_api_response(data)
+
+        return SkyblockProfileData(data, uuid, fetched_at)
+
+    def _fetch_member(
+        self, uuid: str, params: dict, fields: frozenset | None
+    ) -> SkyblockProfileData:
+        from .streaming import parse_member
+
+        response = self._hypixel_get("profile", self.base_url, params, stream=True)
         try:
-            response = self.session.get(self.base_url, headers=headers, params=params)
             response.raise_for_status()
-            data = response.json()
+            response.raw.decode_content = True
+            if self.hooks is not None:
+                started = time.perf_counter()
+            data = parse_member(response.raw, uuid, fields, decode=self._decode)
+            if self.hooks is not None:
+                size = _response_size(response, stream=True)
+                self.hooks.on_decode("profile", time.perf_counter() - started, size)
+        finally:
+            response.close()
+
+        return SkyblockProfileData(data, uuid)
+
+    def fetch_all_profiles(self, uuid: str) -> dict:
+        """Fetch every SkyBlock profile of a player with a single request.
 
-            if not data["success"]:
-                raise Exception(f"API Error: {data.get('cause', 'Unknown error')}")
+        Uses the ``/v2/skyblock/profiles`` response, which already contains the
+        full profile bodies, so no :meth:`fetch_profile_info` call is needed.
 
-            return SkyblockProfileData(data, uuid)
-        except requests.exceptions.RequestException as e:
-            raise e
+        Args:
+            uuid: Minecraft UUID (without dashes).
+
+        Returns:
+            A mapping ``{profile_name: SkyblockProfileData}``, where profile_name is
+            the Hypixel "cute_name" (e.g. "Peach"). Empty if the player has no
+            SkyBlock profiles.
+
+        Raises:
+            requests.RequestException: For network issues.
+            Exception: If Hypixel returns ``success=false`` (API-level error).
+        """
+        data, fetched_at = self._get_profiles(uuid)
+        return _parse_profiles(data, uuid, fetched_at)
+
+    def fetch_selected_profile(self, uuid: str) -> SkyblockProfileData | None:
+        """Fetch the profile the player currently has selected, with a single request.
+
+        Args:
+            uuid: Minecraft UUID (without dashes).
+
+        Returns:
+            A :class:`SkyblockProfileData` instance, or None if the player has no
+            selected SkyBlock profile.
+
+        Raises:
+            requests.RequestException: For network issues.
+            Exception: If Hypixel returns ``success=false`` (API-level error).
+        """
+        data, fetched_at = self._get_profiles(uuid)
+        return _parse_selected_profile(data, uuid, fetched_at)
+
+    def fetch_many(
+        self,
+        names_or_uuids: Iterable[str],
+        max_workers: int = 8,
+        profile: str | None = None,
+    ) -> Generator[FetchResult, None, None]:
+        """Fetch profiles for many players concurrently.
+
+        Each item goes through the whole chain (username -> UUID -> profiles) on a
+        thread pool sharing this client's ``session``. Profiles selected by cute
+        name or ``selected`` flag are taken from the profiles response directly.
+        Results are yielded in completion order, not input order.
+
+        Args:
+            names_or_uuids: Minecraft usernames and/or UUIDs. May be a lazy iterable;
+                at most ``2 * max_workers`` items are scheduled at a time.
+            max_workers: Maximum number of lookups running concurrently.
+            profile: Profile id or cute name (e.g. "Peach") to fetch for every
+                player. If None, each player's selected profile is fetched.
+
+        Yields:
+            A :class:`FetchResult` per input item. Failures do not stop the
+            iteration; the exception is returned in ``FetchResult.error``, and is
+            a :class:`NotFoundError` if the player or profile does not exist.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        items = iter(names_or_uuids)
+        pending = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while True:
+                    for query in items:
+                        future = executor.submit(self._fetch_one, query, profile)
+                        pending[future] = query
+                        if len(pending) >= 2 * max_workers:
+                            break
+
+                    if not pending:
+                        return
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        query = pending.pop(future)
+                        try:
+                            yield FetchResult(query, future.result(), None)
+                        except Exception as e:
+                            yield FetchResult(query, None, e)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _fetch_one(self, name_or_uuid: str, profile: str | None) -> SkyblockProfileData:
+        """Run the full lookup chain for one player (used by :meth:`fetch_many`)."""
+        if _is_uuid(name_or_uuid):
+            uuid = name_or_uuid.replace("-", "")
+        else:
+            found = self.get_uuid_by_name(name_or_uuid)
+            if found is None:
+                # get_uuid_by_name() also returns None on network errors, but
+                # only caches players that do not exist
+                if self._uuid_cache.get(name_or_uuid, _MISSING) is None:
+                    raise NotFoundError(f"UUID not found for player: {name_or_uuid}")
+                raise LookupError(f"UUID lookup failed for player: {name_or_uuid}")
+            uuid = found
+
+        if profile is not None and _is_uuid(profile):
+            return self.fetch_profile_info(uuid, profile)
+
+        data, fetched_at = self._get_profiles(uuid)
+        _check_api_response(data)
+        entry = _select_profile(data.get("profiles"), profile)
+        return _wrap_profile(entry, uuid, fetched_at)
 
 
 class SkyblockProfileData:
@@ -370,19 +1150,54 @@ class SkyblockProfileData:
 
     Most getter methods are "safe": if the requested data is missing, they return
     a default value (usually 0 or an empty list) and log a warning.
+
+    The member's data and each of its sections are resolved on first use and
+    memoized, so every getter is a single lookup into an already resolved section.
     """
 
-    def __init__(self, raw_data, uuid):
+    def __init__(self, raw_data, uuid, fetched_at: float | None = None):
         """Create a profile data wrapper.
 
         Args:
             raw_data: Full JSON response from Hypixel profile endpoint.
             uuid: Minecraft UUID of the requested player (used to select member data).
+            fetched_at: Unix timestamp of the data. Client methods pass the time
+                the response was received, or stored for a response cache hit.
+                Defaults to now.
         """
         self._data = raw_data
         self._uuid = uuid
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
         self._logger = get_logger(_LOGGER_NAME_)
 
+    @cached_property
+    def _member(self) -> dict:
+        return _walk(self._data, "profile", "members", self._uuid)
+
+    @cached_property
+    def _collection(self) -> dict:
+        return _walk(self._member, "collection")
+
+    @cached_property
+    def _experience(self) -> dict:
+        return _walk(self._member, "player_data", "experience")
+
+    @cached_property
+    def _catacombs(self) -> dict:
+        return _walk(self._member, "dungeons", "dungeon_types", "catacombs")
+
+    @cached_property
+    def _player_classes(self) -> dict:
+        return _walk(self._member, "dungeons", "player_classes")
+
+    @cached_property
+    def _slayer_bosses(self) -> dict:
+        return _walk(self._member, "slayer", "slayer_bosses")
+
+    @cached_property
+    def _leveling(self) -> dict:
+        return _walk(self._member, "leveling")
+
     def get_collection(self, collection_name: CollectionKey | str) -> int:
         """Get the amount collected for a specific collection.
 
@@ -394,11 +1209,9 @@ class SkyblockProfileData:
             Collection amount if present, otherwise 0.
         """
         try:
-            return self._data["profile"]["members"][self._uuid]["collection"][
-                collection_name
-            ]
+            return self._collection[collection_name]
         except (KeyError, ValueError):
-            self._logger.warning(f"Collection '{collection_name}' not found")
+            self._logger.warning("Collection '%s' not found", collection_name)
             return 0
 
     def get_slayer_stats(self, slayer_name) -> list:
@@ -416,19 +1229,10 @@ class SkyblockProfileData:
             If you need stable ordering (tier1..tierN), consider sorting keys.
         """
         try:
-            stats = list()
-            for i in self._data["profile"]["members"][self._uuid]["slayer"][
-                "slayer_bosses"
-            ][slayer_name]:
-                if "boss_kills_tier" in i:
-                    stats.append(
-                        self._data["profile"]["members"][self._uuid]["slayer"][
-                            "slayer_bosses"
-                        ][slayer_name][i]
-                    )
-            return stats
+            boss = self._slayer_bosses[slayer_name]
+            return [value for key, value in boss.items() if "boss_kills_tier" in key]
         except (KeyError, ValueError):
-            self._logger.warning(f"Slayer '{slayer_name}' not found")
+            self._logger.warning("Slayer '%s' not found", slayer_name)
             return []
 
     def get_skill_level(self, skill_name) -> int:
@@ -441,14 +1245,10 @@ class SkyblockProfileData:
             Skill level if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["player_data"][
-                    "experience"
-                ][skill_name]
-            )
+            xp = int(self._experience[skill_name])
             return _calculate_level(xp, _SKILL_CUMULATIVE_LEVELS_) - 1
         except (KeyError, ValueError):
-            self._logger.warning(f"Skill '{skill_name}' not found")
+            self._logger.warning("Skill '%s' not found", skill_name)
             return 0
 
     def get_skill_current_level_xp(self, skill_name) -> int:
@@ -461,15 +1261,11 @@ class SkyblockProfileData:
             Current level XP progress if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["player_data"][
-                    "experience"
-                ][skill_name]
-            )
+            xp = int(self._experience[skill_name])
 
             return _calculate_current_xp(xp, _SKILL_CUMULATIVE_LEVELS_)
         except (KeyError, ValueError):
-            self._logger.warning(f"Skill '{skill_name}' not found")
+            self._logger.warning("Skill '%s' not found", skill_name)
             return 0
 
     def get_cata_xp(self) -> int:
@@ -479,14 +1275,10 @@ class SkyblockProfileData:
             Current Catacombs level XP progress if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["dungeons"][
-                    "dungeon_types"
-                ]["catacombs"]["experience"]
-            )
+            xp = int(self._catacombs["experience"])
             return _calculate_current_xp(xp, _CATA_CUMULATIVE_XP_)
         except (KeyError, ValueError):
-            self._logger.warning(f"Catacomb not found")
+            self._logger.warning("Catacomb not found")
             return 0
 
     def get_cata_level(self) -> int:
@@ -496,14 +1288,10 @@ class SkyblockProfileData:
             Catacombs level if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["dungeons"][
-                    "dungeon_types"
-                ]["catacombs"]["experience"]
-            )
+            xp = int(self._catacombs["experience"])
             return _calculate_level(xp, _CATA_CUMULATIVE_XP_)
         except (KeyError, ValueError):
-            self._logger.warning(f"Catacomb not found")
+            self._logger.warning("Catacomb not found")
             return 0
 
     def get_cata_class_xp(self, class_name) -> int:
@@ -516,14 +1304,10 @@ class SkyblockProfileData:
             Current class level XP progress if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["dungeons"][
-                    "player_classes"
-                ][class_name]["experience"]
-            )
+            xp = int(self._player_classes[class_name]["experience"])
             return _calculate_current_xp(xp, _CATA_CUMULATIVE_XP_)
         except (KeyError, ValueError):
-            self._logger.warning(f"Class '{class_name}' not found")
+            self._logger.warning("Class '%s' not found", class_name)
             return 0
 
     def get_cata_class_level(self, class_name) -> int:
@@ -536,14 +1320,10 @@ class SkyblockProfileData:
             Class level if present, otherwise 0.
         """
         try:
-            xp = int(
-                self._data["profile"]["members"][self._uuid]["dungeons"][
-                    "player_classes"
-                ][class_name]["experience"]
-            )
+            xp = int(self._player_classes[class_name]["experience"])
             return _calculate_level(xp, _CATA_CUMULATIVE_XP_)
         except (KeyError, ValueError):
-            self._logger.warning(f"Class '{class_name}' not found")
+            self._logger.warning("Class '%s' not found", class_name)
             return 0
 
     def get_slayer_xp(self, slayer_name) -> int:
@@ -556,10 +1336,8 @@ class SkyblockProfileData:
             Total slayer XP if present, otherwise 0.
         """
         try:
-            slayer_data = self._data["profile"]["members"][self._uuid]["slayer"][
-                "slayer_bosses"
-            ][slayer_name]
-            return slayer_data.get("xp", 0)  # Явно обращаемся к полю xp
+            # Явно обращаемся к полю xp
+            return self._slayer_bosses[slayer_name].get("xp", 0)
         except KeyError:
             return 0
 
@@ -573,21 +1351,9 @@ class SkyblockProfileData:
             Highest claimed slayer level if present, otherwise 0.
         """
         try:
-            claimed_levels = self._data["profile"]["members"][self._uuid]["slayer"][
-                "slayer_bosses"
-            ][slayer_name].get("claimed_levels", {})
-            max_level = 0
-
-            for level_key in claimed_levels:
-                if level_key.startswith("level_"):
-                    try:
-                        level = int(level_key.split("_")[1])
-                        max_level = max(max_level, level)
-                    except (IndexError, ValueError):
-                        continue
-            return max_level
+            return _claimed_slayer_level(self._slayer_bosses[slayer_name])
         except (KeyError, ValueError):
-            self._logger.warning(f"Slayer '{slayer_name}' not found")
+            self._logger.warning("Slayer '%s' not found", slayer_name)
             return 0
 
     def get_slayer_stats_by_tier(self, slayer_name, tier) -> int:
@@ -606,7 +1372,9 @@ class SkyblockProfileData:
         try:
             return self.get_slayer_stats(slayer_name)[tier - 1]
         except (KeyError, ValueError):
-            self._logger.warning(f"Slayer '{slayer_name}' with tier '{tier}' not found")
+            self._logger.warning(
+                "Slayer '%s' with tier '%s' not found", slayer_name, tier
+            )
             return 0
 
     def get_global_level(self) -> int:
@@ -619,10 +1387,10 @@ class SkyblockProfileData:
             The current implementation derives level as ``experience // 100``.
         """
         try:
-            xp = self._data["profile"]["members"][self._uuid]["leveling"]["experience"]
+            xp = self._leveling["experience"]
             return xp // 100
         except (KeyError, ValueError):
-            self._logger.warning(f"Global level not found")
+            self._logger.warning("Global level not found")
             return 0
 
     def get_global_xp(self) -> int:
@@ -635,8 +1403,98 @@ class SkyblockProfileData:
             The current implementation derives progress as ``experience % 100``.
         """
         try:
-            xp = self._data["profile"]["members"][self._uuid]["leveling"]["experience"]
+            xp = self._leveling["experience"]
             return xp % 100
         except (KeyError, ValueError):
-            self._logger.warning(f"Global xp not found")
+            self._logger.warning("Global xp not found")
             return 0
+
+    def get_all_skills(self) -> dict:
+        """Get the level and current level XP of every skill in one pass.
+
+        Returns:
+            ``{skill: {"level": int, "xp": int}}`` for every
+            :class:`~hypixelez.constants.SkillKey`. Missing skills are level 0.
+        """
+        from .constants import SkillKey
+
+        experience = self._experience
+        return {
+            key.value: _level_and_xp(
+                experience.get(key.value, 0), _SKILL_CUMULATIVE_LEVELS_, offset=1
+            )
+            for key in SkillKey
+        }
+
+    def get_all_collections(self) -> dict:
+        """Get every collection amount in one pass.
+
+        Returns:
+            ``{collection: amount}`` for every
+            :class:`~hypixelez.constants.CollectionKey` (0 if missing), plus any
+            other collection present in the profile.
+        """
+        from .constants import CollectionKey
+
+        collections = {key.value: 0 for key in CollectionKey}
+        collections.update(self._collection)
+        return collections
+
+    def get_all_slayers(self) -> dict:
+        """Get the level, XP and tier kills of every slayer in one pass.
+
+        Returns:
+            ``{slayer: {"level": int, "xp": int, "kills": list}}`` for every
+            :class:`~hypixelez.constants.SlayerKey`. ``xp`` is the total slayer
+            XP, as in :meth:`get_slayer_xp`.
+        """
+        from .constants import SlayerKey
+
+        slayers = {}
+        for key in SlayerKey:
+            boss = self._slayer_bosses.get(key.value, {})
+            slayers[key.value] = {
+                "level": _claimed_slayer_level(boss),
+                "xp": boss.get("xp", 0),
+                "kills": [
+                    value for name, value in boss.items() if "boss_kills_tier" in name
+                ],
+            }
+        return slayers
+
+    def get_all_dungeon_classes(self) -> dict:
+        """Get the level and current level XP of every dungeon class in one pass.
+
+        Returns:
+            ``{class: {"level": int, "xp": int}}`` for every
+            :class:`~hypixelez.constants.DungeonClassKey`.
+        """
+        from .constants import DungeonClassKey
+
+        classes = self._player_classes
+        return {
+            key.value: _level_and_xp(
+                classes.get(key.value, {}).get("experience", 0), _CATA_CUMULATIVE_XP_
+            )
+            for key in DungeonClassKey
+        }
+
+    def summary(self) -> dict:
+        """Get every value a profile card needs, without logging on missing data.
+
+        Returns:
+            A dict with ``global`` and ``catacombs`` (``{"level", "xp"}``), and
+            ``skills``, ``collections``, ``slayers`` and ``dungeon_classes`` as
+            returned by the ``get_all_*`` methods.
+        """
+        global_xp = self._leveling.get("experience", 0)
+        return {
+            "global": {"level": global_xp // 100, "xp": global_xp % 100},
+            "catacombs": _level_and_xp(
+                self._catacombs.get("experience", 0), _CATA_CUMULATIVE_XP_
+            ),
+            "skills": self.get_all_skills(),
+            "collections": self.get_all_collections(),
+            "slayers": self.get_all_slayers(),
+            "dungeon_classes": self.get_all_dungeon_classes(),
+        }
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from .hypixel_api import SkyblockProfileData
+from .snapshot import METRIC_INDEX, METRICS, ProfileSnapshot
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # pragma: no cover - optional dependency
+    SortedList = None
+
+
+class _BisectList:
+    """Sorted list on top of ``bisect``, used when sortedcontainers is missing.
+
+    Lookups are O(log n); inserts and removals are O(n) memory moves, which is
+    fast for tens of thousands of players but not asymptotically optimal.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def add(self, item) -> None:
+        insort(self._items, item)
+
+    def remove(self, item) -> None:
+        i = bisect_left(self._items, item)
+        if i == len(self._items) or self._items[i] != item:
+            raise ValueError(f"{item!r} not in list")
+        del self._items[i]
+
+    def bisect_left(self, item) -> int:
+        return bisect_left(self._items, item)
+
+
+def _sorted_list():
+    return SortedList() if SortedList is not None else _BisectList()
+
+
+class Leaderboard:
+    """Rankings of many players for several metrics, updated incrementally.
+
+    Each metric keeps its players in a sorted list (``sortedcontainers`` if
+    installed, ``bisect`` otherwise), so an update only moves the players whose
+    value changed, and top-K and rank queries never re-sort the population.
+    Metric names are those of :data:`~hypixelez.snapshot.METRICS`.
+
+    Ranks use competition ranking: players with equal values share a rank, and
+    ties are listed by UUID. The leaderboard is safe to update from several
+    threads.
+    """
+
+    def __init__(self, metrics: Iterable[str] | None = None):
+        """Create an empty leaderboard.
+
+        Args:
+            metrics: Metrics to rank. All snapshot metrics if None.
+
+        Raises:
+            KeyError: If a metric is not a snapshot metric.
+        """
+        metrics = METRICS if metrics is None else tuple(metrics)
+        self._indexes = {metric: METRIC_INDEX[metric] for metric in metrics}
+        self._rankings = {metric: _sorted_list() for metric in metrics}
+        self._values: dict[str, dict[str, int]] = {metric: {} for metric in metrics}
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> tuple:
+        """Names of the ranked metrics."""
+        return tuple(self._rankings)
+
+    def __len__(self) -> int:
+        """Number of ranked players."""
+        with self._lock:
+            return len(next(iter(self._values.values()), {}))
+
+    def __contains__(self, uuid: str) -> bool:
+        with self._lock:
+            return any(uuid in values for values in self._values.values())
+
+    def update(self, profile: SkyblockProfileData | ProfileSnapshot) -> None:
+        """Insert a player or update their values from a newer profile."""
+        if not isinstance(profile, ProfileSnapshot):
+            profile = ProfileSnapshot.from_profile(profile)
+        values = profile._values
+        uuid = profile.uuid
+
+        with self._lock:
+            for metric, index in self._indexes.items():
+                self._set(metric, uuid, values[index])
+
+    def update_many(
+        self, profiles: Iterable[SkyblockProfileData | ProfileSnapshot]
+    ) -> None:
+        for profile in profiles:
+            self.update(profile)
+
+    def _set(self, metric: str, uuid: str, value: int) -> None:
+        known = self._values[metric]
+        ranking = self._rankings[metric]
+        old = known.get(uuid)
+        if old == value:
+            return
+        if old is not None:
+            ranking.remove((-old, uuid))
+        ranking.add((-value, uuid))
+        known[uuid] = value
+
+    def remove(self, uuid: str) -> None:
+        """Remove a player from every ranking. Unknown players are ignored."""
+        with self._lock:
+            for metric, known in self._values.items():
+                value = known.pop(uuid, None)
+                if value is not None:
+                    self._rankings[metric].remove((-value, uuid))
+
+    def top(self, metric: str, k: int = 10) -> list:
+        """Get the ``k`` best ``(uuid, value)`` pairs of ``metric``."""
+        with self._lock:
+            return [(uuid, -value) for value, uuid in self._rankings[metric][:k]]
+
+    def value(self, uuid: str, metric: str) -> int | None:
+        """Get the ranked value of a player, or None if unknown."""
+        with self._lock:
+            return self._values[metric].get(uuid)
+
+    def rank(self, uuid: str, metric: str) -> int | None:
+        """Get the 1-based rank of a player, or None if unknown."""
+        with self._lock:
+            value = self._values[metric].get(uuid)
+            if value is None:
+                return None
+            # "" sorts before every UUID: count the players strictly ahead
+            return self._rankings[metric].bisect_left((-value, "")) + 1
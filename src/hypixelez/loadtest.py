@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from typing import Callable, Iterable, NamedTuple
+
+from .fakeserver import FakeHypixelServer
+from .frame import _percentile
+from .hypixel_api import HypixelClient
+from .metrics import MetricsCollector
+from .ratelimit import RateLimiter
+from .transport import TransportConfig
+
+
+class LoadTestReport(NamedTuple):
+    """Outcome of :func:`run_load_test`.
+
+    Latencies are those of whole calls (username lookup and profile fetch,
+    retries included), in seconds.
+
+    Attributes:
+        calls: Number of calls made.
+        errors: Calls that raised.
+        elapsed: Wall-clock seconds of the run.
+        throughput: Calls per second.
+        p50: Median latency.
+        p90: 90th percentile latency.
+        p99: 99th percentile latency.
+        max: Highest latency.
+        requests: HTTP attempts sent by the client.
+        retries: Attempts that were retried.
+        throttles: 429 responses received.
+    """
+
+    calls: int
+    errors: int
+    elapsed: float
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    requests: int
+    retries: int
+    throttles: int
+
+    def format(self) -> str:
+        """Render the report as a few human-readable lines."""
+        return (
+            f"calls: {self.calls} ({self.errors} failed) in {self.elapsed:.2f}s, "
+            f"{self.throughput:.1f} calls/s\n"
+            f"latency: p50 {self.p50 * 1000:.1f}ms, p90 {self.p90 * 1000:.1f}ms, "
+            f"p99 {self.p99 * 1000:.1f}ms, max {self.max * 1000:.1f}ms\n"
+            f"http: {self.requests} requests, {self.retries} retries, "
+            f"{self.throttles} throttled"
+        )
+
+
+def fetch_selected(client: HypixelClient, query: str):
+    """Default load-test call: resolve a username, then fetch its selected profile.
+
+    Goes through the public :meth:`~HypixelClient.get_uuid_by_name` and
+    :meth:`~HypixelClient.fetch_selected_profile`, as an application would.
+
+    Raises:
+        LookupError: If the player or its selected profile does not exist.
+    """
+    uuid = client.get_uuid_by_name(query)
+    if uuid is None:
+        raise LookupError(f"UUID not found for player: {query}")
+    profile = client.fetch_selected_profile(uuid)
+    if profile is None:
+        raise LookupError(f"No selected profile for player: {query}")
+    return profile
+
+
+def run_load_test(
+    client: HypixelClient,
+    queries: Iterable[str],
+    concurrency: int = 16,
+    call: Callable[[HypixelClient, str], object] = fetch_selected,
+) -> LoadTestReport:
+    """Drive a client with ``concurrency`` threads until ``queries`` runs out.
+
+    The client's hooks are replaced by a
+    :class:`~hypixelez.metrics.MetricsCollector` for the duration of the run,
+    to count HTTP requests, retries and 429 responses.
+
+    Args:
+        client: Client under test, e.g. pointed at a :class:`FakeHypixelServer`.
+        queries: Usernames or UUIDs, one per call.
+        concurrency: Number of calls running at once.
+        call: Function making one call with the client.
+
+    Returns:
+        A :class:`LoadTestReport`.
+    """
+    items = iter(queries)
+    items_lock = threading.Lock()
+    latencies = []
+    errors = [0]
+    metrics = MetricsCollector()
+    previous_hooks, client.hooks = client.hooks, metrics
+
+    def worker() -> None:
+        while True:
+            with items_lock:
+                query = next(items, None)
+            if query is None:
+                return
+            started = time.perf_counter()
+            try:
+                call(client, query)
+            except Exception:
+                with items_lock:
+                    errors[0] += 1
+            elapsed = time.perf_counter() - started
+            with items_lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        client.hooks = previous_hooks
+    elapsed = time.perf_counter() - started
+
+    if latencies:
+        p50, p90, p99 = (_percentile(latencies, q) for q in (50, 90, 99))
+    else:
+        p50 = p90 = p99 = 0.0
+    return LoadTestReport(
+        calls=len(latencies),
+        errors=errors[0],
+        elapsed=elapsed,
+        throughput=len(latencies) / elapsed if elapsed else 0.0,
+        p50=p50,
+        p90=p90,
+        p99=p99,
+        max=max(latencies, default=0.0),
+        requests=int(metrics.total("requests_total")),
+        retries=int(metrics.total("retries_total")),
+        throttles=int(metrics.total("throttles_total")),
+    )
+
+
+def main(argv=None) -> None:
+    """Run a load test against a local :class:`FakeHypixelServer`."""
+    parser = argparse.ArgumentParser(
+        prog="python -m hypixelez.loadtest",
+        description="Load-test HypixelClient against a local fake API server.",
+    )
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--profiles", type=int, default=2)
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--inventory-bytes", type=int, default=32 * 1024)
+    parser.add_argument("--calls", type=int, help="defaults to --players")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-limit", type=int, help="requests per window")
+    parser.add_argument("--window", type=float, default=300.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--json-decoder", default="auto")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = FakeHypixelServer(
+        players=args.players,
+        profiles=args.profiles,
+        members=args.members,
+        inventory_bytes=args.inventory_bytes,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        window=args.window,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    calls = args.players if args.calls is None else args.calls
+    queries = (server.names[i % args.players] for i in range(calls))
+
+    with server:
+        client = HypixelClient(
+            api_key="loadtest",
+            debug=None,
+            rate_limiter=RateLimiter(
+                limit=args.rate_limit or 10**9, window=args.window
+            ),
+            transport=TransportConfig(
+                pool_maxsize=max(args.concurrency, 32), backoff_factor=0.1
+            ),
+            json_decoder=args.json_decoder,
+            **server.client_kwargs(),
+        )
+        report = run_load_test(client, queries, args.concurrency)
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,44 @@
+from __future__ import annotations
+
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
 from logging import Logger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+# Listener started by setup_queue_logging(); None once it has been stopped
+_listener: QueueListener | None = None
+_stop_at_exit = False
+
+
+def stop_queue_logging() -> None:
+    """Stop the listener started by :func:`setup_queue_logging`.
+
+    Pending records are written first. Calling it again, or without a running
+    listener, does nothing.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def setup_logging(debug=False):
     """Setup logging
 
     Args:
-        debug: If true logging warning/info. Otherwise, logging only Warning/Error
+        debug: If true logging warning/info. Otherwise, logging only Warning/Error.
+            If None, logging configuration is left untouched.
 
     """
+    if debug is None:
+        return
 
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
@@ -41,3 +70,91 @@ def get_logger(name: str) -> Logger:
 
     """
     return logging.getLogger(name)
+
+
+class DuplicateFilter(logging.Filter):
+    """Let an identical message through at most once per ``interval`` seconds.
+
+    Messages are identical when their logger, level, format string and
+    arguments are equal, so each missing key of a getter is still reported once.
+    """
+
+    def __init__(self, interval: float = 60.0, max_keys: int = 10000):
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._last_seen: dict[tuple, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.msg, record.args)
+        now = time.monotonic()
+        try:
+            with self._lock:
+                last = self._last_seen.get(key)
+                if last is not None and now - last < self.interval:
+                    return False
+                if len(self._last_seen) >= self.max_keys:
+                    self._last_seen.clear()
+                self._last_seen[key] = now
+        except TypeError:
+            # Unhashable arguments: do not deduplicate
+            pass
+        return True
+
+
+def setup_queue_logging(
+    level=logging.WARNING,
+    handlers=None,
+    dedupe_interval: float | None = 60.0,
+    name: str = "hypixelez",
+) -> QueueListener:
+    """Production logging for the ``hypixelez`` logger only.
+
+    Records are put on a queue by the calling thread and written by handlers on
+    a background :class:`~logging.handlers.QueueListener` thread, so slow
+    handlers never block requests. The root logger is not touched; create
+    clients with ``debug=None`` so they do not reconfigure it either.
+
+    Args:
+        level: Level of the ``hypixelez`` logger.
+        handlers: Handlers run by the listener. Defaults to a stderr handler.
+        dedupe_interval: Seconds during which an identical message is
+            suppressed (see :class:`DuplicateFilter`). None disables it.
+        name: Logger to configure.
+
+    Returns:
+        The started listener. It is stopped (flushing pending records) at exit,
+        or by calling :func:`stop_queue_logging`.
+    """
+    global _listener, _stop_at_exit
+    from logging.handlers import QueueHandler, QueueListener
+
+    if not _stop_at_exit:
+        atexit.register(stop_queue_logging)
+        _stop_at_exit = True
+    stop_queue_logging()
+
+    if handlers is None:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        )
+        handlers = [handler]
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    if dedupe_interval:
+        queue_handler.addFilter(DuplicateFilter(dedupe_interval))
+
+    logger = logging.getLogger(name)
+    for old in logger.handlers[:]:
+        if isinstance(old, QueueHandler):
+            logger.removeHandler(old)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Upper bounds, in seconds, of the duration histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Results passed to Hooks.on_cache
+HIT = "hit"
+STALE = "stale"
+MISS = "miss"
+
+# name: (Prometheus type, label names, help text)
+_METRICS_ = {
+    "request_duration_seconds": (
+        "histogram",
+        ("endpoint",),
+        "Duration of each HTTP attempt, body download included.",
+    ),
+    "requests_total": (
+        "counter",
+        ("endpoint", "status"),
+        "HTTP attempts by endpoint and status ('error' for network errors).",
+    ),
+    "response_bytes_total": (
+        "counter",
+        ("endpoint",),
+        "Response body bytes received.",
+    ),
+    "decode_duration_seconds": (
+        "histogram",
+        ("endpoint",),
+        "Time spent decoding response bodies.",
+    ),
+    "retries_total": (
+        "counter",
+        ("endpoint", "reason"),
+        "Retried attempts by endpoint and reason (HTTP status or exception).",
+    ),
+    "throttles_total": (
+        "counter",
+        ("endpoint",),
+        "429 responses received.",
+    ),
+    "rate_limit_wait_seconds_total": (
+        "counter",
+        ("endpoint",),
+        "Time spent waiting for the client-side rate limiter.",
+    ),
+    "cache_lookups_total": (
+        "counter",
+        ("cache", "result"),
+        "Cache lookups by cache and result.",
+    ),
+}
+
+
+class Hooks:
+    """Instrumentation interface of :class:`~hypixelez.hypixel_api.HypixelClient`
+    and :class:`~hypixelez.async_api.AsyncHypixelClient`.
+
+    Subclass it and override the events of interest, e.g. to open tracing
+    spans or feed another metrics library; every method is a no-op by default.
+    Hooks run synchronously in the thread or event loop issuing the request, so
+    they must be quick and must not raise. Clients created without hooks skip
+    all timing.
+    """
+
+    def on_request(
+        self, endpoint: str, status: int | None, elapsed: float, size: int
+    ) -> None:
+        """Called after each HTTP attempt, including retried ones.
+
+        Args:
+            endpoint: Endpoint name (``"profile"``, ``"profiles"``, ``"mojang"``,
+                ``"mojang_bulk"``).
+            status: HTTP status, or None if the attempt failed with a network
+                error.
+            elapsed: Seconds spent in the attempt. For streamed responses the
+                body is not downloaded yet.
+            size: Body size in bytes (``Content-Length`` for streamed responses).
+        """
+
+    def on_retry(self, endpoint: str, reason: str, delay: float) -> None:
+        """Called before an attempt is retried.
+
+        Args:
+            endpoint: Endpoint name.
+            reason: HTTP status (e.g. ``"503"``) or exception class name.
+            delay: Seconds waited before the next attempt.
+        """
+
+    def on_throttle(self, endpoint: str, delay: float) -> None:
+        """Called when a 429 response is received; ``delay`` is the back-off."""
+
+    def on_rate_limit_wait(self, endpoint: str, waited: float) -> None:
+        """Called after the rate limiter let a Hypixel request through."""
+
+    def on_decode(self, endpoint: str, elapsed: float, size: int) -> None:
+        """Called after a response body was decoded.
+
+        For streamed profile members, ``elapsed`` includes reading the body.
+        """
+
+    def on_cache(self, cache: str, result: str, count: int = 1) -> None:
+        """Called after cache lookups.
+
+        Args:
+            cache: ``"uuid"`` or ``"response"``.
+            result: :data:`HIT`, :data:`STALE` or :data:`MISS`.
+            count: Number of lookups with this result.
+        """
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time copy of a histogram.
+
+    Attributes:
+        buckets: Upper bounds of the buckets, ending with ``inf``.
+        counts: Cumulative number of observations per bucket.
+        sum: Sum of the observations.
+        count: Number of observations.
+    """
+
+    buckets: tuple
+    counts: tuple
+    sum: float
+    count: int
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q``-quantile (0-1) by interpolating within buckets.
+
+        Uses the same estimate as Prometheus' ``histogram_quantile``; values in
+        the last, unbounded bucket are reported as the highest finite bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower, below = 0.0, 0
+        for bound, cumulative in zip(self.buckets, self.counts):
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    return lower
+                in_bucket = cumulative - below
+                return lower + (bound - lower) * (rank - below) / in_bucket
+            lower, below = bound, cumulative
+        return lower
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricsCollector(Hooks):
+    """Hooks aggregating client events into counters and histograms.
+
+    Collects per-endpoint request latency and decode time histograms, bytes
+    received, request, retry and 429 counters, rate limiter wait time and
+    cache hit/miss counts. One collector can be shared by several clients and
+    is safe to use from several threads.
+
+    Example:
+        >>> metrics = MetricsCollector()
+        >>> client = HypixelClient(api_key, hooks=metrics)
+        >>> latency = metrics.histogram("request_duration_seconds", endpoint="profile")
+        >>> latency.quantile(0.95)
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        """Create an empty collector.
+
+        Args:
+            buckets: Increasing upper bounds, in seconds, of the duration
+                histogram buckets. A ``+Inf`` bucket is always added.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._bounds = self.buckets + (math.inf,)
+        self._lock = threading.Lock()
+        # Label values -> float for counters, -> _Histogram for histograms
+        self._series: dict[str, dict[tuple, Any]] = {name: {} for name in _METRICS_}
+
+    def _inc(self, name: str, labels: tuple, amount: float = 1) -> None:
+        with self._lock:
+            series = self._series[name]
+            series[labels] = series.get(labels, 0) + amount
+
+    def _observe(self, name: str, labels: tuple, value: float) -> None:
+        with self._lock:
+            series = self._series[name]
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = _Histogram(len(self._bounds))
+            histogram.counts[bisect_left(self._bounds, value)] += 1
+            histogram.sum += value
+
+    def on_request(self, endpoint, status, elapsed, size):
+        self._observe("request_duration_seconds", (endpoint,), elapsed)
+        status = "error" if status is None else str(status)
+        self._inc("requests_total", (endpoint, status))
+        if size:
+            self._inc("response_bytes_total", (endpoint,), size)
+
+    def on_retry(self, endpoint, reason, delay):
+        self._inc("retries_total", (endpoint, str(reason)))
+
+    def on_throttle(self, endpoint, delay):
+        self._inc("throttles_total", (endpoint,))
+
+    def on_rate_limit_wait(self, endpoint, waited):
+        self._inc("rate_limit_wait_seconds_total", (endpoint,), waited)
+
+    def on_decode(self, endpoint, elapsed, size):
+        self._observe("decode_duration_seconds", (endpoint,), elapsed)
+
+    def on_cache(self, cache, result, count=1):
+        self._inc("cache_lookups_total", (cache, result), count)
+
+    @staticmethod
+    def _labels(name: str, labels: dict) -> tuple:
+        _, names, _ = _METRICS_[name]
+        return tuple(str(labels[n]) for n in names)
+
+    def counter(self, name: str, **labels) -> float:
+        """Get a counter value, e.g. ``counter("retries_total", endpoint="profile",
+        reason="503")``. Unseen label values count 0.
+
+        Raises:
+            KeyError: For an unknown metric or a missing label.
+        """
+        key = self._labels(name, labels)
+        with self._lock:
+            return self._series[name].get(key, 0)
+
+    def total(self, name: str) -> float:
+        """Sum a counter over all its label values, e.g. ``total("requests_total")``."""
+        with self._lock:
+            return sum(self._series[name].values())
+
+    def histogram(self, name: str, **labels) -> HistogramSnapshot:
+        """Get a copy of a histogram, e.g. ``histogram("request_duration_seconds",
+        endpoint="profile")``.
+
+        Raises:
+            KeyError: For an unknown metric or a missing label.
+        """
+        key = self._labels(name, labels)
+        with self._lock:
+            histogram = self._series[name].get(key)
+            if histogram is None:
+                counts, total = [0] * len(self._bounds), 0.0
+            else:
+                counts, total = histogram.counts, histogram.sum
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+        return HistogramSnapshot(self._bounds, tuple(cumulative), total, running)
+
+    def cache_hit_ratio(self, cache: str) -> float | None:
+        """Share of lookups of ``cache`` that were served from it (stale
+        included), or None before the first lookup."""
+        with self._lock:
+            series = self._series["cache_lookups_total"]
+            counts = {r: series.get((cache, r), 0) for r in (HIT, STALE, MISS)}
+        total = sum(counts.values())
+        return (counts[HIT] + counts[STALE]) / total if total else None
+
+    def reset(self) -> None:
+        """Drop every collected value."""
+        with self._lock:
+            self._series = {name: {} for name in _METRICS_}
+
+    def to_prometheus(self, namespace: str = "hypixelez") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, label_names, help_text) in _METRICS_.items():
+                full_name = f"{namespace}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for labels, value in sorted(self._series[name].items()):
+                    if kind == "counter":
+                        text = _format_labels(label_names, labels)
+                        lines.append(f"{full_name}{text} {_format_number(value)}")
+                        continue
+                    running = 0
+                    for bound, count in zip(self._bounds, value.counts):
+                        running += count
+                        le = f'le="{_format_number(bound)}"'
+                        text = _format_labels(label_names, labels, le)
+                        lines.append(f"{full_name}_bucket{text} {running}")
+                    text = _format_labels(label_names, labels)
+                    lines.append(f"{full_name}_sum{text} {_format_number(value.sum)}")
+                    lines.append(f"{full_name}_count{text} {running}")
+        return "\n".join(lines) + "\n"
+
+
+def serve_prometheus(
+    collector: MetricsCollector,
+    port: int = 9464,
+    addr: str = "127.0.0.1",
+    namespace: str = "hypixelez",
+) -> ThreadingHTTPServer:
+    """Serve :meth:`MetricsCollector.to_prometheus` over HTTP for scraping.
+
+    The server runs in a daemon thread and answers every ``GET`` path.
+
+    Args:
+        collector: Metrics to expose.
+        port: TCP port; 0 picks a free one (see ``server.server_address``).
+        addr: Interface to listen on.
+        namespace: Prefix of the metric names.
+
+    Returns:
+        The running server; call ``shutdown()`` and ``server_close()`` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = collector.to_prometheus(namespace).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
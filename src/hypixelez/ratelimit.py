@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+
+_DEFAULT_LIMIT_ = 300
+_DEFAULT_WINDOW_ = 300.0
+_DEFAULT_RETRY_AFTER_ = 5.0
+
+
+def _header_int(headers, name: str) -> int | None:
+    """Read an integer header, returning None if it is absent or malformed."""
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def retry_after(headers, default: float = _DEFAULT_RETRY_AFTER_) -> float:
+    """Get the delay requested by a throttled (HTTP 429) response.
+
+    Args:
+        headers: Response headers.
+        default: Delay used if neither ``Retry-After`` nor ``RateLimit-Reset``
+            is present.
+
+    Returns:
+        Seconds to wait before the next request.
+    """
+    for name in ("Retry-After", "RateLimit-Reset"):
+        value = _header_int(headers, name)
+        if value is not None:
+            return float(value)
+    return default
+
+
+class RateLimiter:
+    """Token bucket for the Hypixel API key limit.
+
+    The bucket holds ``limit`` tokens that are refilled when the rate-limit
+    window resets. Every request takes one token; when the bucket is empty,
+    callers wait until the window resets instead of hitting HTTP 429.
+
+    Hypixel reports the real state of the key in the ``RateLimit-Limit``,
+    ``RateLimit-Remaining`` and ``RateLimit-Reset`` headers; pass every response's
+    headers to :meth:`update` to keep the bucket in sync with the server.
+
+    One instance can be shared by several clients, threads and asyncio tasks
+    using the same API key.
+    """
+
+    def __init__(self, limit: int = _DEFAULT_LIMIT_, window: float = _DEFAULT_WINDOW_):
+        """Create a rate limiter.
+
+        Args:
+            limit: Requests allowed per window until the server reports otherwise.
+            window: Window length in seconds until the server reports otherwise.
+        """
+        self._lock = threading.Lock()
+        self.limit = limit
+        self.window = window
+        self._tokens = limit
+        self._reset_at: float | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Number of requests that can be made right now without waiting."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            self._tokens = self.limit
+            self._reset_at = None
+
+    def _reserve(self) -> float:
+        """Take a token if possible.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until the window resets.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._reset_at is None:
+                self._reset_at = now + self.window
+            if self._tokens > 0:
+                self._tokens -= 1
+                return 0.0
+            return max(self._reset_at - now, 0.0)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self._reserve()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._reserve()
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        import asyncio
+
+        delay = self._reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._reserve()
+
+    def update(self, headers) -> None:
+        """Synchronize the bucket with the ``RateLimit-*`` headers of a response.
+
+        Args:
+            headers: Response headers. Responses without rate-limit headers
+                are ignored.
+        """
+        remaining = _header_int(headers, "RateLimit-Remaining")
+        reset = _header_int(headers, "RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        limit = _header_int(headers, "RateLimit-Limit")
+
+        with self._lock:
+            now = time.monotonic()
+            reset_at = now + reset
+            if limit is not None:
+                self.limit = limit
+            if self._reset_at is None or reset_at > self._reset_at + 1:
+                # The server started a new window: its count is authoritative.
+                self._tokens = remaining
+            else:
+                # Same window: tokens already handed out for in-flight requests
+                # are not reflected by the server yet, so keep the lower value.
+                self._tokens = min(self._tokens, remaining)
+            self._reset_at = reset_at
+
+    def throttle(self, delay: float) -> None:
+        """Empty the bucket for ``delay`` seconds (e.g. after an HTTP 429).
+
+        Args:
+            delay: Seconds until requests may be sent again.
+        """
+        with self._lock:
+            self._tokens = 0
+            self._reset_at = time.monotonic() + delay
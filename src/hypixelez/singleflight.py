@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import functools
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls with the same key across threads.
+
+    While a call for a key is in flight, other callers asking for the same key
+    wait for it and receive its result (or its exception) instead of starting
+    their own call. Results are not kept once the call finishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        """Call ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight.
+
+        Args:
+            key: Hashable key identifying identical calls.
+            fn: Function to call.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Deduplicate concurrent coroutine calls with the same key on one event loop.
+
+    The shared call runs as its own task, so cancelling one caller (e.g. a
+    client that disconnected) does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn, *args, **kwargs):
+        """Await ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight.
+
+        Args:
+            key: Hashable key identifying identical calls.
+            fn: Coroutine function to call.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn(*args, **kwargs))
+            task.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import time
+from array import array
+
+from .constants import (
+    COLLECTION_KEY_VALUES,
+    DUNGEON_CLASS_KEY_VALUES,
+    SKILL_KEY_VALUES,
+    SLAYER_KEY_VALUES,
+)
+from .hypixel_api import (
+    _CATA_CUMULATIVE_XP_,
+    _SKILL_CUMULATIVE_LEVELS_,
+    _calculate_current_xp,
+    _calculate_level,
+    SkyblockProfileData,
+)
+
+# Number of slayer boss tiers kept per slayer (``boss_kills_tier_0`` .. ``_4``)
+SLAYER_TIERS = 5
+
+
+def slayer_tier_metric(slayer, tier: int) -> str:
+    """Name of the metric holding kills of a 0-based slayer boss ``tier``."""
+    return f"{getattr(slayer, 'value', slayer)}_boss_kills_tier_{tier}"
+
+
+# Layout of the values of a snapshot: skill XP, collection amounts, slayer XP,
+# slayer kills per tier, Catacombs XP, dungeon class XP and leveling experience
+METRICS: tuple[str, ...] = (
+    SKILL_KEY_VALUES
+    + COLLECTION_KEY_VALUES
+    + SLAYER_KEY_VALUES
+    + tuple(
+        slayer_tier_metric(slayer, tier)
+        for slayer in SLAYER_KEY_VALUES
+        for tier in range(SLAYER_TIERS)
+    )
+    + ("catacombs",)
+    + DUNGEON_CLASS_KEY_VALUES
+    + ("leveling",)
+)
+METRIC_INDEX: dict[str, int] = {name: i for i, name in enumerate(METRICS)}
+
+
+def _section(first: str, last: str) -> slice:
+    return slice(METRIC_INDEX[first], METRIC_INDEX[last] + 1)
+
+
+# Contiguous ranges of METRICS, one per member section
+SECTIONS: dict[str, slice] = {
+    "skills": _section(SKILL_KEY_VALUES[0], SKILL_KEY_VALUES[-1]),
+    "collections": _section(COLLECTION_KEY_VALUES[0], COLLECTION_KEY_VALUES[-1]),
+    "slayers": _section(
+        SLAYER_KEY_VALUES[0],
+        slayer_tier_metric(SLAYER_KEY_VALUES[-1], SLAYER_TIERS - 1),
+    ),
+    "dungeons": _section("catacombs", DUNGEON_CLASS_KEY_VALUES[-1]),
+    "leveling": _section("leveling", "leveling"),
+}
+
+_TYPECODE_ = "q"
+
+
+def _extract(profile: SkyblockProfileData) -> array:
+    values = array(_TYPECODE_, bytes(array(_TYPECODE_).itemsize * len(METRICS)))
+    index = METRIC_INDEX
+
+    def fill(section: dict, keys) -> None:
+        for key in keys:
+            value = section.get(key)
+            if value:
+                values[index[key]] = int(value)
+
+    fill(profile._experience, SKILL_KEY_VALUES)
+    fill(profile._collection, COLLECTION_KEY_VALUES)
+
+    bosses = profile._slayer_bosses
+    for slayer in SLAYER_KEY_VALUES:
+        boss = bosses.get(slayer)
+        if not boss:
+            continue
+        values[index[slayer]] = int(boss.get("xp", 0))
+        for tier in range(SLAYER_TIERS):
+            kills = boss.get(f"boss_kills_tier_{tier}")
+            if kills:
+                values[index[slayer_tier_metric(slayer, tier)]] = int(kills)
+
+    classes = profile._player_classes
+    for name in DUNGEON_CLASS_KEY_VALUES:
+        xp = classes.get(name, {}).get("experience")
+        if xp:
+            values[index[name]] = int(xp)
+    values[index["catacombs"]] = int(profile._catacombs.get("experience", 0))
+    values[index["leveling"]] = int(profile._leveling.get("experience", 0))
+    return values
+
+
+class ProfileSnapshot:
+    """Compact copy of the numeric metrics of one profile member.
+
+    All metrics live in a single ``array`` of 64-bit integers laid out as
+    :data:`METRICS`, so a snapshot holds no reference to the raw API JSON and
+    takes roughly a kilobyte. The getters mirror those of
+    :class:`~hypixelez.hypixel_api.SkyblockProfileData`, except that missing
+    data is silently 0.
+
+    Attributes:
+        uuid: Member UUID.
+        fetched_at: Unix timestamp of the data.
+    """
+
+    __slots__ = ("uuid", "fetched_at", "_values")
+
+    def __init__(self, uuid: str, values, fetched_at: float | None = None):
+        """Create a snapshot from raw metric values.
+
+        Args:
+            uuid: Member UUID.
+            values: Metric values in :data:`METRICS` order.
+            fetched_at: Unix timestamp of the data. Defaults to now.
+
+        Raises:
+            ValueError: If ``values`` does not have one value per metric.
+        """
+        values = array(_TYPECODE_, values)
+        if len(values) != len(METRICS):
+            raise ValueError(
+                f"Expected {len(METRICS)} metric values, got {len(values)}"
+            )
+        self.uuid = uuid
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self._values = values
+
+    @classmethod
+    def from_profile(
+        cls, profile: SkyblockProfileData, fetched_at: float | None = None
+    ) -> ProfileSnapshot:
+        """Extract the metrics of ``profile``; the profile can then be released.
+
+        Args:
+            profile: Profile to copy.
+            fetched_at: Unix timestamp of the data. Defaults to
+                ``profile.fetched_at``.
+        """
+        snapshot = cls.__new__(cls)
+        snapshot.uuid = profile._uuid
+        snapshot.fetched_at = profile.fetched_at if fetched_at is None else fetched_at
+        snapshot._values = _extract(profile)
+        return snapshot
+
+    def __getitem__(self, metric: str) -> int:
+        return self._values[METRIC_INDEX[metric]]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ProfileSnapshot):
+            return NotImplemented
+        return (self.uuid, self.fetched_at, self._values) == (
+            other.uuid,
+            other.fetched_at,
+            other._values,
+        )
+
+    def __repr__(self) -> str:
+        return f"ProfileSnapshot(uuid={self.uuid!r}, fetched_at={self.fetched_at!r})"
+
+    @property
+    def values(self) -> array:
+        """A copy of the metric values, in :data:`METRICS` order."""
+        return array(_TYPECODE_, self._values)
+
+    def as_dict(self) -> dict:
+        """Get ``{metric: value}`` for every metric."""
+        return dict(zip(METRICS, self._values))
+
+    def get_collection(self, collection_name) -> int:
+        """Get the amount collected, 0 for collections outside ``CollectionKey``."""
+        i = METRIC_INDEX.get(collection_name)
+        return 0 if i is None else self._values[i]
+
+    def get_skill_xp(self, skill_name) -> int:
+        """Get the total XP of a skill."""
+        return self[skill_name]
+
+    def get_skill_level(self, skill_name) -> int:
+        """Get the current level of a skill."""
+        xp = self.get_skill_xp(skill_name)
+        return _calculate_level(xp, _SKILL_CUMULATIVE_LEVELS_) - 1
+
+    def get_skill_current_level_xp(self, skill_name) -> int:
+        """Get XP progress within the current level of a skill."""
+        return _calculate_current_xp(
+            self.get_skill_xp(skill_name), _SKILL_CUMULATIVE_LEVELS_
+        )
+
+    def get_cata_level(self) -> int:
+        """Get the Catacombs level."""
+        return _calculate_level(self["catacombs"], _CATA_CUMULATIVE_XP_)
+
+    def get_cata_xp(self) -> int:
+        """Get Catacombs XP progress within the current level."""
+        return _calculate_current_xp(self["catacombs"], _CATA_CUMULATIVE_XP_)
+
+    def get_cata_class_level(self, class_name) -> int:
+        """Get the level of a dungeon class."""
+        return _calculate_level(self[class_name], _CATA_CUMULATIVE_XP_)
+
+    def get_cata_class_xp(self, class_name) -> int:
+        """Get dungeon class XP progress within the current level."""
+        return _calculate_current_xp(self[class_name], _CATA_CUMULATIVE_XP_)
+
+    def get_slayer_xp(self, slayer_name) -> int:
+        """Get the total XP of a slayer."""
+        return self[slayer_name]
+
+    def get_slayer_stats(self, slayer_name) -> list:
+        """Get boss kills of every tier of a slayer, tier I first.
+
+        Unlike :meth:`SkyblockProfileData.get_slayer_stats`, the list always has
+        :data:`SLAYER_TIERS` items.
+        """
+        start = METRIC_INDEX[slayer_tier_metric(slayer_name, 0)]
+        return self._values[start : start + SLAYER_TIERS].tolist()
+
+    def get_global_level(self) -> int:
+        """Get the global SkyBlock level."""
+        return self["leveling"] // 100
+
+    def get_global_xp(self) -> int:
+        """Get XP progress within the current global SkyBlock level."""
+        return self["leveling"] % 100
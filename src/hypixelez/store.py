@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable, Iterator
+
+from .hypixel_api import SkyblockProfileData
+from .snapshot import METRICS, ProfileSnapshot
+
+_MAGIC_ = b"HXSS"
+_VERSION_ = 1
+# magic, version, number of metrics, length of the metric names block
+_HEADER_ = struct.Struct("<4sHHI")
+# member UUID (16 raw bytes), fetched_at
+_RECORD_PREFIX_ = struct.Struct("<16sd")
+
+
+def _record_struct(metric_count: int) -> struct.Struct:
+    return struct.Struct(f"{_RECORD_PREFIX_.format}{metric_count}q")
+
+
+def _uuid_bytes(uuid: str) -> bytes:
+    raw = bytes.fromhex(uuid.replace("-", ""))
+    if len(raw) != 16:
+        raise ValueError(f"Not a UUID: '{uuid}'")
+    return raw
+
+
+def _encode_header(metrics: tuple) -> bytes:
+    names = "\n".join(metrics).encode("ascii")
+    return _HEADER_.pack(_MAGIC_, _VERSION_, len(metrics), len(names)) + names
+
+
+def _decode_header(data) -> tuple[tuple, int]:
+    """Return the metric names of a store and the offset of its first record."""
+    if len(data) < _HEADER_.size:
+        raise ValueError("Not a snapshot store: file too short")
+    magic, version, count, names_length = _HEADER_.unpack_from(data)
+    if magic != _MAGIC_ or version != _VERSION_:
+        raise ValueError(f"Not a snapshot store (magic {magic!r}, version {version})")
+    start = _HEADER_.size
+    end = start + names_length
+    names = bytes(data[start:end]).decode("ascii").split("\n")
+    if len(names) != count:
+        raise ValueError("Corrupted snapshot store header")
+    return tuple(names), end
+
+
+class SnapshotStore:
+    """Append-only file of fixed-width profile snapshot records.
+
+    Each record is a struct-packed member UUID, timestamp and one ``int64`` per
+    metric of :data:`~hypixelez.snapshot.METRICS` (about 1 KB). The metric
+    names are written once in the file header. Use :class:`SnapshotReader` to
+    scan the file.
+
+    A record cut short by a crash is dropped the next time the store is opened.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open or create a store.
+
+        Args:
+            path: File to append to.
+
+        Raises:
+            ValueError: If the file is not a store or was written with a
+                different metric layout.
+        """
+        self.path = os.fspath(path)
+        self._record = _record_struct(len(METRICS))
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a+b")
+
+        self._file.seek(0)
+        header = self._file.read(_HEADER_.size)
+        if not header:
+            self._file.write(_encode_header(METRICS))
+            self._file.flush()
+            return
+
+        if len(header) == _HEADER_.size:
+            header += self._file.read(_HEADER_.unpack(header)[3])
+        try:
+            metrics, start = _decode_header(header)
+        except ValueError:
+            self._file.close()
+            raise
+        if metrics != METRICS:
+            self._file.close()
+            raise ValueError(
+                f"Store '{self.path}' was written with a different metric layout"
+            )
+        size = self._file.seek(0, os.SEEK_END)
+        complete = start + (size - start) // self._record.size * self._record.size
+        if complete != size:
+            self._file.truncate(complete)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, profile: SkyblockProfileData | ProfileSnapshot) -> None:
+        """Append one record."""
+        if not isinstance(profile, ProfileSnapshot):
+            profile = ProfileSnapshot.from_profile(profile)
+        record = self._record.pack(
+            _uuid_bytes(profile.uuid), profile.fetched_at, *profile._values
+        )
+        with self._lock:
+            self._file.write(record)
+
+    def extend(self, profiles: Iterable[SkyblockProfileData | ProfileSnapshot]) -> None:
+        """Append many records."""
+        for profile in profiles:
+            self.append(profile)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class SnapshotReader:
+    """Memory-mapped, read-only view of a :class:`SnapshotStore` file.
+
+    Scans read fixed offsets of the mapped file, so only the fields asked for
+    are unpacked. Records appended after the reader was opened are not seen.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Map a store file.
+
+        Raises:
+            ValueError: If the file is not a store.
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.metrics, self._start = _decode_header(self._mmap)
+        except ValueError:
+            self._mmap.close()
+            raise
+        self._index = {name: i for i, name in enumerate(self.metrics)}
+        self._record = _record_struct(len(self.metrics))
+        self._count = (len(self._mmap) - self._start) // self._record.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offsets(self) -> range:
+        size = self._record.size
+        return range(self._start, self._start + self._count * size, size)
+
+    def __getitem__(self, i: int) -> ProfileSnapshot:
+        """Decode record ``i`` into a :class:`ProfileSnapshot`.
+
+        Raises:
+            ValueError: If the store was written with a different metric layout.
+        """
+        if self.metrics != METRICS:
+            raise ValueError("Store metric layout differs from this version")
+        offset = self._offsets()[i]
+        uuid, fetched_at, *values = self._record.unpack_from(self._mmap, offset)
+        return ProfileSnapshot(uuid.hex(), values, fetched_at)
+
+    def _matching(self, uuid_bytes: bytes | None, start, end) -> Iterator[int]:
+        prefix = _RECORD_PREFIX_
+        for offset in self._offsets():
+            uuid, fetched_at = prefix.unpack_from(self._mmap, offset)
+            if uuid_bytes is not None and uuid != uuid_bytes:
+                continue
+            if start is not None and fetched_at < start:
+                continue
+            if end is not None and fetched_at >= end:
+                continue
+            yield offset
+
+    def history(
+        self, uuid: str, start: float | None = None, end: float | None = None
+    ) -> list:
+        """Get every snapshot of a member, in append order.
+
+        Args:
+            uuid: Member UUID.
+            start: Keep records with ``fetched_at >= start``.
+            end: Keep records with ``fetched_at < end``.
+        """
+        first = self._start
+        size = self._record.size
+        return [
+            self[(offset - first) // size]
+            for offset in self._matching(_uuid_bytes(uuid), start, end)
+        ]
+
+    def metric(
+        self, metric: str, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple]:
+        """Scan one metric across all members.
+
+        Args:
+            metric: Metric name.
+            start: Keep records with ``fetched_at >= start``.
+            end: Keep records with ``fetched_at < end``.
+
+        Yields:
+            ``(uuid, fetched_at, value)`` tuples, in append order.
+        """
+        value_offset = _RECORD_PREFIX_.size + 8 * self._index[metric]
+        value = struct.Struct("<q")
+        for offset in self._matching(None, start, end):
+            uuid, fetched_at = _RECORD_PREFIX_.unpack_from(self._mmap, offset)
+            (amount,) = value.unpack_from(self._mmap, offset + value_offset)
+            yield uuid.hex(), fetched_at, amount
+
+    def close(self) -> None:
+        self._mmap.close()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Iterable
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+
+def _wrap_member(uuid: str, member: dict | None) -> dict:
+    members = {} if member is None else {uuid: member}
+    return {"success": True, "profile": {"members": members}}
+
+
+def _filter_fields(member: dict | None, fields: set | None) -> dict | None:
+    if member is None or fields is None:
+        return member
+    return {key: value for key, value in member.items() if key in fields}
+
+
+def parse_member(
+    source,
+    uuid: str,
+    fields: Iterable[str] | None = None,
+    decode: Callable[[bytes], Any] = json.loads,
+) -> dict:
+    """Extract one member's data from a ``/v2/skyblock/profile`` body.
+
+    With the optional ``ijson`` dependency installed the body is parsed
+    incrementally: only the requested member is turned into Python objects, so
+    other members' inventories never have to be held in memory, and reading
+    stops as soon as the member has been parsed. Sections outside ``fields`` are
+    discarded as soon as each one is parsed. Without ``ijson`` the body is
+    decoded in full and trimmed afterwards.
+
+    Args:
+        source: Binary file-like object (e.g. ``response.raw``) or ``bytes``.
+        uuid: Member UUID (without dashes).
+        fields: Optional allow-list of member sections to keep, e.g.
+            ``{"player_data", "dungeons"}``. All sections are kept if None.
+        decode: Decoder for the whole body, used only without ``ijson``.
+
+    Returns:
+        A body shaped like the profile endpoint response, containing only
+        ``profile.members[uuid]``. The member is absent if it was not found.
+
+    Notes:
+        Only the member subtree is read, so the ``success`` flag of the body is
+        not checked: callers should rely on the HTTP status instead.
+    """
+    fields = None if fields is None else set(fields)
+
+    if ijson is None:
+        if not isinstance(source, (bytes, bytearray)):
+            source = source.read()
+        data = decode(source)
+        # "profile" is null for an unknown profile id
+        member = ((data.get("profile") or {}).get("members") or {}).get(uuid)
+        return _wrap_member(uuid, _filter_fields(member, fields))
+
+    prefix = f"profile.members.{uuid}"
+    if fields is None:
+        member = next(ijson.items(source, prefix, use_float=True), None)
+    else:
+        member = None
+        for key, value in ijson.kvitems(source, prefix, use_float=True):
+            if member is None:
+                member = {}
+            if key in fields:
+                member[key] = value
+    return _wrap_member(uuid, member)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a request while an endpoint's circuit is open.
+
+    A builtin ``ConnectionError`` (not a ``requests`` exception), so that this
+    module does not import ``requests``; the clients catch it alongside their
+    HTTP library's errors.
+    """
+
+
+@dataclass
+class TransportConfig:
+    """HTTP transport settings shared by all endpoints of a client.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to keep.
+        pool_maxsize: Maximum number of connections kept open per host. Should be
+            at least the number of threads using the client concurrently.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait between bytes received from the server.
+        keep_alive: Reuse connections between requests. If False, every request
+            asks the server to close the connection.
+        max_retries: Retries after a connection error, a timeout or a response
+            with a status in ``retry_statuses``.
+        backoff_factor: Base delay of the exponential backoff, in seconds.
+        backoff_max: Upper bound of a single backoff delay, in seconds.
+        jitter: Random extra delay, as a fraction of the backoff delay.
+        retry_statuses: HTTP statuses that are retried.
+        circuit_breaker_threshold: Consecutive failures after which requests to an
+            endpoint fail fast with :class:`CircuitOpenError`. None disables it.
+        circuit_breaker_timeout: Seconds an open circuit waits before letting a
+            trial request through.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    keep_alive: bool = True
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 0.5
+    retry_statuses: tuple = (429, 500, 502, 503, 504)
+    circuit_breaker_threshold: int | None = None
+    circuit_breaker_timeout: float = 30.0
+
+    def __post_init__(self):
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {self.max_retries}")
+
+    @property
+    def timeout(self) -> tuple:
+        """``(connect, read)`` timeout tuple as accepted by ``requests``."""
+        return self.connect_timeout, self.read_timeout
+
+    def build_session(self) -> requests.Session:
+        """Create a ``requests.Session`` with connection pools sized by this config.
+
+        Retries are not delegated to ``urllib3``; the client applies
+        :meth:`backoff` itself so it can cooperate with the rate limiter.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def is_retryable(self, status: int) -> bool:
+        """Return True if a response with ``status`` should be retried."""
+        return status in self.retry_statuses
+
+    def is_server_error(self, status: int) -> bool:
+        """Return True if ``status`` is a retryable server failure (not throttling)."""
+        return status != 429 and status in self.retry_statuses
+
+    def backoff(self, attempt: int, minimum: float = 0.0) -> float:
+        """Delay before retry number ``attempt`` (0-based).
+
+        Args:
+            attempt: Number of the retry, starting at 0.
+            minimum: Lower bound, e.g. the server's ``Retry-After``.
+
+        Returns:
+            Exponential backoff with jitter, in seconds.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * 2**attempt)
+        delay += random.uniform(0, self.jitter * delay)
+        return max(delay, minimum)
+
+    def make_breaker(self) -> CircuitBreaker | None:
+        """Create a circuit breaker for one endpoint, or None if disabled."""
+        if self.circuit_breaker_threshold is None:
+            return None
+        return CircuitBreaker(
+            self.circuit_breaker_threshold, self.circuit_breaker_timeout
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for a single endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. After ``recovery_timeout`` seconds one trial request is
+    let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being rejected."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self, endpoint: str) -> None:
+        """Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            waited = time.monotonic() - self._opened_at
+            if waited >= self.recovery_timeout and not self._trial_running:
+                self._trial_running = True
+                return
+        raise CircuitOpenError(f"Circuit open for endpoint '{endpoint}'")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release(self) -> None:
+        """End a request without an outcome (e.g. cancelled), freeing the trial."""
+        with self._lock:
+            self._trial_running = False
@@ -5,6 +5,8 @@ from unittest.mock import Mock
 from dotenv import load_dotenv
 from src.hypixelez import hypixel_api, HypixelClient
 import src.hypixelez.logger
+from src.hypixelez.fakeserver import FakeHypixelServer
+from src.hypixelez.ratelimit import RateLimiter
 from unittest.mock import patch
 
 load_dotenv()
@@ -32,6 +34,31 @@ def mock_profile_data():
     return SkyblockProfileData(MOCK_PROFILE_DATA, "eca19e2e713d49a98582320229f696ed")
 
 
+@pytest.fixture
+def server(request):
+    """Running fake API server; override its options with indirect parametrization"""
+    options = {"players": 6, "profiles": 2, "members": 2, "inventory_bytes": 60}
+    options.update(getattr(request, "param", {}))
+    with FakeHypixelServer(**options) as s:
+        yield s
+
+
+@pytest.fixture
+def fake_client():
+    """Factory of clients talking to a fake server, without rate limit waits"""
+
+    def make(server, **kwargs):
+        return HypixelClient(
+            api_key="test_key",
+            debug=None,
+            rate_limiter=RateLimiter(limit=10**6),
+            **server.client_kwargs(),
+            **kwargs,
+        )
+
+    return make
+
+
 @pytest.fixture
 def mock_requests():
     """Fixture to mock requests"""
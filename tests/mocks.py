@@ -2,6 +2,14 @@
 Mock data for Hypixel API testing
 """
 
+import json
+
+
+def json_body(data) -> bytes:
+    """Encode mock data the way the API sends it over the wire"""
+    return json.dumps(data).encode()
+
+
 # Mock response for UUID lookup
 MOCK_UUID_RESPONSE = {"id": "eca19e2e713d49a98582320229f696ed"}
 
@@ -89,3 +97,24 @@ MOCK_EMPTY_PROFILE = {
         }
     },
 }
+
+# Mock response for profile list with full profile bodies
+MOCK_FULL_PROFILES_RESPONSE = {
+    "success": True,
+    "profiles": [
+        {
+            "profile_id": "f5791b0c-caf1-4701-aea3-d727ea53a901",
+            "cute_name": "Peach",
+            "selected": True,
+            "members": MOCK_PROFILE_DATA["profile"]["members"],
+        },
+        {
+            "profile_id": "0b1362a7-43e8-454b-a2ed-6db43ae32f19",
+            "cute_name": "Kiwi",
+            "selected": False,
+            "members": {
+                "eca19e2e713d49a98582320229f696ed": {"collection": {"LOG": 100}}
+            },
+        },
+    ],
+}
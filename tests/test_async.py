@@ -0,0 +1,199 @@
+"""
+Tests for the asyncio client using a fake aiohttp session
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hypixelez.async_api import AsyncHypixelClient
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.transport import TransportConfig
+from .mocks import *
+
+
+class FakeResponse:
+    """Minimal stand-in for ``aiohttp.ClientResponse``"""
+
+    def __init__(self, data, error=None, status=200, headers=None):
+        self._data = data
+        self._error = error
+        self.status = status
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def raise_for_status(self):
+        if self._error is not None:
+            raise self._error
+
+    async def json(self, content_type=None):
+        return self._data
+
+    async def read(self):
+        return json.dumps(self._data).encode()
+
+
+def make_session(data=None, error=None):
+    session = Mock()
+    session.get = Mock(return_value=FakeResponse(data, error))
+    return session
+
+
+class TestAsyncClient:
+    """Test cases for AsyncHypixelClient"""
+
+    def test_get_uuid_with_mock(self):
+        """Test UUID lookup and caching"""
+        session = make_session(MOCK_UUID_RESPONSE)
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        async def run():
+            return [await client.get_uuid_by_name("Neono4ka") for _ in range(2)]
+
+        assert asyncio.run(run()) == ["eca19e2e713d49a98582320229f696ed"] * 2
+        session.get.assert_called_once_with(
+            "https://api.mojang.com/users/profiles/minecraft/Neono4ka"
+        )
+
+    def test_uuid_network_error(self):
+        """Test that network errors resolve to None"""
+        session = make_session(error=aiohttp.ClientConnectionError("boom"))
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        assert asyncio.run(client.get_uuid_by_name("Neono4ka")) is None
+
+    def test_get_profile_names(self):
+        """Test profile list parsing"""
+        session = make_session(MOCK_PROFILES_RESPONSE)
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        result = asyncio.run(client.get_profile_names_ids_by_id("test_uuid"))
+
+        assert result["Peach"] == "f5791b0c-caf1-4701-aea3-d727ea53a901"
+        assert len(result) == 3
+
+    def test_fetch_profile_with_mock(self):
+        """Test profile fetching returns SkyblockProfileData"""
+        session = make_session(MOCK_PROFILE_DATA)
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        profile_data = asyncio.run(
+            client.fetch_profile_info(
+                "eca19e2e713d49a98582320229f696ed",
+                "f5791b0c-caf1-4701-aea3-d727ea53a901",
+            )
+        )
+
+        assert isinstance(profile_data, SkyblockProfileData)
+        assert profile_data.get_skill_level("SKILL_CARPENTRY") == 27
+
+    def test_api_error_handling(self):
+        """Test API-level error raises"""
+        session = make_session(MOCK_ERROR_RESPONSE)
+        client = AsyncHypixelClient(api_key="invalid_key", session=session)
+
+        with pytest.raises(Exception, match="API Error: Invalid API key"):
+            asyncio.run(client.fetch_profile_info("test_uuid", "test_profile"))
+
+    def test_external_session_not_closed(self):
+        """Test that a caller-provided session is left open"""
+        session = make_session()
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        asyncio.run(client.close())
+
+        session.close.assert_not_called()
+
+    def test_cancelled_trial_frees_circuit(self):
+        """Test that cancelling the trial request lets the next one through"""
+
+        class HangingResponse(FakeResponse):
+            async def __aenter__(self):
+                await asyncio.Event().wait()
+
+        session = Mock()
+        session.get = Mock(
+            side_effect=[
+                aiohttp.ClientConnectionError("down"),
+                HangingResponse(None),
+                FakeResponse(MOCK_PROFILE_DATA),
+            ]
+        )
+        transport = TransportConfig(
+            max_retries=0, circuit_breaker_threshold=1, circuit_breaker_timeout=0
+        )
+        client = AsyncHypixelClient(
+            api_key="test_key", session=session, transport=transport
+        )
+
+        async def run():
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await client._request("profile", "get", "url")
+            trial = asyncio.ensure_future(client._request("profile", "get", "url"))
+            await asyncio.sleep(0)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            response, _ = await client._request("profile", "get", "url")
+            return response.status
+
+        assert asyncio.run(run()) == 200
+
+    def test_get_uuids_by_names(self):
+        """Test bulk UUID lookup"""
+        session = make_session()
+        session.post = Mock(
+            return_value=FakeResponse(
+                [{"id": "eca19e2e713d49a98582320229f696ed", "name": "Neono4ka"}]
+            )
+        )
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        result = asyncio.run(client.get_uuids_by_names(["Neono4ka", "Missing"]))
+
+        assert result == {
+            "Neono4ka": "eca19e2e713d49a98582320229f696ed",
+            "Missing": None,
+        }
+        session.post.assert_called_once()
+
+    def test_fetch_all_profiles(self):
+        """Test single-call profile fetching"""
+        session = make_session(MOCK_FULL_PROFILES_RESPONSE)
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        profiles = asyncio.run(
+            client.fetch_all_profiles("eca19e2e713d49a98582320229f696ed")
+        )
+        selected = asyncio.run(
+            client.fetch_selected_profile("eca19e2e713d49a98582320229f696ed")
+        )
+
+        assert profiles["Kiwi"].get_collection("LOG") == 100
+        assert selected.get_collection("LOG") == 77760
+
+    @patch("asyncio.sleep")
+    def test_retries_server_errors(self, mock_sleep):
+        """Test that 5xx responses are retried with backoff"""
+        session = make_session()
+        session.get.side_effect = [
+            FakeResponse(None, status=503),
+            FakeResponse(MOCK_PROFILE_DATA),
+        ]
+        client = AsyncHypixelClient(api_key="test_key", session=session)
+
+        profile_data = asyncio.run(
+            client.fetch_profile_info("eca19e2e713d49a98582320229f696ed", "profile_id")
+        )
+
+        assert profile_data.get_collection("LOG") == 77760
+        assert session.get.call_count == 2
+        mock_sleep.assert_called_once()
@@ -0,0 +1,285 @@
+"""
+Tests for the UUID and response caches
+"""
+
+import json
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hypixelez.cache import (
+    FRESH,
+    MISS,
+    STALE,
+    MemoryUUIDCache,
+    ResponseCache,
+    SQLiteUUIDCache,
+    UUIDCache,
+)
+from src.hypixelez.hypixel_api import HypixelClient
+from .mocks import MOCK_PROFILE_DATA, json_body
+
+
+class TestMemoryUUIDCache:
+    """Test the in-memory LRU cache"""
+
+    def test_get_set(self):
+        cache = MemoryUUIDCache()
+        cache.set("Neono4ka", "eca19e2e713d49a98582320229f696ed")
+        assert cache.get("neono4ka") == "eca19e2e713d49a98582320229f696ed"
+        assert cache.get("Unknown", "default") == "default"
+
+    def test_negative_entry(self):
+        cache = MemoryUUIDCache()
+        cache.set("Missing", None)
+        assert "Missing" in cache
+        assert cache.get("Missing", "default") is None
+
+    def test_lru_eviction(self):
+        cache = MemoryUUIDCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        cache = MemoryUUIDCache(ttl=10, negative_ttl=1)
+        with patch("time.monotonic", return_value=100):
+            cache.set("a", "1")
+            cache.set("b", None)
+        with patch("time.monotonic", return_value=105):
+            assert cache.get("a") == "1"
+            assert "b" not in cache
+        with patch("time.monotonic", return_value=111):
+            assert "a" not in cache
+
+
+class TestSQLiteUUIDCache:
+    """Test the SQLite tier"""
+
+    def test_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "uuids.sqlite")
+        SQLiteUUIDCache(path).set("Neono4ka", "eca19e2e713d49a98582320229f696ed")
+        SQLiteUUIDCache(path).set("Missing", None)
+
+        cache = SQLiteUUIDCache(path)
+        assert cache.get("NEONO4KA") == "eca19e2e713d49a98582320229f696ed"
+        assert cache.get("Missing", "default") is None
+        assert cache.get("Other", "default") == "default"
+
+    def test_expired_rows_are_misses(self, tmp_path):
+        cache = SQLiteUUIDCache(str(tmp_path / "uuids.sqlite"), ttl=-1)
+        cache.set("a", "1")
+        assert "a" not in cache
+        cache.purge_expired()
+
+    def test_memory_backed_by_sqlite(self, tmp_path):
+        path = str(tmp_path / "uuids.sqlite")
+        MemoryUUIDCache(backend=SQLiteUUIDCache(path)).set("a", "1")
+
+        cache = MemoryUUIDCache(backend=SQLiteUUIDCache(path))
+        assert cache.get("a") == "1"
+        assert len(cache) == 1
+
+
+class TestUUIDCacheBackends:
+    """Test read-through to backends other than SQLite"""
+
+    def test_memory_backed_by_memory(self):
+        backend = MemoryUUIDCache(ttl=10)
+        backend.set("a", "1")
+        backend.set("b", None)
+
+        cache = MemoryUUIDCache(backend=backend)
+        assert cache.get("A") == "1"
+        assert cache.get("b", "default") is None
+        assert cache.get("c", "default") == "default"
+        assert len(cache) == 2
+
+    def test_custom_backend(self):
+        class DictCache(UUIDCache):
+            def __init__(self):
+                self.entries = {}
+
+            def get(self, name, default=None):
+                return self.entries.get(name.lower(), default)
+
+            def set(self, name, uuid):
+                self.entries[name.lower()] = uuid
+
+            def clear(self):
+                self.entries.clear()
+
+        backend = DictCache()
+        backend.set("a", "1")
+        cache = MemoryUUIDCache(ttl=10, backend=backend)
+
+        assert backend.get_entry("a") == ("1", None)
+        assert cache.get("a") == "1"
+        assert cache.get("b", "default") == "default"
+        cache.set("b", None)
+        assert backend.entries == {"a": "1", "b": None}
+
+    def test_interface_is_abstract(self):
+        with pytest.raises(TypeError):
+            UUIDCache()
+
+
+class TestClientUUIDCache:
+    """Test the cache integration in HypixelClient"""
+
+    @patch("requests.Session.get")
+    def test_negative_caching(self, mock_get):
+        mock_get.return_value.content = json_body({})
+        mock_get.return_value.raise_for_status = Mock()
+
+        client = HypixelClient(api_key="test_key")
+
+        assert client.get_uuid_by_name("NonExistentPlayer") is None
+        assert client.get_uuid_by_name("NonExistentPlayer") is None
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_custom_cache(self, mock_get):
+        cache = MemoryUUIDCache()
+        cache.set("Neono4ka", "eca19e2e713d49a98582320229f696ed")
+
+        client = HypixelClient(api_key="test_key", uuid_cache=cache)
+
+        assert client.get_uuid_by_name("Neono4ka") == "eca19e2e713d49a98582320229f696ed"
+        mock_get.assert_not_called()
+
+
+class TestResponseCache:
+    """Test the response cache states, size cap and storage"""
+
+    def test_fresh_stale_miss(self):
+        cache = ResponseCache(ttls={"profile": 10}, stale_ttl=20)
+        key = cache.make_key("profile", "uuid", "profile_id")
+        with patch("time.time", return_value=100):
+            assert cache.lookup("profile", key) == (None, MISS, None)
+            cache.put("profile", key, b"{}")
+        with patch("time.time", return_value=105):
+            assert cache.lookup("profile", key) == (b"{}", FRESH, 100)
+        with patch("time.time", return_value=125):
+            assert cache.lookup("profile", key) == (b"{}", STALE, 100)
+        with patch("time.time", return_value=131):
+            assert cache.lookup("profile", key) == (None, MISS, None)
+
+        assert cache.stats == {"hits": 1, "stale_hits": 1, "misses": 2, "evictions": 0}
+        assert cache.size == 0
+
+    def test_uncached_endpoint(self):
+        cache = ResponseCache(ttls={"profile": 10, "profiles": None})
+        cache.put("profiles", "key", b"{}")
+        cache.put("other", "key", b"{}")
+        assert cache.lookup("profiles", "key") == (None, MISS, None)
+        assert cache.lookup("other", "key") == (None, MISS, None)
+        assert cache.size == 0
+
+    def test_byte_cap_evicts_lru(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put("profile", "a", b"12345")
+        cache.put("profile", "b", b"12345")
+        cache.lookup("profile", "a")
+        cache.put("profile", "c", b"12345")
+
+        assert cache.lookup("profile", "b")[1] == MISS
+        assert cache.lookup("profile", "a")[1] == FRESH
+        assert cache.size == 10
+        assert cache.stats["evictions"] == 1
+
+    def test_sqlite_storage(self, tmp_path):
+        path = str(tmp_path / "responses.sqlite")
+        ResponseCache(path=path).put("profile", "a", b"12345")
+
+        cache = ResponseCache(path=path, max_bytes=8)
+        assert cache.size == 5
+        assert cache.lookup("profile", "a")[:2] == (b"12345", FRESH)
+        cache.put("profile", "b", b"1234")
+        assert cache.lookup("profile", "a")[1] == MISS
+        assert cache.size == 4
+
+    def test_single_refresh(self):
+        cache = ResponseCache()
+        assert cache.begin_refresh("a")
+        assert not cache.begin_refresh("a")
+        cache.end_refresh("a")
+        assert cache.begin_refresh("a")
+
+
+class TestClientResponseCache:
+    """Test the response cache integration in HypixelClient"""
+
+    UUID = "eca19e2e713d49a98582320229f696ed"
+
+    @staticmethod
+    def _response():
+        response = Mock(status_code=200, headers={})
+        response.content = json.dumps(MOCK_PROFILE_DATA).encode()
+        return response
+
+    @patch("requests.Session.get")
+    def test_fresh_hit_skips_request(self, mock_session_get):
+        mock_session_get.return_value = self._response()
+        cache = ResponseCache()
+
+        client = HypixelClient(api_key="test_key", response_cache=cache)
+        client.fetch_profile_info(self.UUID, "profile_id")
+        profile_data = client.fetch_profile_info(self.UUID, "profile_id")
+
+        assert profile_data.get_collection("LOG") == 77760
+        assert mock_session_get.call_count == 1
+        assert cache.stats["hits"] == 1
+
+    @patch("requests.Session.get")
+    def test_stale_hit_refreshes_in_background(self, mock_session_get):
+        refreshed = threading.Event()
+
+        def get(*args, **kwargs):
+            refreshed.set()
+            return self._response()
+
+        mock_session_get.side_effect = get
+        cache = ResponseCache(ttls={"profile": 0}, stale_ttl=60)
+        key = cache.make_key("profile", self.UUID, "profile_id")
+        cache.put("profile", key, json.dumps(MOCK_PROFILE_DATA).encode())
+
+        client = HypixelClient(api_key="test_key", response_cache=cache)
+        profile_data = client.fetch_profile_info(self.UUID, "profile_id")
+
+        assert profile_data.get_cata_level() == 24
+        assert refreshed.wait(5)
+        assert cache.stats["stale_hits"] == 1
+
+    @patch("requests.Session.get")
+    def test_hit_keeps_fetch_time(self, mock_session_get):
+        mock_session_get.return_value = self._response()
+        cache = ResponseCache(ttls={"profile": 60})
+        key = cache.make_key("profile", self.UUID, "profile_id")
+        with patch("time.time", return_value=100):
+            cache.put("profile", key, json.dumps(MOCK_PROFILE_DATA).encode())
+
+        client = HypixelClient(api_key="test_key", response_cache=cache)
+        with patch("time.time", return_value=130):
+            profile_data = client.fetch_profile_info(self.UUID, "profile_id")
+
+        assert profile_data.fetched_at == 100
+        mock_session_get.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_errors_are_not_cached(self, mock_session_get):
+        response = Mock(status_code=200, headers={})
+        response.content = b'{"success": false, "cause": "Invalid API key"}'
+        mock_session_get.return_value = response
+        cache = ResponseCache()
+
+        client = HypixelClient(api_key="test_key", response_cache=cache)
+        with pytest.raises(Exception, match="API Error"):
+            client.fetch_profile_info(self.UUID, "profile_id")
+
+        assert cache.size == 0
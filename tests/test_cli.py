@@ -0,0 +1,106 @@
+"""
+Tests for the hypixelez command-line crawler
+"""
+
+import functools
+import io
+import json
+
+import pytest
+
+from src.hypixelez import cli
+from src.hypixelez.cli import crawl, read_queries
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.transport import TransportConfig
+
+
+def _lines(out) -> list:
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestCrawl:
+    """Test crawling into NDJSON"""
+
+    def test_read_queries(self):
+        lines = ["Player1\n", "\n", "  # comment\n", " Player2 \n"]
+        assert list(read_queries(lines)) == ["Player1", "Player2"]
+
+    def test_summary_lines(self, server, fake_client):
+        out = io.StringIO()
+        queries = ["Player0", server.uuids["Player1"], "Nobody"]
+
+        stats = crawl(fake_client(server), queries, out, summary=True, workers=2)
+
+        assert stats == (2, 0, 1, 0)
+        records = {r["query"]: r for r in _lines(out)}
+        assert set(records) == {"Player0", server.uuids["Player1"]}
+        record = records["Player0"]
+        assert record["uuid"] == server.uuids["Player0"]
+        assert record["profile_id"] == server.profile_ids(record["uuid"])[0]
+        assert set(record["summary"]) >= {"skills", "slayers", "catacombs"}
+        assert "profile" not in record
+
+    def test_full_lines(self, server, fake_client):
+        out = io.StringIO()
+        profile_id = server.profile_ids(server.uuids["Player2"])[1]
+        crawl(fake_client(server), ["Player2"], out, profile=profile_id)
+
+        (record,) = _lines(out)
+        assert record["profile_id"] == profile_id
+        assert record["uuid"] in record["profile"]["members"]
+        assert ", " not in out.getvalue()
+
+    def test_resume_from_checkpoint(self, server, fake_client, tmp_path):
+        checkpoint = str(tmp_path / "done.txt")
+        first, second = io.StringIO(), io.StringIO()
+
+        queries = server.names[:3] + ["Nobody"]
+        crawl(fake_client(server), queries, first, checkpoint=checkpoint)
+        stats = crawl(fake_client(server), server.names, second, checkpoint=checkpoint)
+
+        assert len(_lines(first)) == 3
+        assert stats.skipped == 3
+        assert sorted(r["query"] for r in _lines(second)) == server.names[3:]
+        with open(checkpoint) as f:
+            assert sorted(f.read().split()) == sorted(server.names + ["Nobody"])
+        assert server.stats["requests"] == 2 * len(server.names) + 1
+
+    @pytest.mark.parametrize(
+        "server", [{"players": 2, "error_rate": 1.0}], indirect=True
+    )
+    def test_failures_are_retried_on_resume(self, server, fake_client, tmp_path):
+        checkpoint = str(tmp_path / "done.txt")
+        errors = io.StringIO()
+        client = fake_client(server, transport=TransportConfig(max_retries=0))
+        out = io.StringIO()
+        stats = crawl(client, server.names, out, checkpoint=checkpoint, errors=errors)
+
+        assert stats == (0, 0, 0, 2)
+        assert errors.getvalue().count("LookupError") == 2
+        with open(checkpoint) as f:
+            assert f.read() == ""
+
+
+class TestMain:
+    """Test the command-line entry point"""
+
+    def test_file_to_file(self, server, tmp_path, monkeypatch, capsys):
+        client = functools.partial(HypixelClient, **server.client_kwargs())
+        monkeypatch.setattr(cli, "HypixelClient", client)
+        source = tmp_path / "players.txt"
+        source.write_text("\n".join(server.names[:2]) + "\nNobody\n")
+        output = tmp_path / "profiles.ndjson"
+
+        code = cli.main(
+            [str(source), "-o", str(output), "--api-key", "key", "--summary"]
+        )
+
+        assert code == 0
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(r["query"] for r in records) == server.names[:2]
+        assert "2 written, 0 skipped, 1 not found, 0 failed" in capsys.readouterr().err
+
+    def test_api_key_required(self, monkeypatch):
+        monkeypatch.delenv("HYPIXEL_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            cli.main(["players.txt"])
@@ -0,0 +1,61 @@
+"""
+Tests for the pluggable JSON decoder backends
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hypixelez import decoders
+from src.hypixelez.decoders import get_decoder
+from src.hypixelez.hypixel_api import HypixelClient
+from .mocks import *
+
+
+class TestGetDecoder:
+    """Test backend resolution"""
+
+    def test_default_is_stdlib(self):
+        assert get_decoder() is json.loads
+
+    @pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+    def test_optional_backends(self, backend):
+        pytest.importorskip(backend)
+        decode = get_decoder(backend)
+
+        assert decode(json_body(MOCK_PROFILE_DATA)) == MOCK_PROFILE_DATA
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        def missing(name):
+            if name != "json":
+                raise ImportError(name)
+            return json.loads
+
+        monkeypatch.setattr(decoders, "_load_backend", missing)
+        assert get_decoder("auto") is json.loads
+
+    def test_callable_and_unknown(self):
+        custom = Mock()
+        assert get_decoder(custom) is custom
+        with pytest.raises(ValueError):
+            get_decoder("yaml")
+
+
+class TestClientDecoder:
+    """Test that the client decodes raw bodies with the configured backend"""
+
+    @patch("requests.Session.get")
+    def test_custom_decoder_gets_bytes(self, mock_session_get):
+        body = json_body(MOCK_PROFILE_DATA)
+        mock_session_get.return_value.content = body
+        decode = Mock(side_effect=json.loads)
+
+        client = HypixelClient(api_key="test_key", json_decoder=decode)
+        profile_data = client.fetch_profile_info(
+            "eca19e2e713d49a98582320229f696ed", "profile_id"
+        )
+
+        assert profile_data.get_collection("LOG") == 77760
+        decode.assert_called_once_with(body)
+        mock_session_get.return_value.json.assert_not_called()
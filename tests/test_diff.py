@@ -0,0 +1,57 @@
+"""
+Tests for profile diffing and XP rates
+"""
+
+import copy
+
+import pytest
+
+from src.hypixelez.diff import MetricChange, diff_profiles
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.snapshot import ProfileSnapshot
+from .mocks import *
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+
+
+def _later_profile():
+    data = copy.deepcopy(MOCK_PROFILE_DATA)
+    member = data["profile"]["members"][UUID]
+    member["player_data"]["experience"]["SKILL_MINING"] += 7200
+    member["slayer"]["slayer_bosses"]["zombie"]["boss_kills_tier_3"] += 2
+    return SkyblockProfileData(data, UUID, fetched_at=1800.0)
+
+
+class TestDiffProfiles:
+    """Test one-pass snapshot comparison"""
+
+    def test_only_changed_metrics(self):
+        old = SkyblockProfileData(MOCK_PROFILE_DATA, UUID, fetched_at=0.0)
+
+        diff = diff_profiles(old, _later_profile())
+
+        assert diff.elapsed == 1800
+        assert diff.changes == {
+            "SKILL_MINING": MetricChange(2000000, 2007200, 7200, 14400.0),
+            "zombie_boss_kills_tier_3": MetricChange(5, 7, 2, 4.0),
+        }
+        assert list(diff.section("skills")) == ["SKILL_MINING"]
+        assert diff.section("collections") == {}
+
+    def test_custom_rate_unit(self):
+        old = ProfileSnapshot.from_profile(
+            SkyblockProfileData(MOCK_PROFILE_DATA, UUID), fetched_at=0.0
+        )
+
+        diff = diff_profiles(old, _later_profile(), per=60)
+
+        assert diff.changes["SKILL_MINING"].rate == 240.0
+
+    def test_invalid_pairs(self):
+        old = SkyblockProfileData(MOCK_PROFILE_DATA, UUID, fetched_at=0.0)
+        other = SkyblockProfileData(MOCK_PROFILE_DATA, "other", fetched_at=10.0)
+
+        with pytest.raises(ValueError):
+            diff_profiles(old, other)
+        with pytest.raises(ValueError):
+            diff_profiles(_later_profile(), old)
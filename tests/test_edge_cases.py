@@ -5,16 +5,17 @@ Test edge cases and error scenarios
 import pytest
 from unittest.mock import Mock, patch
 from src.hypixelez.hypixel_api import HypixelClient, SkyblockProfileData
+from .mocks import json_body
 
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_uuid_not_found(self, mock_get):
         """Test when UUID is not found"""
         mock_response = Mock()
-        mock_response.json.return_value = {}  # No 'id' field
+        mock_response.content = json_body({})  # No 'id' field
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -37,7 +38,7 @@ class TestEdgeCases:
     def test_rate_limit_handling(self, mock_session_get):
         """Test rate limit error handling"""
         mock_response = Mock()
-        mock_response.json.return_value = {"success": False, "cause": "Key throttle"}
+        mock_response.content = json_body({"success": False, "cause": "Key throttle"})
         mock_response.raise_for_status = Mock()
         mock_session_get.return_value = mock_response
 
@@ -60,8 +61,10 @@ class TestPerformance:
 
     def test_uuid_caching(self, mock_requests):
         """Test that UUID caching works"""
-        mock_requests["get"].return_value.json.return_value = {"id": "test_uuid"}
-        mock_requests["get"].return_value.raise_for_status = Mock()
+        mock_requests["session_get"].return_value.content = json_body(
+            {"id": "test_uuid"}
+        )
+        mock_requests["session_get"].return_value.raise_for_status = Mock()
 
         client = HypixelClient(api_key="test_key")
 
@@ -73,4 +76,4 @@ class TestPerformance:
 
         assert uuid1 == uuid2 == "test_uuid"
         # Should only make one actual request
-        assert mock_requests["get"].call_count == 1
+        assert mock_requests["session_get"].call_count == 1
@@ -0,0 +1,94 @@
+"""
+Tests for the fake API server and the load-test harness
+"""
+
+import pytest
+import requests
+
+from src.hypixelez.fakeserver import (
+    first_member,
+    make_profile_response,
+    make_profiles_response,
+)
+from src.hypixelez.loadtest import run_load_test
+from src.hypixelez.transport import TransportConfig
+
+
+class TestFixtures:
+    """Test the generated responses"""
+
+    def test_profile_response(self):
+        response = make_profile_response(seed=1, members=4, inventory_bytes=600)
+        assert make_profile_response(seed=1, members=4, inventory_bytes=600) == response
+        assert len(response["profile"]["members"]) == 4
+
+    def test_profiles_response(self):
+        response = make_profiles_response(profiles=3, members=2, inventory_bytes=60)
+        player = first_member(response)
+
+        assert all(player in p["members"] for p in response["profiles"])
+        assert [p["selected"] for p in response["profiles"]] == [True, False, False]
+
+
+class TestFakeServer:
+    """Test the client against the fake server"""
+
+    def test_lookup_chain(self, server, fake_client):
+        client = fake_client(server)
+        uuid = client.get_uuid_by_name("player3")
+
+        assert uuid == server.uuids["Player3"]
+        assert client.get_uuid_by_name("Nobody") is None
+        assert client.get_uuids_by_names(["Player1", "Nobody"]) == {
+            "Player1": server.uuids["Player1"],
+            "Nobody": None,
+        }
+
+        selected = client.fetch_selected_profile(uuid)
+        profile_id = server.profile_ids(uuid)[0]
+        by_id = client.fetch_profile_info(uuid, profile_id)
+        assert selected.get_all_skills() == by_id.get_all_skills()
+        assert len(client.fetch_all_profiles(uuid)) <= 2
+
+    def test_api_key_required(self, server):
+        response = requests.get(server.client_kwargs()["profiles_url"])
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("server", [{"players": 1, "rate_limit": 2}], indirect=True)
+    def test_rate_limit_headers(self, server):
+        url = server.client_kwargs()["profiles_url"]
+        params = {"uuid": server.uuids["Player0"]}
+        headers = {"API-Key": "key"}
+        responses = [
+            requests.get(url, params=params, headers=headers) for _ in range(3)
+        ]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[0].headers["RateLimit-Remaining"] == "1"
+        assert responses[0].headers["RateLimit-Limit"] == "2"
+
+    @pytest.mark.parametrize(
+        "server", [{"players": 1, "error_rate": 1.0}], indirect=True
+    )
+    def test_error_injection(self, server, fake_client):
+        client = fake_client(server, transport=TransportConfig(max_retries=0))
+        with pytest.raises(requests.HTTPError):
+            client.fetch_all_profiles(server.uuids["Player0"])
+        assert server.stats["errors"] == 1
+
+
+class TestLoadTest:
+    """Test the load-test harness"""
+
+    @pytest.mark.parametrize("server", [{"players": 20}], indirect=True)
+    def test_report(self, server, fake_client):
+        client = fake_client(server)
+        report = run_load_test(client, server.names + ["Nobody"], concurrency=4)
+
+        assert report.calls == 21
+        assert report.errors == 1
+        assert report.requests == 41
+        assert 0 < report.p50 <= report.p99 <= report.max
+        assert report.throughput > 0
+        assert client.hooks is None
+        assert "calls: 21 (1 failed)" in report.format()
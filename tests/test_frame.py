@@ -0,0 +1,91 @@
+"""
+Tests for the columnar profile frame
+"""
+
+import copy
+
+import pytest
+
+import src.hypixelez.frame as frame_module
+from src.hypixelez import hypixel_api
+from src.hypixelez.frame import ProfileFrame
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.snapshot import ProfileSnapshot
+from .mocks import *
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+
+
+def _profile(uuid, mining, catacombs):
+    data = copy.deepcopy(MOCK_PROFILE_DATA)
+    member = data["profile"]["members"].pop(UUID)
+    member["player_data"]["experience"]["SKILL_MINING"] = mining
+    member["dungeons"]["dungeon_types"]["catacombs"]["experience"] = catacombs
+    data["profile"]["members"][uuid] = member
+    return SkyblockProfileData(data, uuid)
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def frame(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(frame_module, "_import_numpy", lambda: None)
+        monkeypatch.setattr(hypixel_api, "_import_numpy", lambda: None)
+
+    profiles = [
+        _profile("a", 100, 0),
+        _profile("b", 3000, 200),
+        _profile("c", 3000, 567442),
+        _profile("d", 50, 567442),
+    ]
+    # Snapshots and profiles can be mixed
+    profiles[0] = ProfileSnapshot.from_profile(profiles[0])
+    return ProfileFrame.from_profiles(profiles)
+
+
+class TestProfileFrame:
+    """Test columnar operations with and without NumPy"""
+
+    def test_columns(self, frame):
+        assert len(frame) == 4
+        assert list(frame["SKILL_MINING"]) == [100, 3000, 3000, 50]
+        assert list(frame["LOG"]) == [77760] * 4
+
+    def test_filter_and_sort(self, frame):
+        mask = [value > 60 for value in frame["SKILL_MINING"]]
+        filtered = frame.filter(mask)
+
+        assert filtered.uuids == ["a", "b", "c"]
+        assert filtered.sort("SKILL_MINING").uuids == ["b", "c", "a"]
+        ascending = frame.sort("SKILL_MINING", descending=False)
+        assert ascending.uuids == ["d", "a", "b", "c"]
+        assert frame.top("catacombs", 2) == [("c", 567442), ("d", 567442)]
+
+    def test_percentile(self, frame):
+        assert frame.percentile("SKILL_MINING", 50) == 1550
+        assert frame.percentile("SKILL_MINING", 100) == 3000
+
+    def test_group_by(self, frame):
+        levels = frame.levels("catacombs")
+
+        assert [int(level) for level in levels] == [0, 2, 24, 24]
+        assert frame.group_by(levels, "SKILL_MINING", "mean") == {
+            0: 100,
+            2: 3000,
+            24: 1525,
+        }
+        assert frame.group_by("SKILL_MINING", "catacombs", "max") == {
+            50: 567442,
+            100: 0,
+            3000: 567442,
+        }
+        assert frame.group_by(levels, "SKILL_MINING", "sum")[24] == 3050
+
+    def test_invalid_arguments(self, frame):
+        with pytest.raises(ValueError):
+            frame.group_by("SKILL_MINING", "LOG", "mode")
+        with pytest.raises(ValueError):
+            frame.filter([True])
+        with pytest.raises(ValueError):
+            frame.levels("LOG")
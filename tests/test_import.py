@@ -0,0 +1,69 @@
+"""
+Tests for lazy imports and deferred initialization
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+HEAVY = ["requests", "aiohttp", "asyncio", "sqlite3", "http.server", "ijson"]
+
+
+def _run(code: str, cwd) -> dict:
+    """Run ``code`` in a fresh interpreter and return the JSON it printed last"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": SRC},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _loaded(setup: str, tmp_path) -> dict:
+    code = (
+        "import json, logging, os, sys\n"
+        f"{setup}\n"
+        "print(json.dumps({\n"
+        f"    'modules': [m for m in {HEAVY!r} if m in sys.modules],\n"
+        "    'handlers': len(logging.getLogger().handlers),\n"
+        "    'app_log': os.path.exists('app.log'),\n"
+        "}))"
+    )
+    return _run(code, tmp_path)
+
+
+class TestLazyImport:
+    """Test that importing the package and creating a client stay cheap"""
+
+    def test_import_package(self, tmp_path):
+        loaded = _loaded("import hypixelez", tmp_path)
+        assert loaded == {"modules": [], "handlers": 0, "app_log": False}
+
+    def test_create_client(self, tmp_path):
+        loaded = _loaded("import hypixelez\nhypixelez.HypixelClient('key')", tmp_path)
+        assert loaded == {"modules": [], "handlers": 0, "app_log": False}
+
+    def test_session_built_on_first_use(self, tmp_path):
+        setup = "import hypixelez\nhypixelez.HypixelClient('key').session"
+        loaded = _loaded(setup, tmp_path)
+
+        assert loaded["modules"] == ["requests"]
+        assert loaded["handlers"] == 2
+        assert loaded["app_log"]
+
+    def test_public_names(self):
+        code = (
+            "import json, hypixelez\n"
+            "from hypixelez import calculate_levels, hypixel_api\n"
+            "print(json.dumps([\n"
+            "    calculate_levels is hypixel_api.calculate_levels,\n"
+            "    sorted(set(hypixelez.__all__) - set(dir(hypixelez))),\n"
+            "    hasattr(hypixelez, 'missing'),\n"
+            "]))"
+        )
+        assert _run(code, SRC) == [True, [], False]
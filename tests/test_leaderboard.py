@@ -0,0 +1,73 @@
+"""
+Tests for the incremental leaderboard
+"""
+
+import pytest
+
+import src.hypixelez.leaderboard as leaderboard_module
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.leaderboard import Leaderboard
+from src.hypixelez.snapshot import METRICS, ProfileSnapshot
+from .mocks import *
+
+
+def _snapshot(uuid, **metrics):
+    values = [metrics.get(metric, 0) for metric in METRICS]
+    return ProfileSnapshot(uuid, values)
+
+
+@pytest.fixture(params=["sortedcontainers", "bisect"])
+def board(request, monkeypatch):
+    if request.param == "sortedcontainers":
+        pytest.importorskip("sortedcontainers")
+    else:
+        monkeypatch.setattr(leaderboard_module, "SortedList", None)
+    return Leaderboard(["LOG", "zombie"])
+
+
+class TestLeaderboard:
+    """Test incremental ranking"""
+
+    def test_top_and_rank(self, board):
+        board.update_many(
+            [
+                _snapshot("a", LOG=10, zombie=5),
+                _snapshot("b", LOG=30),
+                _snapshot("c", LOG=20),
+                _snapshot("d", LOG=20),
+            ]
+        )
+
+        assert board.top("LOG", 3) == [("b", 30), ("c", 20), ("d", 20)]
+        assert board.rank("b", "LOG") == 1
+        assert board.rank("d", "LOG") == 2
+        assert board.rank("a", "LOG") == 4
+        assert board.rank("a", "zombie") == 1
+        assert board.rank("unknown", "LOG") is None
+        assert len(board) == 4
+
+    def test_update_moves_player(self, board):
+        board.update(_snapshot("a", LOG=10))
+        board.update(_snapshot("b", LOG=20))
+        board.update(_snapshot("a", LOG=50))
+
+        assert board.top("LOG") == [("a", 50), ("b", 20)]
+        assert board.value("a", "LOG") == 50
+
+    def test_remove(self, board):
+        board.update(_snapshot("a", LOG=10))
+        board.remove("a")
+        board.remove("unknown")
+
+        assert "a" not in board
+        assert board.top("LOG") == []
+
+    def test_accepts_profiles(self, board):
+        uuid = "eca19e2e713d49a98582320229f696ed"
+        board.update(SkyblockProfileData(MOCK_PROFILE_DATA, uuid))
+
+        assert board.top("zombie") == [(uuid, 148706)]
+
+    def test_unknown_metric(self):
+        with pytest.raises(KeyError):
+            Leaderboard(["NOT_A_METRIC"])
@@ -0,0 +1,84 @@
+"""
+Tests for logging setup
+"""
+
+import logging
+
+import pytest
+
+from src.hypixelez.hypixel_api import HypixelClient, SkyblockProfileData
+from src.hypixelez.logger import (
+    DuplicateFilter,
+    setup_queue_logging,
+    stop_queue_logging,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def library_logger():
+    logger = logging.getLogger("hypixelez")
+    yield logger
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+def _record(msg, *args):
+    return logging.LogRecord("hypixelez", logging.WARNING, "", 0, msg, args, None)
+
+
+class TestDuplicateFilter:
+    """Test suppression of repeated messages"""
+
+    def test_repeats_are_suppressed(self):
+        dedupe = DuplicateFilter(interval=60)
+
+        assert dedupe.filter(_record("Collection '%s' not found", "LOG"))
+        assert not dedupe.filter(_record("Collection '%s' not found", "LOG"))
+        assert dedupe.filter(_record("Collection '%s' not found", "COAL"))
+
+    def test_interval_expires(self):
+        dedupe = DuplicateFilter(interval=0)
+
+        assert dedupe.filter(_record("Global xp not found"))
+        assert dedupe.filter(_record("Global xp not found"))
+
+
+class TestQueueLogging:
+    """Test production logging through a queue listener"""
+
+    def test_records_reach_handlers(self, library_logger):
+        handler = _ListHandler()
+        root_handlers = logging.root.handlers[:]
+
+        setup_queue_logging(handlers=[handler])
+        profile = SkyblockProfileData({}, "uuid")
+        for _ in range(3):
+            profile.get_collection("LOG")
+        stop_queue_logging()
+        stop_queue_logging()
+
+        assert handler.messages == ["Collection 'LOG' not found"]
+        assert logging.root.handlers == root_handlers
+        assert not library_logger.propagate
+
+    def test_client_can_leave_logging_alone(self, library_logger):
+        root_handlers = logging.root.handlers[:]
+        root_level = logging.root.level
+
+        client = HypixelClient(api_key="test_key", debug=None)
+        # Logging is configured together with the session, on first use
+        client.session
+
+        assert logging.root.handlers == root_handlers
+        assert logging.root.level == root_level
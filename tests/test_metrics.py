@@ -0,0 +1,225 @@
+"""
+Tests for the instrumentation hooks and the metrics collector
+"""
+
+import asyncio
+import urllib.request
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from src.hypixelez.async_api import AsyncHypixelClient
+from src.hypixelez.cache import ResponseCache
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.metrics import (
+    HIT,
+    MISS,
+    Hooks,
+    MetricsCollector,
+    serve_prometheus,
+)
+from .mocks import *
+from .test_async import FakeResponse, make_session
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+
+
+def _response(status, data=None, headers=None):
+    response = Mock(status_code=status, headers=headers or {})
+    response.content = json_body(data)
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return response
+
+
+def _count(metrics, histogram, endpoint):
+    return metrics.histogram(histogram, endpoint=endpoint).count
+
+
+class TestMetricsCollector:
+    """Test aggregation and exposition of hook events"""
+
+    def test_histogram_buckets_and_quantile(self):
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        for elapsed in (0.05, 0.1, 0.5, 2.0):
+            metrics.on_request("profile", 200, elapsed, 10)
+
+        latency = metrics.histogram("request_duration_seconds", endpoint="profile")
+        assert latency.counts == (2, 3, 4)
+        assert latency.count == 4
+        assert latency.sum == pytest.approx(2.65)
+        assert latency.quantile(0.5) == pytest.approx(0.1)
+        assert latency.quantile(0.75) == pytest.approx(1.0)
+        assert metrics.counter("requests_total", endpoint="profile", status=200) == 4
+        assert metrics.counter("response_bytes_total", endpoint="profile") == 40
+
+    def test_unseen_series_are_empty(self):
+        metrics = MetricsCollector()
+        assert metrics.counter("retries_total", endpoint="mojang", reason="503") == 0
+        assert metrics.histogram("decode_duration_seconds", endpoint="x").count == 0
+        assert metrics.cache_hit_ratio("uuid") is None
+        with pytest.raises(KeyError):
+            metrics.counter("retries_total", endpoint="mojang")
+
+    def test_cache_hit_ratio_and_reset(self):
+        metrics = MetricsCollector()
+        metrics.on_cache("uuid", HIT, 3)
+        metrics.on_cache("uuid", MISS)
+
+        assert metrics.cache_hit_ratio("uuid") == 0.75
+        metrics.reset()
+        assert metrics.cache_hit_ratio("uuid") is None
+
+    def test_prometheus_text(self):
+        metrics = MetricsCollector(buckets=(1.0,))
+        metrics.on_request("profile", 200, 0.5, 100)
+        metrics.on_retry("profile", "503", 1.0)
+
+        text = metrics.to_prometheus()
+        assert "# TYPE hypixelez_request_duration_seconds histogram" in text
+        bucket = "hypixelez_request_duration_seconds_bucket"
+        assert bucket + '{endpoint="profile",le="1.0"} 1' in text
+        assert bucket + '{endpoint="profile",le="+Inf"} 1' in text
+        assert 'hypixelez_request_duration_seconds_count{endpoint="profile"} 1' in text
+        assert 'hypixelez_requests_total{endpoint="profile",status="200"} 1.0' in text
+        assert 'hypixelez_retries_total{endpoint="profile",reason="503"} 1.0' in text
+        assert text.endswith("\n")
+
+    def test_serve_prometheus(self):
+        metrics = MetricsCollector()
+        metrics.on_throttle("profile", 2.0)
+        server = serve_prometheus(metrics, port=0)
+        try:
+            host, port = server.server_address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as reply:
+                body = reply.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'hypixelez_throttles_total{endpoint="profile"} 1.0' in body
+
+
+class TestClientHooks:
+    """Test that the clients report their activity to the hooks"""
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_requests_retries_and_decode(self, mock_session_get, mock_sleep):
+        mock_session_get.side_effect = [
+            _response(429, headers={"Retry-After": "1"}),
+            _response(503),
+            _response(200, MOCK_PROFILE_DATA),
+        ]
+        metrics = MetricsCollector()
+        client = HypixelClient(api_key="test_key", hooks=metrics)
+
+        client.fetch_profile_info(UUID, "profile_id")
+
+        assert metrics.counter("throttles_total", endpoint="profile") == 1
+        for reason in ("429", "503"):
+            retries = metrics.counter(
+                "retries_total", endpoint="profile", reason=reason
+            )
+            assert retries == 1
+        assert metrics.counter("requests_total", endpoint="profile", status=200) == 1
+        assert _count(metrics, "request_duration_seconds", "profile") == 3
+        assert _count(metrics, "decode_duration_seconds", "profile") == 1
+        received = metrics.counter("response_bytes_total", endpoint="profile")
+        assert received == len(json_body(MOCK_PROFILE_DATA)) + 2 * len(json_body(None))
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_network_errors(self, mock_session_get, mock_sleep):
+        mock_session_get.side_effect = [
+            requests.ConnectionError("boom"),
+            _response(200, MOCK_UUID_RESPONSE),
+        ]
+        metrics = MetricsCollector()
+        client = HypixelClient(api_key="test_key", hooks=metrics)
+
+        assert client.get_uuid_by_name("Neono4ka") == UUID
+        assert metrics.counter("requests_total", endpoint="mojang", status="error") == 1
+        retries = metrics.counter(
+            "retries_total", endpoint="mojang", reason="ConnectionError"
+        )
+        assert retries == 1
+
+    @patch("requests.Session.get")
+    def test_uuid_cache_lookups(self, mock_session_get):
+        mock_session_get.return_value = _response(200, MOCK_UUID_RESPONSE)
+        metrics = MetricsCollector()
+        client = HypixelClient(api_key="test_key", hooks=metrics)
+
+        client.get_uuid_by_name("Neono4ka")
+        client.get_uuid_by_name("Neono4ka")
+
+        assert metrics.counter("cache_lookups_total", cache="uuid", result=HIT) == 1
+        assert metrics.counter("cache_lookups_total", cache="uuid", result=MISS) == 1
+
+    @patch("requests.Session.post")
+    def test_bulk_uuid_cache_lookups(self, mock_session_post):
+        mock_session_post.return_value = _response(
+            200, [{"id": UUID, "name": "Neono4ka"}]
+        )
+        metrics = MetricsCollector()
+        client = HypixelClient(api_key="test_key", hooks=metrics)
+        client._uuid_cache.set("Other", None)
+
+        client.get_uuids_by_names(["Neono4ka", "Other"])
+
+        assert metrics.cache_hit_ratio("uuid") == 0.5
+        assert _count(metrics, "decode_duration_seconds", "mojang_bulk") == 1
+
+    @patch("requests.Session.get")
+    def test_response_cache_lookups(self, mock_session_get):
+        mock_session_get.return_value = _response(200, MOCK_PROFILE_DATA)
+        metrics = MetricsCollector()
+        client = HypixelClient(
+            api_key="test_key",
+            hooks=metrics,
+            response_cache=ResponseCache(ttls={"profile": 60}),
+        )
+
+        for _ in range(3):
+            client.fetch_profile_info(UUID, "profile_id")
+
+        assert metrics.cache_hit_ratio("response") == pytest.approx(2 / 3)
+        assert _count(metrics, "decode_duration_seconds", "profile") == 3
+
+    @patch("requests.Session.get")
+    def test_custom_hooks(self, mock_session_get):
+        mock_session_get.return_value = _response(200, MOCK_UUID_RESPONSE)
+        events = []
+
+        class Recorder(Hooks):
+            def on_request(self, endpoint, status, elapsed, size):
+                events.append((endpoint, status))
+
+        client = HypixelClient(api_key="test_key", hooks=Recorder())
+        client.get_uuid_by_name("Neono4ka")
+
+        assert events == [("mojang", 200)]
+
+    def test_async_client(self):
+        session = make_session()
+        session.get.side_effect = [
+            FakeResponse(MOCK_UUID_RESPONSE),
+            FakeResponse(MOCK_PROFILE_DATA),
+        ]
+        metrics = MetricsCollector()
+        client = AsyncHypixelClient(api_key="test_key", session=session, hooks=metrics)
+
+        async def run():
+            await client.get_uuid_by_name("Neono4ka")
+            await client.get_uuid_by_name("Neono4ka")
+            await client.fetch_profile_info(UUID, "profile_id")
+
+        asyncio.run(run())
+
+        assert metrics.counter("requests_total", endpoint="mojang", status=200) == 1
+        assert metrics.counter("requests_total", endpoint="profile", status=200) == 1
+        assert _count(metrics, "decode_duration_seconds", "profile") == 1
+        assert metrics.counter("rate_limit_wait_seconds_total", endpoint="profile") >= 0
+        assert metrics.cache_hit_ratio("uuid") == 0.5
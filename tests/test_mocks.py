@@ -2,21 +2,30 @@
 Tests using mock data
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
-from src.hypixelez.hypixel_api import HypixelClient, SkyblockProfileData
+from src.hypixelez import hypixel_api
+from src.hypixelez.hypixel_api import (
+    HypixelClient,
+    NotFoundError,
+    SkyblockProfileData,
+    calculate_levels,
+)
+from src.hypixelez.transport import TransportConfig
 from .mocks import *
 
 
 class TestWithMocks:
     """Test cases using mock data"""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_uuid_with_mock(self, mock_get):
         """Test UUID lookup with mock data"""
         # Setup mock
         mock_response = Mock()
-        mock_response.json.return_value = MOCK_UUID_RESPONSE
+        mock_response.content = json_body(MOCK_UUID_RESPONSE)
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -27,7 +36,8 @@ class TestWithMocks:
         # Assertions
         assert uuid == "eca19e2e713d49a98582320229f696ed"
         mock_get.assert_called_once_with(
-            "https://api.mojang.com/users/profiles/minecraft/Neono4ka", timeout=10
+            "https://api.mojang.com/users/profiles/minecraft/Neono4ka",
+            timeout=TransportConfig().timeout,
         )
 
     @patch("requests.Session.get")
@@ -35,7 +45,7 @@ class TestWithMocks:
         """Test profile fetching with mock data"""
         # Setup mock
         mock_response = Mock()
-        mock_response.json.return_value = MOCK_PROFILE_DATA
+        mock_response.content = json_body(MOCK_PROFILE_DATA)
         mock_response.raise_for_status = Mock()
         mock_session_get.return_value = mock_response
 
@@ -56,7 +66,7 @@ class TestWithMocks:
         """Test API error handling with mock"""
         # Setup error mock
         mock_response = Mock()
-        mock_response.json.return_value = MOCK_ERROR_RESPONSE
+        mock_response.content = json_body(MOCK_ERROR_RESPONSE)
         mock_response.raise_for_status = Mock()
         mock_session_get.return_value = mock_response
 
@@ -71,7 +81,7 @@ class TestWithMocks:
         """Test handling of missing data with mock"""
         # Setup empty data mock
         mock_response = Mock()
-        mock_response.json.return_value = MOCK_EMPTY_PROFILE
+        mock_response.content = json_body(MOCK_EMPTY_PROFILE)
         mock_response.raise_for_status = Mock()
         mock_session_get.return_value = mock_response
 
@@ -124,6 +134,44 @@ class TestSkyblockProfileDataWithMocks:
         assert self.profile_data.get_global_level() == 169
         assert self.profile_data.get_global_xp() == 15
 
+    def test_sections_are_memoized(self):
+        """Test that member sections are resolved only once"""
+        self.profile_data.get_collection("LOG")
+        member = self.profile_data._member
+
+        self.profile_data.get_skill_level("SKILL_CARPENTRY")
+        assert self.profile_data._member is member
+        assert "_collection" in vars(self.profile_data)
+        assert "_slayer_bosses" not in vars(self.profile_data)
+
+    def test_bulk_accessors(self):
+        """Test that bulk accessors agree with the single getters"""
+        summary = self.profile_data.summary()
+
+        assert summary["skills"]["SKILL_CARPENTRY"] == {"level": 27, "xp": 687291}
+        assert summary["collections"]["LOG"] == 77760
+        assert summary["collections"]["WHEAT"] == self.profile_data.get_collection(
+            "WHEAT"
+        )
+        assert summary["slayers"]["zombie"] == {
+            "level": 7,
+            "xp": 148706,
+            "kills": [15, 10, 8, 5],
+        }
+        assert summary["slayers"]["blaze"] == {"level": 0, "xp": 0, "kills": []}
+        assert summary["dungeon_classes"]["berserk"] == {"level": 23, "xp": 21880}
+        assert summary["catacombs"] == {"level": 24, "xp": 78802}
+        assert summary["global"] == {"level": 169, "xp": 15}
+
+    def test_missing_member(self):
+        """Test getters when the member is absent from the profile"""
+        profile_data = SkyblockProfileData({"profile": {"members": None}}, "uuid")
+
+        assert profile_data.get_collection("LOG") == 0
+        assert profile_data.get_cata_level() == 0
+        assert profile_data.get_slayer_stats("zombie") == []
+        assert profile_data.summary()["skills"]["SKILL_MINING"] == {"level": 0, "xp": 0}
+
 
 @pytest.mark.parametrize(
     "xp,expected_level",
@@ -150,3 +198,218 @@ def test_skill_level_calculation(xp, expected_level):
     level = profile.get_skill_level("TEST_SKILL")
 
     assert level == expected_level
+
+
+class TestCalculateLevels:
+    """Test batch level computation"""
+
+    XPS = [0, 50, 100, 14926, 999999999]
+
+    @pytest.fixture(params=["numpy", "fallback"])
+    def backend(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(hypixel_api, "_import_numpy", lambda: None)
+
+    @staticmethod
+    def _scalar(xp, table):
+        member = {
+            "player_data": {"experience": {"SKILL": xp}},
+            "dungeons": {"player_classes": {"mage": {"experience": xp}}},
+        }
+        profile = SkyblockProfileData({"profile": {"members": {"u": member}}}, "u")
+        if table == "skill":
+            return (
+                profile.get_skill_level("SKILL"),
+                profile.get_skill_current_level_xp("SKILL"),
+            )
+        return profile.get_cata_class_level("mage"), profile.get_cata_class_xp("mage")
+
+    @pytest.mark.parametrize("table", ["skill", "catacombs"])
+    def test_matches_getters(self, backend, table):
+        levels, progress = calculate_levels(self.XPS, table)
+
+        for xp, level, current in zip(self.XPS, levels, progress):
+            assert (level, current) == self._scalar(xp, table)
+
+    def test_custom_table(self, backend):
+        levels, progress = calculate_levels(iter([5, 10, 25]), [10, 20])
+
+        assert list(levels) == [0, 1, 2]
+        assert list(progress) == [5, 0, 5]
+
+
+class TestFetchMany:
+    """Test concurrent bulk fetching"""
+
+    @staticmethod
+    def _route(url, *args, **kwargs):
+        response = Mock()
+        response.raise_for_status = Mock()
+        if "mojang" in url:
+            name = url.rsplit("/", 1)[-1]
+            response.content = json_body(
+                {} if name == "Missing" else {"id": "eca19e2e713d49a98582320229f696ed"}
+            )
+        elif url.endswith("/profiles"):
+            response.content = json_body(MOCK_FULL_PROFILES_RESPONSE)
+        else:
+            response.content = json_body(MOCK_PROFILE_DATA)
+        return response
+
+    @patch("requests.Session.get")
+    def test_fetch_many_names(self, mock_session_get):
+        """Test that names resolve and per-item errors are reported"""
+        mock_session_get.side_effect = self._route
+
+        client = HypixelClient(api_key="test_key")
+        results = {
+            r.query: r
+            for r in client.fetch_many(["Neono4ka", "Missing"], max_workers=2)
+        }
+
+        assert results["Neono4ka"].error is None
+        assert results["Neono4ka"].data.get_collection("LOG") == 77760
+        assert results["Missing"].data is None
+        assert isinstance(results["Missing"].error, NotFoundError)
+
+    @patch("requests.Session.get")
+    def test_fetch_many_uuids_by_cute_name(self, mock_session_get):
+        """Test that UUID inputs skip Mojang and cute names select the profile"""
+        mock_session_get.side_effect = self._route
+
+        client = HypixelClient(api_key="test_key")
+        uuids = ["eca19e2e-713d-49a9-8582-320229f696ed"] * 5
+        results = list(client.fetch_many(uuids, max_workers=2, profile="Kiwi"))
+
+        assert len(results) == 5
+        assert all(r.data.get_collection("LOG") == 100 for r in results)
+        # overlapping identical lookups may share one request
+        assert 1 <= mock_session_get.call_count <= 5
+        for args, kwargs in mock_session_get.call_args_list:
+            assert args[0].endswith("/profiles")
+            assert kwargs["params"] == {"uuid": "eca19e2e713d49a98582320229f696ed"}
+
+    @patch("requests.Session.get")
+    def test_fetch_many_coalesces_identical_lookups(self, mock_session_get):
+        """Test that concurrent lookups of one player share a profiles request"""
+
+        def slow_route(url, *args, **kwargs):
+            threading.Event().wait(0.2)
+            return self._route(url, *args, **kwargs)
+
+        mock_session_get.side_effect = slow_route
+
+        client = HypixelClient(api_key="test_key")
+        uuids = ["eca19e2e713d49a98582320229f696ed"] * 4
+        results = list(client.fetch_many(uuids, max_workers=4, profile="Kiwi"))
+
+        assert all(r.data.get_collection("LOG") == 100 for r in results)
+        assert mock_session_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_fetch_many_by_profile_id(self, mock_session_get):
+        """Test that a profile id goes straight to the profile endpoint"""
+        mock_session_get.side_effect = self._route
+
+        client = HypixelClient(api_key="test_key")
+        profile_id = "f5791b0c-caf1-4701-aea3-d727ea53a901"
+        (result,) = client.fetch_many(
+            ["eca19e2e713d49a98582320229f696ed"], profile=profile_id
+        )
+
+        assert result.data.get_skill_level("SKILL_CARPENTRY") == 27
+        _, kwargs = mock_session_get.call_args
+        assert kwargs["params"]["profile"] == profile_id
+
+
+class TestFetchAllProfiles:
+    """Test single-call profile fetching"""
+
+    def _client(self, mock_session_get, data):
+        mock_session_get.return_value.content = json_body(data)
+        return HypixelClient(api_key="test_key")
+
+    @patch("requests.Session.get")
+    def test_fetch_all_profiles(self, mock_session_get):
+        client = self._client(mock_session_get, MOCK_FULL_PROFILES_RESPONSE)
+        profiles = client.fetch_all_profiles("eca19e2e713d49a98582320229f696ed")
+
+        assert set(profiles) == {"Peach", "Kiwi"}
+        assert profiles["Peach"].get_cata_level() == 24
+        assert profiles["Kiwi"].get_collection("LOG") == 100
+        mock_session_get.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_fetch_selected_profile(self, mock_session_get):
+        client = self._client(mock_session_get, MOCK_FULL_PROFILES_RESPONSE)
+        profile = client.fetch_selected_profile("eca19e2e713d49a98582320229f696ed")
+
+        assert profile.get_collection("LOG") == 77760
+
+    @patch("requests.Session.get")
+    def test_player_without_profiles(self, mock_session_get):
+        client = self._client(mock_session_get, {"success": True, "profiles": None})
+
+        assert client.fetch_all_profiles("test_uuid") == {}
+        assert client.fetch_selected_profile("test_uuid") is None
+        (result,) = client.fetch_many(["eca19e2e713d49a98582320229f696ed"])
+        assert isinstance(result.error, NotFoundError)
+
+    @patch("requests.Session.get")
+    def test_api_error(self, mock_session_get):
+        client = self._client(mock_session_get, MOCK_ERROR_RESPONSE)
+
+        with pytest.raises(Exception, match="API Error: Invalid API key"):
+            client.fetch_all_profiles("test_uuid")
+
+
+class TestBulkUUIDLookup:
+    """Test batched Mojang name -> UUID resolution"""
+
+    @staticmethod
+    def _bulk(url, json=None, **kwargs):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.content = json_body(
+            [
+                {"id": f"uuid-{name.lower()}", "name": name.lower()}
+                for name in json
+                if not name.startswith("Missing")
+            ]
+        )
+        return response
+
+    @patch("requests.Session.post")
+    def test_chunks_and_dedupes(self, mock_post):
+        """Test that names are chunked by 10 and duplicates are dropped"""
+        mock_post.side_effect = self._bulk
+        names = [f"Player{i}" for i in range(25)] + ["player0", "Missing1"]
+
+        client = HypixelClient(api_key="test_key")
+        result = client.get_uuids_by_names(names)
+
+        assert mock_post.call_count == 3
+        assert all(len(c.kwargs["json"]) <= 10 for c in mock_post.call_args_list)
+        assert result["Player3"] == "uuid-player3"
+        assert result["Missing1"] is None
+        assert "player0" not in result
+
+    @patch("requests.Session.post")
+    def test_uses_uuid_cache(self, mock_post):
+        """Test that cached and negative-cached names are not requested again"""
+        mock_post.side_effect = self._bulk
+
+        client = HypixelClient(api_key="test_key")
+        client.get_uuids_by_names(["Alice", "MissingBob"])
+        result = client.get_uuids_by_names(["alice", "MissingBob", "Carol"])
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs["json"] == ["Carol"]
+        assert result == {
+            "alice": "uuid-alice",
+            "MissingBob": None,
+            "Carol": "uuid-carol",
+        }
+        assert client.get_uuid_by_name("Carol") == "uuid-carol"
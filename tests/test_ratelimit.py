@@ -0,0 +1,125 @@
+"""
+Tests for the header-driven rate limiter
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.ratelimit import RateLimiter, retry_after
+from src.hypixelez.transport import TransportConfig
+from .mocks import *
+
+
+class TestRateLimiter:
+    """Test token bucket behaviour"""
+
+    def test_tokens_are_consumed(self):
+        limiter = RateLimiter(limit=3, window=60)
+        for _ in range(3):
+            limiter.acquire()
+        assert limiter.remaining == 0
+
+    @patch("time.sleep")
+    def test_waits_when_empty(self, mock_sleep):
+        limiter = RateLimiter(limit=1, window=60)
+        limiter.acquire()
+
+        # Simulate the window resetting while we sleep
+        def reset(delay):
+            limiter._reset_at = 0
+
+        mock_sleep.side_effect = reset
+        limiter.acquire()
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 60
+
+    def test_empty_bucket_without_window(self):
+        limiter = RateLimiter(limit=0, window=60)
+        assert 0 < limiter._reserve() <= 60
+
+    def test_update_from_headers(self):
+        limiter = RateLimiter(limit=300, window=300)
+        limiter.update(
+            {
+                "RateLimit-Limit": "120",
+                "RateLimit-Remaining": "7",
+                "RateLimit-Reset": "30",
+            }
+        )
+        assert limiter.limit == 120
+        assert limiter.remaining == 7
+
+    def test_update_keeps_lower_local_count(self):
+        limiter = RateLimiter(limit=10, window=300)
+        for _ in range(8):
+            limiter.acquire()
+        limiter.update({"RateLimit-Remaining": "5", "RateLimit-Reset": "100"})
+        assert limiter.remaining == 2
+
+    def test_update_ignores_missing_headers(self):
+        limiter = RateLimiter(limit=10, window=300)
+        limiter.update({})
+        limiter.update(Mock())
+        assert limiter.remaining == 10
+
+    def test_throttle(self):
+        limiter = RateLimiter(limit=10, window=300)
+        limiter.throttle(30)
+        assert limiter.remaining == 0
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(limit=2, window=60)
+        asyncio.run(limiter.acquire_async())
+        assert limiter.remaining == 1
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"Retry-After": "12"}, 12.0),
+            ({"RateLimit-Reset": "40"}, 40.0),
+            ({}, 5.0),
+        ],
+    )
+    def test_retry_after(self, headers, expected):
+        assert retry_after(headers) == expected
+
+
+class TestClientRateLimiting:
+    """Test that the client paces and retries Hypixel requests"""
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_retry_after_429(self, mock_session_get, mock_sleep):
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+        ok = Mock(status_code=200, headers={})
+        ok.content = json_body(MOCK_PROFILE_DATA)
+        mock_session_get.side_effect = [throttled, ok]
+
+        client = HypixelClient(
+            api_key="test_key", transport=TransportConfig(backoff_factor=0)
+        )
+        profile_data = client.fetch_profile_info(
+            "eca19e2e713d49a98582320229f696ed", "test_profile"
+        )
+
+        assert mock_session_get.call_count == 2
+        assert profile_data.get_collection("LOG") == 77760
+
+    @patch("requests.Session.get")
+    def test_shared_limiter_is_fed_by_headers(self, mock_session_get):
+        response = Mock(
+            status_code=200,
+            headers={"RateLimit-Remaining": "42", "RateLimit-Reset": "60"},
+        )
+        response.content = json_body(MOCK_PROFILES_RESPONSE)
+        mock_session_get.return_value = response
+
+        limiter = RateLimiter()
+        client = HypixelClient(api_key="test_key", rate_limiter=limiter)
+        client.get_profile_names_ids_by_id("test_uuid")
+
+        assert limiter.remaining == 42
@@ -0,0 +1,145 @@
+"""
+Tests for request coalescing
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.singleflight import AsyncSingleFlight, SingleFlight
+from .mocks import *
+
+
+def _run_concurrently(fn, count):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(lambda _: fn(), range(count)))
+
+
+class TestSingleFlight:
+    """Test thread-based deduplication"""
+
+    def test_concurrent_calls_share_result(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        flights = SingleFlight()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flights.do, "key", slow) for _ in range(4)]
+            started.wait(5)
+            # Give the followers a moment to join the in-flight call
+            threading.Event().wait(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["result"] * 4
+        assert len(calls) == 1
+
+    def test_error_is_shared_and_not_kept(self):
+        flights = SingleFlight()
+
+        with pytest.raises(ValueError):
+            flights.do("key", Mock(side_effect=ValueError))
+        assert flights.do("key", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    """Test coroutine-based deduplication"""
+
+    def test_concurrent_calls_share_result(self):
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            flights = AsyncSingleFlight()
+            return await asyncio.gather(*(flights.do("key", slow) for _ in range(5)))
+
+        assert asyncio.run(run()) == ["result"] * 5
+        assert len(calls) == 1
+
+    def test_error_is_shared(self):
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        async def run():
+            flights = AsyncSingleFlight()
+            return await asyncio.gather(
+                *(flights.do("key", fail) for _ in range(3)), return_exceptions=True
+            )
+
+        assert all(isinstance(r, ValueError) for r in asyncio.run(run()))
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            flights = AsyncSingleFlight()
+            leader = asyncio.ensure_future(flights.do("key", slow))
+            follower = asyncio.ensure_future(flights.do("key", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(run()) == "result"
+        assert len(calls) == 1
+
+
+class TestClientCoalescing:
+    """Test that identical concurrent client calls share one request"""
+
+    @staticmethod
+    def _slow(data):
+        def get(*args, **kwargs):
+            threading.Event().wait(0.1)
+            response = Mock(status_code=200, headers={})
+            response.content = json_body(data)
+            return response
+
+        return get
+
+    @patch("requests.Session.get")
+    def test_fetch_profile_info(self, mock_session_get):
+        mock_session_get.side_effect = self._slow(MOCK_PROFILE_DATA)
+        client = HypixelClient(api_key="test_key")
+
+        results = _run_concurrently(
+            lambda: client.fetch_profile_info(
+                "eca19e2e713d49a98582320229f696ed", "profile_id"
+            ),
+            4,
+        )
+
+        assert all(r.get_collection("LOG") == 77760 for r in results)
+        assert mock_session_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_get_uuid_by_name(self, mock_get):
+        mock_get.side_effect = self._slow(MOCK_UUID_RESPONSE)
+        client = HypixelClient(api_key="test_key")
+
+        results = _run_concurrently(lambda: client.get_uuid_by_name("Neono4ka"), 4)
+
+        assert results == ["eca19e2e713d49a98582320229f696ed"] * 4
+        assert mock_get.call_count == 1
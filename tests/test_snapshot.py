@@ -0,0 +1,60 @@
+"""
+Tests for compact profile snapshots
+"""
+
+import pickle
+
+import pytest
+
+from src.hypixelez.constants import SkillKey, SlayerKey
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.snapshot import METRICS, ProfileSnapshot
+from .mocks import *
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+
+
+class TestProfileSnapshot:
+    """Test that snapshots keep the profile's metrics"""
+
+    def setup_method(self):
+        self.profile = SkyblockProfileData(MOCK_PROFILE_DATA, UUID)
+        self.snapshot = ProfileSnapshot.from_profile(self.profile, fetched_at=100.0)
+
+    @pytest.mark.parametrize(
+        "getter,args",
+        [
+            ("get_collection", ("LOG",)),
+            ("get_skill_level", ("SKILL_CARPENTRY",)),
+            ("get_skill_current_level_xp", ("SKILL_CARPENTRY",)),
+            ("get_cata_level", ()),
+            ("get_cata_xp", ()),
+            ("get_cata_class_level", ("berserk",)),
+            ("get_cata_class_xp", ("berserk",)),
+            ("get_slayer_xp", ("zombie",)),
+            ("get_global_level", ()),
+            ("get_global_xp", ()),
+        ],
+    )
+    def test_matches_profile(self, getter, args):
+        assert getattr(self.snapshot, getter)(*args) == getattr(self.profile, getter)(
+            *args
+        )
+
+    def test_enum_keys_and_slayer_tiers(self):
+        assert self.snapshot.get_skill_level(SkillKey.SKILL_CARPENTRY) == 27
+        assert self.snapshot.get_slayer_stats(SlayerKey.ZOMBIE) == [15, 10, 8, 5, 0]
+        assert self.snapshot.get_collection("IRON") == 0
+
+    def test_is_compact(self):
+        assert not hasattr(self.snapshot, "__dict__")
+        assert len(self.snapshot.values) == len(METRICS)
+        assert self.snapshot.as_dict()["SKILL_MINING"] == 2000000
+
+    def test_round_trip(self):
+        copy = ProfileSnapshot(UUID, self.snapshot.values, fetched_at=100.0)
+
+        assert copy == self.snapshot
+        assert pickle.loads(pickle.dumps(self.snapshot)) == self.snapshot
+        with pytest.raises(ValueError):
+            ProfileSnapshot(UUID, [1, 2, 3])
@@ -0,0 +1,73 @@
+"""
+Tests for the binary snapshot store
+"""
+
+import pytest
+
+from src.hypixelez.hypixel_api import SkyblockProfileData
+from src.hypixelez.snapshot import METRICS, ProfileSnapshot
+from src.hypixelez.store import SnapshotReader, SnapshotStore
+from .mocks import *
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+OTHER = "0123456789abcdef0123456789abcdef"
+
+
+def _snapshot(uuid, fetched_at, log):
+    values = [log if metric == "LOG" else 0 for metric in METRICS]
+    return ProfileSnapshot(uuid, values, fetched_at)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "history.bin"
+    with SnapshotStore(path) as store:
+        store.append(SkyblockProfileData(MOCK_PROFILE_DATA, UUID, fetched_at=10.0))
+        store.extend([_snapshot(OTHER, 20.0, 5), _snapshot(UUID, 30.0, 80000)])
+    return path
+
+
+class TestSnapshotStore:
+    """Test writing and scanning snapshot records"""
+
+    def test_round_trip(self, path):
+        profile = SkyblockProfileData(MOCK_PROFILE_DATA, UUID, fetched_at=10.0)
+
+        with SnapshotReader(path) as reader:
+            assert len(reader) == 3
+            assert reader[0] == ProfileSnapshot.from_profile(profile)
+            assert reader[1].uuid == OTHER
+
+    def test_history_range(self, path):
+        with SnapshotReader(path) as reader:
+            history = reader.history(UUID)
+            assert [s.fetched_at for s in history] == [10.0, 30.0]
+            assert [s["LOG"] for s in reader.history(UUID, start=20.0)] == [80000]
+            assert reader.history(UUID, end=10.0) == []
+
+    def test_metric_scan(self, path):
+        with SnapshotReader(path) as reader:
+            assert list(reader.metric("LOG")) == [
+                (UUID, 10.0, 77760),
+                (OTHER, 20.0, 5),
+                (UUID, 30.0, 80000),
+            ]
+
+    def test_append_after_reopen_drops_partial_record(self, path):
+        with open(path, "ab") as file:
+            file.write(b"partial")
+
+        with SnapshotStore(path) as store:
+            store.append(_snapshot(OTHER, 40.0, 6))
+
+        with SnapshotReader(path) as reader:
+            assert [s["LOG"] for s in reader.history(OTHER)] == [5, 6]
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a store at all")
+
+        with pytest.raises(ValueError):
+            SnapshotStore(path)
+        with pytest.raises(ValueError):
+            SnapshotReader(path)
@@ -0,0 +1,93 @@
+"""
+Tests for member-scoped streaming profile parsing
+"""
+
+import copy
+import io
+import json
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from src.hypixelez import streaming
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.streaming import parse_member
+from .mocks import *
+
+UUID = "eca19e2e713d49a98582320229f696ed"
+
+
+def _coop_body():
+    data = copy.deepcopy(MOCK_PROFILE_DATA)
+    data["profile"]["members"]["other_member"] = {"collection": {"LOG": 1}}
+    return json.dumps(data).encode()
+
+
+def _streamed_response(body, status=200):
+    response = Mock(status_code=status, headers={})
+    response.raw = io.BytesIO(body)
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return response
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def backend(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(streaming, "ijson", None)
+    return request.param
+
+
+class TestParseMember:
+    """Test extraction of a single member"""
+
+    def test_only_requested_member(self, backend):
+        data = parse_member(io.BytesIO(_coop_body()), UUID)
+
+        members = data["profile"]["members"]
+        assert list(members) == [UUID]
+        assert members[UUID]["collection"]["LOG"] == 77760
+
+    def test_fields_filter(self, backend):
+        data = parse_member(_coop_body(), UUID, fields=["slayer"])
+
+        assert list(data["profile"]["members"][UUID]) == ["slayer"]
+
+    def test_missing_member(self, backend):
+        data = parse_member(io.BytesIO(_coop_body()), "unknown", fields=["slayer"])
+
+        assert data["profile"]["members"] == {}
+
+    def test_null_profile(self, backend):
+        data = parse_member(b'{"success": true, "profile": null}', UUID)
+
+        assert data["profile"]["members"] == {}
+
+
+class TestClientStreaming:
+    """Test streamed fetch_profile_info"""
+
+    @patch("requests.Session.get")
+    def test_fetch_profile_info_stream(self, mock_session_get):
+        mock_session_get.return_value = _streamed_response(_coop_body())
+        client = HypixelClient(api_key="test_key")
+
+        profile_data = client.fetch_profile_info(UUID, "profile_id", fields={"slayer"})
+
+        assert profile_data.get_slayer_level("zombie") == 7
+        assert profile_data.get_collection("LOG") == 0
+        _, kwargs = mock_session_get.call_args
+        assert kwargs["stream"] is True
+        mock_session_get.return_value.close.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_stream_http_error(self, mock_session_get):
+        mock_session_get.return_value = _streamed_response(b"", status=403)
+        client = HypixelClient(api_key="test_key")
+
+        with pytest.raises(requests.HTTPError):
+            client.fetch_profile_info(UUID, "profile_id", stream=True)
+        mock_session_get.return_value.close.assert_called_once()
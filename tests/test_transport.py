@@ -0,0 +1,178 @@
+"""
+Tests for the transport configuration, retries and circuit breaker
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from src.hypixelez.hypixel_api import HypixelClient
+from src.hypixelez.transport import CircuitBreaker, CircuitOpenError, TransportConfig
+from .mocks import *
+
+
+def _response(status, data=None):
+    response = Mock(status_code=status, headers={})
+    response.content = json_body(data)
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return response
+
+
+class TestTransportConfig:
+    """Test session building and backoff"""
+
+    def test_build_session(self):
+        config = TransportConfig(pool_maxsize=64, keep_alive=False)
+        session = config.build_session()
+
+        adapter = session.get_adapter("https://api.hypixel.net")
+        assert adapter._pool_maxsize == 64
+        assert session.headers["Connection"] == "close"
+
+    def test_backoff_is_bounded(self):
+        config = TransportConfig(backoff_factor=1, backoff_max=4, jitter=0.5)
+        assert 1 <= config.backoff(0) <= 1.5
+        assert 4 <= config.backoff(10) <= 6
+        assert config.backoff(0, minimum=20) == 20
+
+    def test_retryable_statuses(self):
+        config = TransportConfig()
+        assert config.is_retryable(503)
+        assert config.is_retryable(429)
+        assert not config.is_retryable(404)
+        assert not config.is_server_error(429)
+
+    def test_rejects_negative_retries(self):
+        with pytest.raises(ValueError, match="max_retries"):
+            TransportConfig(max_retries=-1)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state changes"""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        breaker.before_request("profile")
+        breaker.record_failure()
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("profile")
+
+    def test_trial_request_after_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        breaker.before_request("profile")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("profile")
+        breaker.record_success()
+        assert not breaker.is_open
+
+    def test_release_frees_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        breaker.before_request("profile")
+        breaker.release()
+        breaker.before_request("profile")
+        assert breaker.is_open
+
+
+class TestClientTransport:
+    """Test that the client applies the transport policy"""
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_retries_server_errors(self, mock_session_get, mock_sleep):
+        mock_session_get.side_effect = [
+            _response(503),
+            _response(502),
+            _response(200, MOCK_PROFILE_DATA),
+        ]
+
+        client = HypixelClient(api_key="test_key")
+        profile_data = client.fetch_profile_info(
+            "eca19e2e713d49a98582320229f696ed", "profile_id"
+        )
+
+        assert profile_data.get_collection("LOG") == 77760
+        assert mock_sleep.call_count == 2
+        _, kwargs = mock_session_get.call_args
+        assert kwargs["timeout"] == TransportConfig().timeout
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_retried_responses_are_closed(self, mock_session_get, mock_sleep):
+        responses = [_response(502), _response(503), _response(200, MOCK_PROFILE_DATA)]
+        mock_session_get.side_effect = responses
+
+        client = HypixelClient(api_key="test_key")
+        client.fetch_profile_info("eca19e2e713d49a98582320229f696ed", "profile_id")
+
+        assert [r.close.call_count for r in responses] == [1, 1, 0]
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_gives_up_after_max_retries(self, mock_session_get, mock_sleep):
+        mock_session_get.return_value = _response(500)
+
+        client = HypixelClient(
+            api_key="test_key", transport=TransportConfig(max_retries=2)
+        )
+        with pytest.raises(requests.HTTPError):
+            client.fetch_profile_info("test_uuid", "profile_id")
+
+        assert mock_session_get.call_count == 3
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_retries_connection_errors(self, mock_session_get, mock_sleep):
+        mock_session_get.side_effect = [
+            requests.ConnectionError("reset"),
+            _response(200, MOCK_UUID_RESPONSE),
+        ]
+
+        client = HypixelClient(api_key="test_key")
+
+        assert client.get_uuid_by_name("Neono4ka") == "eca19e2e713d49a98582320229f696ed"
+        assert mock_sleep.call_count == 1
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_circuit_breaker_fails_fast(self, mock_session_get, mock_sleep):
+        mock_session_get.side_effect = requests.ConnectionError("down")
+        transport = TransportConfig(max_retries=5, circuit_breaker_threshold=2)
+
+        client = HypixelClient(api_key="test_key", transport=transport)
+
+        assert client.get_uuid_by_name("Neono4ka") is None
+        assert mock_session_get.call_count == 2
+
+        # The open circuit rejects the next lookup without a request
+        assert client.get_uuid_by_name("Technoblade") is None
+        assert mock_session_get.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_failed_trial_does_not_jam_circuit(self, mock_session_get):
+        mock_session_get.side_effect = [
+            requests.ConnectionError("down"),
+            requests.exceptions.ChunkedEncodingError("truncated"),
+            _response(200, MOCK_PROFILE_DATA),
+        ]
+        transport = TransportConfig(
+            max_retries=0, circuit_breaker_threshold=1, circuit_breaker_timeout=0
+        )
+        client = HypixelClient(api_key="test_key", transport=transport)
+        uuid = "eca19e2e713d49a98582320229f696ed"
+
+        with pytest.raises(requests.ConnectionError):
+            client.fetch_profile_info(uuid, "profile_id")
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.fetch_profile_info(uuid, "profile_id")
+
+        # The failed trial reopened the circuit; the next trial closes it
+        profile_data = client.fetch_profile_info(uuid, "profile_id")
+        assert profile_data.get_collection("LOG") == 77760